@@ -1,27 +1,362 @@
-"""Tiny resolver benchmark for local development."""
+"""Offline resolver benchmark that replays a recorded registry corpus.
+
+Every request is answered from ``benchmark_corpus.json`` through an
+``httpx.MockTransport`` with a fixed simulated latency, so runs are repeatable
+and never touch the network. Each ecosystem is measured with a cold and a warm
+response cache, sequentially and through ``resolve_many`` at several worker
+counts. Results can be saved as a baseline and later runs compared against it.
+"""
 
 from __future__ import annotations
 
+import argparse
+import json
+import sys
+import tempfile
+import threading
 import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import httpx
 
 from purl2repo import Resolver
+from purl2repo.http.client import HttpClient
+from purl2repo.models import ResolutionResult
+
+CORPUS_PATH = Path(__file__).with_name("benchmark_corpus.json")
+BASELINE_PATH = Path(__file__).with_name("benchmark_baseline.json")
+ENGINE_HTTP_CLIENT = "purl2repo.resolution.engine.HttpClient"
+ECOSYSTEMS = ("pypi", "npm", "maven", "golang", "nuget", "cargo")
+CACHE_STATES = ("cold", "warm")
+DEFAULT_WORKERS = (1, 4, 16)
+DEFAULT_ROUNDS = 20
+DEFAULT_TOLERANCE = 0.5
+LATENCY_SLACK_MS = 1.0
+
+
+@dataclass(frozen=True)
+class Scenario:
+    ecosystem: str
+    cache: str
+    workers: int
+
+    @property
+    def name(self) -> str:
+        mode = "sequential" if self.workers == 1 else f"workers-{self.workers}"
+        return f"{self.ecosystem}/{self.cache}/{mode}"
+
+
+@dataclass(frozen=True)
+class ScenarioReport:
+    purls: int
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    peak_rss_kib: int | None
+    requests: int
+    unmatched: int
+
+
+class ReplayTransport:
+    """Serve recorded responses; anything not in the corpus is a counted 404."""
+
+    def __init__(self, responses: dict[str, dict[str, Any]], latency_seconds: float) -> None:
+        self._responses = {key: _encode_entry(entry) for key, entry in responses.items()}
+        self._latency_seconds = latency_seconds
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.unmatched: set[str] = set()
+        self.transport = httpx.MockTransport(self._handle)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        key = f"{request.method} {request.url}"
+        with self._lock:
+            self.requests += 1
+        if self._latency_seconds:
+            time.sleep(self._latency_seconds)
+        entry = self._responses.get(key)
+        if entry is None:
+            with self._lock:
+                self.unmatched.add(key)
+            return httpx.Response(404)
+        status, headers, content = entry
+        return httpx.Response(status, headers=headers, content=content)
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Pass requests to a live transport and keep what came back."""
+
+    def __init__(self, inner: httpx.BaseTransport) -> None:
+        self._inner = inner
+        self._lock = threading.Lock()
+        self.responses: dict[str, dict[str, Any]] = {}
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._inner.handle_request(request)
+        response.read()
+        entry: dict[str, Any] = {"status": response.status_code}
+        if "location" in response.headers:
+            entry["headers"] = {"location": response.headers["location"]}
+        if request.method == "GET" and response.content:
+            if "json" in response.headers.get("content-type", ""):
+                entry["json"] = response.json()
+            else:
+                entry["text"] = response.text
+        with self._lock:
+            self.responses[f"{request.method} {request.url}"] = entry
+        return response
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+def main() -> int:
+    args = _parse_args()
+    corpus = json.loads(args.corpus.read_text(encoding="utf-8"))
+    if args.record:
+        record_corpus(args.corpus, corpus["purls"], timeout=args.timeout)
+        return 0
+
+    scenarios = [
+        Scenario(ecosystem, cache, workers)
+        for ecosystem in args.ecosystem or ECOSYSTEMS
+        for cache in CACHE_STATES
+        for workers in args.workers
+    ]
+    settings = {
+        "latency_ms": args.latency_ms,
+        "rounds": args.rounds,
+        "cache_backend": args.cache_backend,
+    }
+    reports: dict[str, ScenarioReport] = {}
+    missing: set[str] = set()
+    for scenario in scenarios:
+        reports[scenario.name] = run_scenario(
+            scenario,
+            corpus,
+            latency_seconds=args.latency_ms / 1000,
+            rounds=args.rounds,
+            cache_backend=args.cache_backend,
+            missing=missing,
+        )
+        if not args.json:
+            _print_row(scenario.name, reports[scenario.name])
+    for key in sorted(missing):
+        print(f"warning: no recorded response for {key}", file=sys.stderr)
+
+    payload = {"settings": settings, "scenarios": {k: asdict(v) for k, v in reports.items()}}
+    if args.json:
+        print(json.dumps(payload, indent=2))
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(payload, baseline, tolerance=args.tolerance)
+        for line in regressions:
+            print(line, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+def run_scenario(
+    scenario: Scenario,
+    corpus: dict[str, Any],
+    *,
+    latency_seconds: float,
+    rounds: int,
+    cache_backend: str,
+    missing: set[str],
+) -> ScenarioReport:
+    """Time ``rounds`` passes over the ecosystem's PURLs, each with a fresh resolver."""
+
+    purls: list[str] = corpus["purls"][scenario.ecosystem]
+    max_workers = None if scenario.workers == 1 else scenario.workers
+    latencies: list[float] = []
+    elapsed = 0.0
+    requests = 0
+    unmatched = 0
+    for _ in range(rounds):
+        replay = ReplayTransport(corpus["responses"], latency_seconds)
+        with _replayed(replay), _cache_dir(cache_backend) as cache_dir:
+            # Replayed responses are not subject to registry quotas.
+            options: dict[str, Any] = {"cache_dir": cache_dir, "rate_limiting": False}
+            if cache_dir is not None:
+                options["cache_backend"] = cache_backend
+            if scenario.cache == "warm" and cache_dir is not None:
+                with Resolver(**options) as primer:
+                    list(primer.resolve_many(purls))
+            with Resolver(**options) as resolver:
+                if scenario.cache == "warm" and cache_dir is None:
+                    list(resolver.resolve_many(purls))
+                replay.requests = 0
+                engine = resolver._engine
+                with mock.patch.object(engine, "resolve", _timed(engine.resolve, latencies)):
+                    started = time.perf_counter()
+                    list(resolver.resolve_many(purls, max_workers=max_workers))
+                    elapsed += time.perf_counter() - started
+        requests += replay.requests
+        unmatched = max(unmatched, len(replay.unmatched))
+        missing |= replay.unmatched
+
+    return ScenarioReport(
+        purls=len(purls),
+        throughput=round(len(purls) * rounds / elapsed, 2) if elapsed else 0.0,
+        p50_ms=_percentile(latencies, 50),
+        p95_ms=_percentile(latencies, 95),
+        p99_ms=_percentile(latencies, 99),
+        peak_rss_kib=_peak_rss_kib(),
+        requests=requests // rounds,
+        unmatched=unmatched,
+    )
+
+
+def compare_to_baseline(
+    current: dict[str, Any], baseline: dict[str, Any], *, tolerance: float
+) -> list[str]:
+    """Return one message per scenario that is slower than the baseline allows.
+
+    Throughput and median latency are compared; tail percentiles are reported but
+    too noisy at these sample sizes to gate on.
+    """
+
+    regressions: list[str] = []
+    if current["settings"] != baseline.get("settings"):
+        regressions.append(
+            f"Settings differ from baseline: {current['settings']} != {baseline.get('settings')}"
+        )
+        return regressions
+    for name, report in current["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            continue
+        if report["throughput"] < previous["throughput"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {report['throughput']}/s "
+                f"below baseline {previous['throughput']}/s"
+            )
+        allowed_ms = previous["p50_ms"] * (1 + tolerance) + LATENCY_SLACK_MS
+        if report["p50_ms"] > allowed_ms:
+            regressions.append(
+                f"{name}: p50 {report['p50_ms']}ms above baseline {previous['p50_ms']}ms"
+            )
+    return regressions
+
+
+def record_corpus(path: Path, purls: dict[str, list[str]], *, timeout: float) -> None:
+    """Resolve every corpus PURL against live services and rewrite the corpus."""
+
+    recorder = RecordingTransport(httpx.HTTPTransport())
+    client = partial(HttpClient, transport=recorder)
+    with mock.patch(ENGINE_HTTP_CLIENT, client), Resolver(timeout=timeout) as resolver:
+        for ecosystem_purls in purls.values():
+            list(resolver.resolve_many(ecosystem_purls, max_workers=4))
+    path.write_text(_dump_corpus(purls, recorder.responses), encoding="utf-8")
+    print(f"Recorded {len(recorder.responses)} responses to {path}")
+
+
+@contextmanager
+def _replayed(replay: ReplayTransport) -> Iterator[None]:
+    with mock.patch(ENGINE_HTTP_CLIENT, partial(HttpClient, transport=replay.transport)):
+        yield
+
+
+@contextmanager
+def _cache_dir(cache_backend: str) -> Iterator[str | None]:
+    if cache_backend == "memory":
+        yield None
+        return
+    with tempfile.TemporaryDirectory(prefix="purl2repo-bench-") as directory:
+        yield directory
+
+
+def _timed(
+    resolve: Callable[..., ResolutionResult], latencies: list[float]
+) -> Callable[..., ResolutionResult]:
+    def wrapper(*args: Any, **kwargs: Any) -> ResolutionResult:
+        started = time.perf_counter()
+        try:
+            return resolve(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    return wrapper
+
+
+def _percentile(samples: list[float], percent: int) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, -(-percent * len(ordered) // 100) - 1)
+    return round(ordered[rank] * 1000, 3)
+
+
+def _peak_rss_kib() -> int | None:
+    """Process-wide high-water mark; it only grows across scenarios in one run."""
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _encode_entry(entry: dict[str, Any]) -> tuple[int, dict[str, str], bytes]:
+    headers = dict(entry.get("headers", {}))
+    if "json" in entry:
+        headers["content-type"] = "application/json"
+        return entry["status"], headers, json.dumps(entry["json"]).encode("utf-8")
+    headers.setdefault("content-type", "text/html; charset=utf-8")
+    return entry["status"], headers, str(entry.get("text", "")).encode("utf-8")
+
+
+def _dump_corpus(purls: dict[str, list[str]], responses: dict[str, dict[str, Any]]) -> str:
+    lines = [f"{json.dumps(key)}: {json.dumps(responses[key])}" for key in sorted(responses)]
+    return (
+        '{\n"purls": '
+        + json.dumps(purls, indent=1)
+        + ',\n"responses": {\n'
+        + ",\n".join(lines)
+        + "\n}\n}\n"
+    )
+
 
-PURLS = [
-    "pkg:pypi/requests@2.31.0",
-    "pkg:npm/react@18.2.0",
-    "pkg:cargo/rand@0.8.5",
-]
+def _print_row(name: str, report: ScenarioReport) -> None:
+    rss = f"{report.peak_rss_kib / 1024:.1f}MiB" if report.peak_rss_kib is not None else "n/a"
+    print(
+        f"{name:<28} {report.throughput:>9.1f}/s  p50 {report.p50_ms:>8.2f}ms  "
+        f"p95 {report.p95_ms:>8.2f}ms  p99 {report.p99_ms:>8.2f}ms  "
+        f"rss {rss:>9}  requests {report.requests}"
+    )
 
 
-def main() -> None:
-    started = time.perf_counter()
-    with Resolver() as resolver:
-        results = list(resolver.resolve_many(PURLS))
-    elapsed = time.perf_counter() - started
-    for result in results:
-        print(f"{result.purl.raw}: {result.repository_url} ({result.confidence})")
-    print(f"Resolved {len(results)} PURLs in {elapsed:.2f}s")
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=CORPUS_PATH)
+    parser.add_argument("--ecosystem", action="append", choices=ECOSYSTEMS)
+    parser.add_argument("--workers", type=int, nargs="+", default=list(DEFAULT_WORKERS))
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--cache-backend", choices=("memory", "json", "sqlite"), default="memory")
+    parser.add_argument("--baseline", type=Path, help="Compare against this baseline JSON.")
+    parser.add_argument("--save-baseline", type=Path, help="Write this run as a baseline.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON.")
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Re-record the corpus responses from live services instead of benchmarking.",
+    )
+    parser.add_argument("--timeout", type=float, default=10.0)
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
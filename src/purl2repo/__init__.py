@@ -1,7 +1,11 @@
 """Resolve Package URLs to source repositories and release links."""
 
-from .api import Resolver, parse_purl, resolve, resolve_release, resolve_repository
+from .api import AsyncResolver, Resolver, parse_purl, resolve, resolve_release, resolve_repository
+from .http.ratelimit import HostLimit
+from .http.retry import RetryPolicy
+from .http.ttl import TtlRule
 from .models import (
+    CacheStats,
     ParsedPurl,
     ReleaseLink,
     RepositoryCandidate,
@@ -13,6 +17,9 @@ from .models import (
 from .version import __version__
 
 __all__ = [
+    "AsyncResolver",
+    "CacheStats",
+    "HostLimit",
     "ParsedPurl",
     "ReleaseLink",
     "RepositoryCandidate",
@@ -20,7 +27,9 @@ __all__ = [
     "ResolutionResult",
     "Resolver",
     "ResolverSettings",
+    "RetryPolicy",
     "ScrapedCandidate",
+    "TtlRule",
     "__version__",
     "parse_purl",
     "resolve",
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import Literal, overload
 
-from purl2repo.models import ParsedPurl, ResolutionResult, ResolverSettings
+from purl2repo.ecosystems.go_imports import RepoRule
+from purl2repo.http.ratelimit import HostLimit
+from purl2repo.http.retry import RetryPolicy
+from purl2repo.http.ttl import TtlRule
+from purl2repo.models import CacheStats, ParsedPurl, ResolutionResult, ResolverSettings
 from purl2repo.purl.parse import parse_purl as _parse_purl
+from purl2repo.resolution.async_engine import AsyncResolutionEngine
 from purl2repo.resolution.engine import ResolutionEngine
 
 
@@ -48,6 +54,30 @@ def _resolver_from_kwargs(kwargs: dict[str, object]) -> Resolver:
         "use_deps_dev_fallback",
         "use_scraper_fallback",
         "user_agent",
+        "max_connections",
+        "max_keepalive_connections",
+        "cache_backend",
+        "cache_max_bytes",
+        "cache_max_age_seconds",
+        "memory_cache_max_entries",
+        "memory_cache_max_bytes",
+        "cache_distilled_metadata",
+        "result_cache_ttl_seconds",
+        "validation_concurrency",
+        "validation_short_circuit",
+        "release_probe_concurrency",
+        "negative_cache_ttl_seconds",
+        "retry_policy",
+        "retry_budget",
+        "rate_limiting",
+        "host_limits",
+        "stale_while_revalidate_seconds",
+        "stale_if_error_seconds",
+        "ttl_rules",
+        "stream_json",
+        "go_import_timeout_seconds",
+        "go_proxy_roots",
+        "go_import_rules",
     }
     unknown = set(kwargs) - allowed
     if unknown:
@@ -64,6 +94,30 @@ def _resolver_from_kwargs(kwargs: dict[str, object]) -> Resolver:
     use_deps_dev_fallback = kwargs.get("use_deps_dev_fallback", True)
     use_scraper_fallback = kwargs.get("use_scraper_fallback", True)
     user_agent = kwargs.get("user_agent", "purl2repo/2.x")
+    max_connections = kwargs.get("max_connections", 100)
+    max_keepalive_connections = kwargs.get("max_keepalive_connections", 20)
+    cache_backend = kwargs.get("cache_backend", "json")
+    cache_max_bytes = kwargs.get("cache_max_bytes")
+    cache_max_age_seconds = kwargs.get("cache_max_age_seconds")
+    memory_cache_max_entries = kwargs.get("memory_cache_max_entries")
+    memory_cache_max_bytes = kwargs.get("memory_cache_max_bytes")
+    cache_distilled_metadata = kwargs.get("cache_distilled_metadata", False)
+    result_cache_ttl_seconds = kwargs.get("result_cache_ttl_seconds")
+    validation_concurrency = kwargs.get("validation_concurrency", 1)
+    validation_short_circuit = kwargs.get("validation_short_circuit", False)
+    release_probe_concurrency = kwargs.get("release_probe_concurrency", 1)
+    negative_cache_ttl_seconds = kwargs.get("negative_cache_ttl_seconds")
+    retry_policy = kwargs.get("retry_policy")
+    retry_budget = kwargs.get("retry_budget")
+    rate_limiting = kwargs.get("rate_limiting", False)
+    host_limits = kwargs.get("host_limits")
+    stale_while_revalidate_seconds = kwargs.get("stale_while_revalidate_seconds")
+    stale_if_error_seconds = kwargs.get("stale_if_error_seconds")
+    ttl_rules = kwargs.get("ttl_rules")
+    stream_json = kwargs.get("stream_json", False)
+    go_import_timeout_seconds = kwargs.get("go_import_timeout_seconds", 2.0)
+    go_proxy_roots = kwargs.get("go_proxy_roots")
+    go_import_rules = kwargs.get("go_import_rules")
 
     if not isinstance(timeout, int | float):
         raise TypeError("timeout must be a number")
@@ -85,6 +139,71 @@ def _resolver_from_kwargs(kwargs: dict[str, object]) -> Resolver:
         raise TypeError("use_scraper_fallback must be a bool")
     if not isinstance(user_agent, str):
         raise TypeError("user_agent must be a string")
+    if not isinstance(max_connections, int):
+        raise TypeError("max_connections must be an int")
+    if not isinstance(max_keepalive_connections, int):
+        raise TypeError("max_keepalive_connections must be an int")
+    if not isinstance(cache_backend, str):
+        raise TypeError("cache_backend must be a string")
+    if cache_max_bytes is not None and not isinstance(cache_max_bytes, int):
+        raise TypeError("cache_max_bytes must be an int or None")
+    if cache_max_age_seconds is not None and not isinstance(cache_max_age_seconds, int):
+        raise TypeError("cache_max_age_seconds must be an int or None")
+    if memory_cache_max_entries is not None and not isinstance(memory_cache_max_entries, int):
+        raise TypeError("memory_cache_max_entries must be an int or None")
+    if memory_cache_max_bytes is not None and not isinstance(memory_cache_max_bytes, int):
+        raise TypeError("memory_cache_max_bytes must be an int or None")
+    if not isinstance(cache_distilled_metadata, bool):
+        raise TypeError("cache_distilled_metadata must be a bool")
+    if result_cache_ttl_seconds is not None and not isinstance(result_cache_ttl_seconds, int):
+        raise TypeError("result_cache_ttl_seconds must be an int or None")
+    if not isinstance(validation_concurrency, int):
+        raise TypeError("validation_concurrency must be an int")
+    if not isinstance(validation_short_circuit, bool):
+        raise TypeError("validation_short_circuit must be a bool")
+    if not isinstance(release_probe_concurrency, int):
+        raise TypeError("release_probe_concurrency must be an int")
+    if negative_cache_ttl_seconds is not None and not isinstance(negative_cache_ttl_seconds, int):
+        raise TypeError("negative_cache_ttl_seconds must be an int or None")
+    if retry_policy is not None and not isinstance(retry_policy, RetryPolicy):
+        raise TypeError("retry_policy must be a RetryPolicy or None")
+    if retry_budget is not None and not isinstance(retry_budget, int):
+        raise TypeError("retry_budget must be an int or None")
+    if not isinstance(rate_limiting, bool):
+        raise TypeError("rate_limiting must be a bool")
+    if host_limits is not None and not (
+        isinstance(host_limits, dict)
+        and all(isinstance(limit, HostLimit) for limit in host_limits.values())
+    ):
+        raise TypeError("host_limits must be a dict of HostLimit or None")
+    if stale_while_revalidate_seconds is not None and not isinstance(
+        stale_while_revalidate_seconds, int
+    ):
+        raise TypeError("stale_while_revalidate_seconds must be an int or None")
+    if stale_if_error_seconds is not None and not isinstance(stale_if_error_seconds, int):
+        raise TypeError("stale_if_error_seconds must be an int or None")
+    if ttl_rules is not None and not (
+        isinstance(ttl_rules, tuple) and all(isinstance(rule, TtlRule) for rule in ttl_rules)
+    ):
+        raise TypeError("ttl_rules must be a tuple of TtlRule or None")
+    if not isinstance(stream_json, bool):
+        raise TypeError("stream_json must be a bool")
+    if go_import_timeout_seconds is not None and not isinstance(
+        go_import_timeout_seconds, int | float
+    ):
+        raise TypeError("go_import_timeout_seconds must be a number or None")
+    if go_proxy_roots is not None and not (
+        isinstance(go_proxy_roots, tuple) and all(isinstance(root, str) for root in go_proxy_roots)
+    ):
+        raise TypeError("go_proxy_roots must be a tuple of paths or file:// URLs, or None")
+    if go_import_rules is not None and not (
+        isinstance(go_import_rules, dict)
+        and all(
+            isinstance(prefix, str) and (isinstance(rule, str) or callable(rule))
+            for prefix, rule in go_import_rules.items()
+        )
+    ):
+        raise TypeError("go_import_rules must be a dict of prefix to URL template or callable")
 
     return Resolver(
         timeout=float(timeout),
@@ -97,6 +216,30 @@ def _resolver_from_kwargs(kwargs: dict[str, object]) -> Resolver:
         use_deps_dev_fallback=use_deps_dev_fallback,
         use_scraper_fallback=use_scraper_fallback,
         user_agent=user_agent,
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        cache_backend=cache_backend,
+        cache_max_bytes=cache_max_bytes,
+        cache_max_age_seconds=cache_max_age_seconds,
+        memory_cache_max_entries=memory_cache_max_entries,
+        memory_cache_max_bytes=memory_cache_max_bytes,
+        cache_distilled_metadata=cache_distilled_metadata,
+        result_cache_ttl_seconds=result_cache_ttl_seconds,
+        validation_concurrency=validation_concurrency,
+        validation_short_circuit=validation_short_circuit,
+        release_probe_concurrency=release_probe_concurrency,
+        negative_cache_ttl_seconds=negative_cache_ttl_seconds,
+        retry_policy=retry_policy,
+        retry_budget=retry_budget,
+        rate_limiting=rate_limiting,
+        host_limits=host_limits,
+        stale_while_revalidate_seconds=stale_while_revalidate_seconds,
+        stale_if_error_seconds=stale_if_error_seconds,
+        ttl_rules=ttl_rules,
+        stream_json=stream_json,
+        go_import_timeout_seconds=go_import_timeout_seconds,
+        go_proxy_roots=go_proxy_roots,
+        go_import_rules=go_import_rules,
     )
 
 
@@ -115,6 +258,30 @@ class Resolver:
         use_deps_dev_fallback: bool = True,
         use_scraper_fallback: bool = True,
         user_agent: str = "purl2repo/2.x",
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        cache_backend: str = "json",
+        cache_max_bytes: int | None = None,
+        cache_max_age_seconds: int | None = None,
+        memory_cache_max_entries: int | None = None,
+        memory_cache_max_bytes: int | None = None,
+        cache_distilled_metadata: bool = False,
+        result_cache_ttl_seconds: int | None = None,
+        validation_concurrency: int = 1,
+        validation_short_circuit: bool = False,
+        release_probe_concurrency: int = 1,
+        negative_cache_ttl_seconds: int | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: int | None = None,
+        rate_limiting: bool = False,
+        host_limits: dict[str, HostLimit] | None = None,
+        stale_while_revalidate_seconds: int | None = None,
+        stale_if_error_seconds: int | None = None,
+        ttl_rules: tuple[TtlRule, ...] | None = None,
+        stream_json: bool = False,
+        go_import_timeout_seconds: float | None = 2.0,
+        go_proxy_roots: tuple[str, ...] | None = None,
+        go_import_rules: dict[str, str | RepoRule] | None = None,
     ) -> None:
         self.settings = ResolverSettings(
             timeout=timeout,
@@ -127,6 +294,30 @@ class Resolver:
             use_deps_dev_fallback=use_deps_dev_fallback,
             use_scraper_fallback=use_scraper_fallback,
             user_agent=user_agent,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            cache_backend=cache_backend,
+            cache_max_bytes=cache_max_bytes,
+            cache_max_age_seconds=cache_max_age_seconds,
+            memory_cache_max_entries=memory_cache_max_entries,
+            memory_cache_max_bytes=memory_cache_max_bytes,
+            cache_distilled_metadata=cache_distilled_metadata,
+            result_cache_ttl_seconds=result_cache_ttl_seconds,
+            validation_concurrency=validation_concurrency,
+            validation_short_circuit=validation_short_circuit,
+            release_probe_concurrency=release_probe_concurrency,
+            negative_cache_ttl_seconds=negative_cache_ttl_seconds,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            rate_limiting=rate_limiting,
+            host_limits=host_limits,
+            stale_while_revalidate_seconds=stale_while_revalidate_seconds,
+            stale_if_error_seconds=stale_if_error_seconds,
+            ttl_rules=ttl_rules,
+            stream_json=stream_json,
+            go_import_timeout_seconds=go_import_timeout_seconds,
+            go_proxy_roots=go_proxy_roots,
+            go_import_rules=go_import_rules,
         )
         self._engine = ResolutionEngine(self.settings)
 
@@ -139,6 +330,9 @@ class Resolver:
     def close(self) -> None:
         self._engine.close()
 
+    def cache_stats(self) -> CacheStats | None:
+        return self._engine.cache.stats() if self._engine.cache else None
+
     def parse_purl(self, purl: str) -> ParsedPurl:
         return self._engine.parse(purl)
 
@@ -151,10 +345,189 @@ class Resolver:
     def resolve_release(self, purl: str) -> ResolutionResult:
         return self._engine.resolve_release(purl)
 
+    @overload
+    def resolve_many(
+        self,
+        iterable_of_purls: Iterable[str],
+        *,
+        max_workers: int | None = None,
+        ordered: Literal[True] = True,
+    ) -> Iterator[ResolutionResult]: ...
+
+    @overload
+    def resolve_many(
+        self,
+        iterable_of_purls: Iterable[str],
+        *,
+        max_workers: int | None = None,
+        ordered: Literal[False],
+    ) -> Iterator[tuple[int, ResolutionResult]]: ...
+
+    @overload
+    def resolve_many(
+        self,
+        iterable_of_purls: Iterable[str],
+        *,
+        max_workers: int | None = None,
+        ordered: bool,
+    ) -> Iterator[ResolutionResult | tuple[int, ResolutionResult]]: ...
+
     def resolve_many(
         self,
         iterable_of_purls: Iterable[str],
         *,
         max_workers: int | None = None,
-    ) -> Iterator[ResolutionResult]:
-        return self._engine.resolve_many(iterable_of_purls, max_workers=max_workers)
+        ordered: bool = True,
+    ) -> Iterator[ResolutionResult | tuple[int, ResolutionResult]]:
+        """Resolve PURLs with at most ``max_workers`` running at once.
+
+        Results follow input order; with ``ordered=False`` they are yielded as
+        ``(input_index, result)`` pairs in completion order.
+        """
+
+        return self._engine.resolve_many(
+            iterable_of_purls, max_workers=max_workers, ordered=ordered
+        )
+
+
+class AsyncResolver:
+    """asyncio counterpart of :class:`Resolver` for event-loop based services."""
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        use_cache: bool = True,
+        cache_dir: str | None = None,
+        strict: bool = False,
+        no_network: bool = False,
+        verify_release_links: bool = False,
+        validate_repositories: bool = True,
+        use_deps_dev_fallback: bool = True,
+        use_scraper_fallback: bool = True,
+        user_agent: str = "purl2repo/2.x",
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        cache_backend: str = "json",
+        cache_max_bytes: int | None = None,
+        cache_max_age_seconds: int | None = None,
+        memory_cache_max_entries: int | None = None,
+        memory_cache_max_bytes: int | None = None,
+        cache_distilled_metadata: bool = False,
+        result_cache_ttl_seconds: int | None = None,
+        validation_concurrency: int = 1,
+        validation_short_circuit: bool = False,
+        release_probe_concurrency: int = 1,
+        negative_cache_ttl_seconds: int | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: int | None = None,
+        rate_limiting: bool = False,
+        host_limits: dict[str, HostLimit] | None = None,
+        stale_while_revalidate_seconds: int | None = None,
+        stale_if_error_seconds: int | None = None,
+        ttl_rules: tuple[TtlRule, ...] | None = None,
+        stream_json: bool = False,
+        go_import_timeout_seconds: float | None = 2.0,
+        go_proxy_roots: tuple[str, ...] | None = None,
+        go_import_rules: dict[str, str | RepoRule] | None = None,
+    ) -> None:
+        self.settings = ResolverSettings(
+            timeout=timeout,
+            use_cache=use_cache,
+            cache_dir=cache_dir,
+            strict=strict,
+            no_network=no_network,
+            verify_release_links=verify_release_links,
+            validate_repositories=validate_repositories,
+            use_deps_dev_fallback=use_deps_dev_fallback,
+            use_scraper_fallback=use_scraper_fallback,
+            user_agent=user_agent,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            cache_backend=cache_backend,
+            cache_max_bytes=cache_max_bytes,
+            cache_max_age_seconds=cache_max_age_seconds,
+            memory_cache_max_entries=memory_cache_max_entries,
+            memory_cache_max_bytes=memory_cache_max_bytes,
+            cache_distilled_metadata=cache_distilled_metadata,
+            result_cache_ttl_seconds=result_cache_ttl_seconds,
+            validation_concurrency=validation_concurrency,
+            validation_short_circuit=validation_short_circuit,
+            release_probe_concurrency=release_probe_concurrency,
+            negative_cache_ttl_seconds=negative_cache_ttl_seconds,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            rate_limiting=rate_limiting,
+            host_limits=host_limits,
+            stale_while_revalidate_seconds=stale_while_revalidate_seconds,
+            stale_if_error_seconds=stale_if_error_seconds,
+            ttl_rules=ttl_rules,
+            stream_json=stream_json,
+            go_import_timeout_seconds=go_import_timeout_seconds,
+            go_proxy_roots=go_proxy_roots,
+            go_import_rules=go_import_rules,
+        )
+        self._engine = AsyncResolutionEngine(self.settings)
+
+    async def __aenter__(self) -> AsyncResolver:
+        return self
+
+    async def __aexit__(self, exc_type: object, exc: object, traceback: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._engine.aclose()
+
+    def cache_stats(self) -> CacheStats | None:
+        return self._engine.cache.stats() if self._engine.cache else None
+
+    def parse_purl(self, purl: str) -> ParsedPurl:
+        return self._engine.parse(purl)
+
+    async def resolve(self, purl: str) -> ResolutionResult:
+        return await self._engine.resolve(purl)
+
+    async def resolve_repository(self, purl: str) -> ResolutionResult:
+        return await self._engine.resolve_repository(purl)
+
+    async def resolve_release(self, purl: str) -> ResolutionResult:
+        return await self._engine.resolve_release(purl)
+
+    @overload
+    def resolve_many(
+        self,
+        iterable_of_purls: Iterable[str] | AsyncIterable[str],
+        *,
+        max_concurrency: int | None = None,
+        ordered: Literal[True] = True,
+    ) -> AsyncIterator[ResolutionResult]: ...
+
+    @overload
+    def resolve_many(
+        self,
+        iterable_of_purls: Iterable[str] | AsyncIterable[str],
+        *,
+        max_concurrency: int | None = None,
+        ordered: Literal[False],
+    ) -> AsyncIterator[tuple[int, ResolutionResult]]: ...
+
+    @overload
+    def resolve_many(
+        self,
+        iterable_of_purls: Iterable[str] | AsyncIterable[str],
+        *,
+        max_concurrency: int | None = None,
+        ordered: bool,
+    ) -> AsyncIterator[ResolutionResult | tuple[int, ResolutionResult]]: ...
+
+    def resolve_many(
+        self,
+        iterable_of_purls: Iterable[str] | AsyncIterable[str],
+        *,
+        max_concurrency: int | None = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[ResolutionResult | tuple[int, ResolutionResult]]:
+        """Async counterpart of :meth:`Resolver.resolve_many`."""
+
+        return self._engine.resolve_many(
+            iterable_of_purls, max_concurrency=max_concurrency, ordered=ordered
+        )
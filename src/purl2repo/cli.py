@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import json
 import logging
+from collections import deque
+from collections.abc import Iterable, Iterator
 from typing import Annotated, Any
 
 import typer
@@ -18,6 +20,7 @@ from purl2repo.errors import (
     UnsupportedEcosystemError,
 )
 from purl2repo.models import ResolutionResult, ResolverSettings
+from purl2repo.resolution.cache import CACHE_BACKENDS
 from purl2repo.resolution.engine import ECOSYSTEMS, HOSTS, SUPPORTED_PURL_TYPES
 from purl2repo.version import __version__
 
@@ -35,6 +38,10 @@ CacheDirOption = Annotated[
     str | None,
     typer.Option("--cache-dir", help="Optional disk cache directory."),
 ]
+CacheBackendOption = Annotated[
+    str,
+    typer.Option("--cache-backend", help="Disk cache backend: json or sqlite."),
+]
 VerboseOption = Annotated[bool, typer.Option("--verbose", help="Enable debug logging.")]
 TraceOption = Annotated[bool, typer.Option("--trace", help="Include candidate scoring details.")]
 NoNetworkOption = Annotated[
@@ -55,6 +62,21 @@ ValidateRepositoriesOption = Annotated[
         help="Check candidate repository URLs before selecting them.",
     ),
 ]
+BatchInputArgument = Annotated[
+    typer.FileText,
+    typer.Argument(help="File with one PURL per line; '-' reads standard input."),
+]
+MaxWorkersOption = Annotated[
+    int,
+    typer.Option("--max-workers", min=1, help="Number of PURLs resolved concurrently."),
+]
+OrderedOption = Annotated[
+    bool,
+    typer.Option(
+        "--ordered/--unordered",
+        help="Emit results in input order instead of as they complete.",
+    ),
+]
 DepsDevFallbackOption = Annotated[
     bool,
     typer.Option(
@@ -75,6 +97,7 @@ def _settings(
     timeout: float,
     no_cache: bool,
     cache_dir: str | None,
+    cache_backend: str,
     strict: bool,
     no_network: bool,
     verify_release_links: bool,
@@ -82,10 +105,14 @@ def _settings(
     use_deps_dev_fallback: bool,
     use_scraper_fallback: bool,
 ) -> ResolverSettings:
+    if cache_backend not in CACHE_BACKENDS:
+        names = ", ".join(CACHE_BACKENDS)
+        raise typer.BadParameter(f"expected one of: {names}", param_hint="--cache-backend")
     return ResolverSettings(
         timeout=timeout,
         use_cache=not no_cache,
         cache_dir=cache_dir,
+        cache_backend=cache_backend,
         strict=strict,
         no_network=no_network,
         verify_release_links=verify_release_links,
@@ -107,6 +134,7 @@ def _resolver(settings: ResolverSettings) -> api.Resolver:
         use_deps_dev_fallback=settings.use_deps_dev_fallback,
         use_scraper_fallback=settings.use_scraper_fallback,
         user_agent=settings.user_agent,
+        cache_backend=settings.cache_backend,
     )
 
 
@@ -156,6 +184,51 @@ def _emit_result(result: ResolutionResult, *, json_output: bool, pretty: bool, t
                 typer.echo(f"   - {reason}")
 
 
+def _batch_purls(lines: Iterable[str]) -> Iterator[str]:
+    for line in lines:
+        purl = line.strip()
+        if purl and not purl.startswith("#"):
+            yield purl
+
+
+def _batch_error(purl: str) -> dict[str, str] | None:
+    """Return an error record for PURLs that would abort ``resolve_many``."""
+
+    try:
+        parsed = api.parse_purl(purl)
+    except Purl2RepoError as exc:
+        return {"purl": purl, "error": str(exc), "error_type": type(exc).__name__}
+    if parsed.type not in SUPPORTED_PURL_TYPES:
+        return {
+            "purl": purl,
+            "error": f"Unsupported package type: {parsed.type}",
+            "error_type": UnsupportedEcosystemError.__name__,
+        }
+    return None
+
+
+def _batch_records(
+    resolver: api.Resolver, purls: Iterable[str], *, max_workers: int, ordered: bool
+) -> Iterator[dict[str, Any]]:
+    # Error records wait here until the results around them are emitted; in ordered
+    # mode ``None`` marks the slot of each PURL handed to the resolver.
+    pending: deque[dict[str, str] | None] = deque()
+
+    def resolvable() -> Iterator[str]:
+        for purl in purls:
+            error = _batch_error(purl)
+            if error is not None or ordered:
+                pending.append(error)
+            if error is None:
+                yield purl
+
+    for item in resolver.resolve_many(resolvable(), max_workers=max_workers, ordered=ordered):
+        while pending and (record := pending.popleft()) is not None:
+            yield record
+        yield (item if isinstance(item, ResolutionResult) else item[1]).to_dict()
+    yield from (record for record in pending if record is not None)
+
+
 def _handle_error(exc: Purl2RepoError) -> None:
     if isinstance(exc, InvalidPurlError):
         raise typer.Exit(2) from exc
@@ -193,6 +266,7 @@ def resolve(
     timeout: TimeoutOption = 10.0,
     no_cache: NoCacheOption = False,
     cache_dir: CacheDirOption = None,
+    cache_backend: CacheBackendOption = "json",
     verbose: VerboseOption = False,
     trace: TraceOption = False,
     no_network: NoNetworkOption = False,
@@ -208,6 +282,7 @@ def resolve(
         timeout,
         no_cache,
         cache_dir,
+        cache_backend,
         strict,
         no_network,
         verify_release_links,
@@ -233,6 +308,7 @@ def repo(
     timeout: TimeoutOption = 10.0,
     no_cache: NoCacheOption = False,
     cache_dir: CacheDirOption = None,
+    cache_backend: CacheBackendOption = "json",
     verbose: VerboseOption = False,
     trace: TraceOption = False,
     no_network: NoNetworkOption = False,
@@ -248,6 +324,7 @@ def repo(
         timeout,
         no_cache,
         cache_dir,
+        cache_backend,
         strict,
         no_network,
         verify_release_links,
@@ -273,6 +350,7 @@ def release(
     timeout: TimeoutOption = 10.0,
     no_cache: NoCacheOption = False,
     cache_dir: CacheDirOption = None,
+    cache_backend: CacheBackendOption = "json",
     verbose: VerboseOption = False,
     trace: TraceOption = False,
     no_network: NoNetworkOption = False,
@@ -288,6 +366,7 @@ def release(
         timeout,
         no_cache,
         cache_dir,
+        cache_backend,
         strict,
         no_network,
         verify_release_links,
@@ -304,6 +383,45 @@ def release(
     _emit_result(result, json_output=json_output, pretty=pretty, trace=trace)
 
 
+@app.command()
+def batch(
+    input_file: BatchInputArgument,
+    max_workers: MaxWorkersOption = 8,
+    ordered: OrderedOption = False,
+    timeout: TimeoutOption = 10.0,
+    no_cache: NoCacheOption = False,
+    cache_dir: CacheDirOption = None,
+    cache_backend: CacheBackendOption = "json",
+    verbose: VerboseOption = False,
+    no_network: NoNetworkOption = False,
+    verify_release_links: VerifyReleaseOption = False,
+    validate_repositories: ValidateRepositoriesOption = True,
+    deps_dev_fallback: DepsDevFallbackOption = True,
+    scraper_fallback: ScraperFallbackOption = True,
+) -> None:
+    """Resolve many PURLs and stream one JSON result per line."""
+
+    _configure_logging(verbose)
+    settings = _settings(
+        timeout,
+        no_cache,
+        cache_dir,
+        cache_backend,
+        False,
+        no_network,
+        verify_release_links,
+        validate_repositories,
+        deps_dev_fallback,
+        scraper_fallback,
+    )
+    with _resolver(settings) as resolver:
+        records = _batch_records(
+            resolver, _batch_purls(input_file), max_workers=max_workers, ordered=ordered
+        )
+        for record in records:
+            typer.echo(json.dumps(record))
+
+
 @app.command()
 def supports(json_output: JsonOption = False, pretty: PrettyOption = False) -> None:
     """List supported ecosystems and recognized repository hosts."""
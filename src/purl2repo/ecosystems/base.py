@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Self
 
 from purl2repo.hosts.base import HostAdapter
+from purl2repo.http.async_client import AsyncHttpClient
 from purl2repo.http.client import HttpClient
-from purl2repo.models import ParsedPurl, ReleaseLink, RepositoryCandidate
+from purl2repo.models import ParsedPurl, ReleaseLink, RepositoryCandidate, ResolverSettings
 from purl2repo.utils.urls import classify_host, normalize_repo_url, url_host
 
 Metadata = dict[str, Any]
@@ -17,10 +18,21 @@ class EcosystemResolver(ABC):
     ecosystem: str
     metadata_source: str
 
+    @classmethod
+    def from_settings(cls, settings: ResolverSettings) -> Self:
+        """Build the adapter an engine reuses for every resolution; override to read settings."""
+
+        _ = settings
+        return cls()
+
     @abstractmethod
     def fetch_metadata(self, parsed: ParsedPurl, client: HttpClient) -> Metadata:
         """Fetch structured ecosystem metadata."""
 
+    @abstractmethod
+    async def fetch_metadata_async(self, parsed: ParsedPurl, client: AsyncHttpClient) -> Metadata:
+        """Fetch structured ecosystem metadata without blocking the event loop."""
+
     @abstractmethod
     def extract_candidates(
         self, parsed: ParsedPurl, metadata: Metadata
@@ -43,12 +55,28 @@ class EcosystemResolver(ABC):
         _ = parsed, metadata
         return []
 
+    def distill_metadata(self, parsed: ParsedPurl, metadata: Metadata) -> Metadata:
+        """Return only the fields candidate extraction, scraping, and release links read."""
+
+        _ = parsed
+        return metadata
+
     def metadata_fetch_fallback(self, parsed: ParsedPurl) -> Metadata | None:
         """Return minimal metadata when structured fetch fails but inference is possible."""
 
         _ = parsed
         return None
 
+    def close(self) -> None:
+        """Release anything the adapter holds; engines call this when they close."""
+
+        return None
+
+    async def aclose(self) -> None:
+        """Release anything the adapter holds from an async engine."""
+
+        self.close()
+
 
 def make_candidate(url: str | None, source: str, reason: str) -> RepositoryCandidate | None:
     if not url:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from purl2repo.ecosystems.base import EcosystemResolver, Metadata, dedupe_candidates, make_candidate
+from purl2repo.http.async_client import AsyncHttpClient
 from purl2repo.http.client import HttpClient
 from purl2repo.models import ParsedPurl, RepositoryCandidate
 from purl2repo.utils.text import is_docs_like
@@ -14,7 +15,10 @@ class CargoResolver(EcosystemResolver):
     metadata_source = "crates.io"
 
     def fetch_metadata(self, parsed: ParsedPurl, client: HttpClient) -> Metadata:
-        return client.get_json(f"https://crates.io/api/v1/crates/{parsed.name}")
+        return client.get_json(_crate_url(parsed))
+
+    async def fetch_metadata_async(self, parsed: ParsedPurl, client: AsyncHttpClient) -> Metadata:
+        return await client.get_json(_crate_url(parsed))
 
     def extract_candidates(
         self, parsed: ParsedPurl, metadata: Metadata
@@ -46,3 +50,14 @@ class CargoResolver(EcosystemResolver):
             if isinstance(homepage, str):
                 pages.append(homepage)
         return pages
+
+    def distill_metadata(self, parsed: ParsedPurl, metadata: Metadata) -> Metadata:
+        _ = parsed
+        crate = metadata.get("crate")
+        if not isinstance(crate, dict):
+            return {}
+        return {"crate": {key: crate[key] for key in ("repository", "homepage") if key in crate}}
+
+
+def _crate_url(parsed: ParsedPurl) -> str:
+    return f"https://crates.io/api/v1/crates/{parsed.name}"
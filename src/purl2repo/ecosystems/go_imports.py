@@ -0,0 +1,115 @@
+"""Import-path prefix rules that map Go modules to repositories without go-get lookups."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+
+# A rule receives the path segments after its prefix and returns the repository
+# URL, or None when the rule does not apply to that path.
+RepoRule = Callable[[Sequence[str]], str | None]
+
+_GOPKG_IN_SEGMENT = re.compile(r"(?P<name>[A-Za-z0-9_.-]+?)\.v\d+")
+
+
+def _segments(path: str) -> list[str]:
+    return [segment for segment in path.strip("/").split("/") if segment]
+
+
+@dataclass
+class _Node:
+    children: dict[str, _Node] = field(default_factory=dict)
+    rule: RepoRule | None = None
+
+
+class GoImportTrie:
+    """Longest-prefix match of Go import paths, one trie level per path segment."""
+
+    def __init__(self) -> None:
+        self._root = _Node()
+
+    def insert(self, prefix: str, rule: RepoRule) -> None:
+        node = self._root
+        for segment in _segments(prefix):
+            node = node.children.setdefault(segment, _Node())
+        node.rule = rule
+
+    def lookup(self, import_path: str) -> tuple[str, str] | None:
+        """Return ``(prefix, repository)`` for the longest matching prefix that applies."""
+
+        segments = _segments(import_path)
+        matches: list[tuple[int, RepoRule]] = []
+        node = self._root
+        for depth, segment in enumerate(segments, start=1):
+            child = node.children.get(segment)
+            if child is None:
+                break
+            node = child
+            if node.rule is not None:
+                matches.append((depth, node.rule))
+        for depth, rule in reversed(matches):
+            repository = rule(segments[depth:])
+            if repository:
+                return "/".join(segments[:depth]), repository
+        return None
+
+
+def template_rule(template: str) -> RepoRule:
+    """Rule whose ``{0}``, ``{1}``, ... placeholders take the segments after the prefix."""
+
+    def rule(rest: Sequence[str]) -> str | None:
+        try:
+            return template.format(*rest)
+        except IndexError:
+            return None
+
+    return rule
+
+
+def fixed_rule(repository: str) -> RepoRule:
+    return lambda rest: repository
+
+
+def _gopkg_in_rule(rest: Sequence[str]) -> str | None:
+    # gopkg.in/pkg.v3 -> github.com/go-pkg/pkg; gopkg.in/user/pkg.v3 -> github.com/user/pkg
+    if rest and (match := _GOPKG_IN_SEGMENT.fullmatch(rest[0])):
+        name = match.group("name")
+        return f"https://github.com/go-{name}/{name}"
+    if len(rest) > 1 and (match := _GOPKG_IN_SEGMENT.fullmatch(rest[1])):
+        return f"https://github.com/{rest[0]}/{match.group('name')}"
+    return None
+
+
+# Module paths on github.com, gitlab.com, and bitbucket.org already name their
+# repository and never need a rule.
+BUILTIN_GO_IMPORT_RULES: dict[str, RepoRule] = {
+    "golang.org/x": template_rule("https://go.googlesource.com/{0}"),
+    "google.golang.org/grpc": fixed_rule("https://github.com/grpc/grpc-go"),
+    "google.golang.org/protobuf": fixed_rule("https://go.googlesource.com/protobuf"),
+    "google.golang.org/genproto": fixed_rule("https://github.com/googleapis/go-genproto"),
+    "google.golang.org/api": fixed_rule("https://github.com/googleapis/google-api-go-client"),
+    "google.golang.org/appengine": fixed_rule("https://github.com/golang/appengine"),
+    "k8s.io": template_rule("https://github.com/kubernetes/{0}"),
+    "sigs.k8s.io": template_rule("https://github.com/kubernetes-sigs/{0}"),
+    "go.uber.org": template_rule("https://github.com/uber-go/{0}"),
+    "gopkg.in": _gopkg_in_rule,
+}
+
+
+def build_go_import_rules(extra: Mapping[str, str | RepoRule] | None = None) -> GoImportTrie:
+    """Return a trie of the built-in rules plus ``extra``, which replace built-ins.
+
+    ``extra`` maps an import-path prefix to a URL, a template whose ``{0}``, ``{1}``,
+    ... placeholders take the path segments after the prefix, or a callable
+    returning the URL (or None). Longer prefixes win over shorter ones.
+    """
+
+    trie = GoImportTrie()
+    for prefix, rule in BUILTIN_GO_IMPORT_RULES.items():
+        trie.insert(prefix, rule)
+    for prefix, repository in (extra or {}).items():
+        trie.insert(
+            prefix, template_rule(repository) if isinstance(repository, str) else repository
+        )
+    return trie
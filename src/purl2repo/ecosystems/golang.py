@@ -2,47 +2,185 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from functools import cache
 from html.parser import HTMLParser
-from urllib.parse import quote
+from pathlib import Path
+from typing import Self
+from urllib.parse import quote, urlsplit
+from urllib.request import url2pathname
 
 from purl2repo.ecosystems.base import EcosystemResolver, Metadata, dedupe_candidates, make_candidate
+from purl2repo.ecosystems.go_imports import GoImportTrie, RepoRule, build_go_import_rules
 from purl2repo.errors import MetadataFetchError
-from purl2repo.http.client import HttpClient
-from purl2repo.models import ParsedPurl, RepositoryCandidate
+from purl2repo.http.async_client import AsyncHttpClient
+from purl2repo.http.client import BaseHttpClient, HttpClient
+from purl2repo.models import ParsedPurl, RepositoryCandidate, ResolverSettings
 from purl2repo.utils.urls import is_repo_like_url
 
 DIRECT_GO_HOSTS = {"github.com", "gitlab.com", "bitbucket.org"}
+DEFAULT_GO_IMPORT_TIMEOUT_SECONDS = 2.0
+GO_IMPORT_WORKERS = 8
+SLOW_GO_IMPORT_HOST_SECONDS = 300.0
+# Response-cache key prefix for the import prefixes vanity hosts have declared.
+GO_IMPORT_KEY_PREFIX = "go-import:"
 
 
 class GoResolver(EcosystemResolver):
     ecosystem = "golang"
     metadata_source = "go-module-proxy"
 
+    def __init__(
+        self,
+        go_import_timeout_seconds: float | None = DEFAULT_GO_IMPORT_TIMEOUT_SECONDS,
+        go_proxy_roots: Iterable[str] = (),
+        go_import_rules: Mapping[str, str | RepoRule] | None = None,
+    ) -> None:
+        self.go_import_timeout_seconds = go_import_timeout_seconds
+        self.go_proxy_roots = _local_proxy_roots(tuple(go_proxy_roots))
+        self.go_import_rules = build_go_import_rules(go_import_rules)
+        # go-get state lives on the adapter, so each engine has its own.
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        # Async lookups still running after their caller stopped waiting.
+        self._pending: set[asyncio.Task[str | None]] = set()
+        # Vanity hosts whose go-get lookup last missed the deadline, with when it happened.
+        self._slow_hosts: dict[str, float] = {}
+
+    @classmethod
+    def from_settings(cls, settings: ResolverSettings) -> Self:
+        return cls(
+            go_import_timeout_seconds=settings.go_import_timeout_seconds,
+            go_proxy_roots=settings.go_proxy_roots or (),
+            go_import_rules=settings.go_import_rules,
+        )
+
+    def close(self) -> None:
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    async def aclose(self) -> None:
+        pending = list(self._pending)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self.close()
+
     def fetch_metadata(self, parsed: ParsedPurl, client: HttpClient) -> Metadata:
         module_path = go_module_path(parsed)
-        escaped = quote(module_path, safe="/")
-        if parsed.version:
-            url = f"https://proxy.golang.org/{escaped}/@v/{parsed.version}.info"
-        else:
-            url = f"https://proxy.golang.org/{escaped}/@latest"
         metadata: Metadata = {"module_path": module_path}
+        known_repo = _known_go_import_repo(module_path, self.go_import_rules, client)
+        lookup: Future[str | None] | None = None
+        sent = _SendTime()
+        missed = None
+        if known_repo is None and _needs_go_import_lookup(module_path):
+            missed = self._skip_slow_host(module_path)
+            if missed is None:
+                lookup = self._go_import_executor().submit(
+                    copy_context().run, _fetch_go_import_repo, module_path, client, sent
+                )
         proxy_error: MetadataFetchError | None = None
-        try:
-            metadata["proxy_info"] = client.get_json(url)
-        except MetadataFetchError as exc:
-            proxy_error = exc
-
-        go_import_repo = _fetch_go_import_repo(module_path, client)
-        if go_import_repo:
-            metadata["go_import_repo"] = go_import_repo
-
-        if proxy_error:
-            metadata["_purl2repo_metadata_warning"] = (
-                f"Could not fetch metadata from go-module-proxy: {proxy_error}"
+        local_info = _local_proxy_info(self.go_proxy_roots, module_path, parsed.version)
+        if local_info is not None:
+            metadata["proxy_info"] = local_info
+        else:
+            try:
+                metadata["proxy_info"] = client.get_json(_proxy_url(parsed, module_path))
+            except MetadataFetchError as exc:
+                proxy_error = exc
+
+        go_import_repo = known_repo
+        if lookup is not None:
+            timeout = self.go_import_timeout_seconds
+            sent_at = sent.wait(timeout)
+            if sent_at is None:
+                # Still queued behind other lookups; that says nothing about this host.
+                lookup.cancel()
+                missed = f"go-get lookup for {module_path} did not start within {timeout}s"
+            else:
+                try:
+                    go_import_repo = lookup.result(timeout=_remaining(sent_at, timeout))
+                except TimeoutError:
+                    missed = self._mark_slow_host(module_path, timeout)
+        return _merge_go_metadata(metadata, go_import_repo, proxy_error, missed)
+
+    async def fetch_metadata_async(self, parsed: ParsedPurl, client: AsyncHttpClient) -> Metadata:
+        module_path = go_module_path(parsed)
+        metadata: Metadata = {"module_path": module_path}
+        known_repo = None
+        if _needs_go_import_lookup(module_path):
+            # Learned prefixes are read from the response cache, which may be on disk.
+            known_repo = await asyncio.to_thread(
+                _known_go_import_repo, module_path, self.go_import_rules, client
             )
-        if metadata.get("proxy_info") or go_import_repo or is_repo_like_url(module_path):
-            return metadata
-        raise proxy_error or MetadataFetchError(f"No Go metadata found for {module_path}")
+        lookup: asyncio.Task[str | None] | None = None
+        missed = None
+        if known_repo is None and _needs_go_import_lookup(module_path):
+            missed = self._skip_slow_host(module_path)
+            if missed is None:
+                lookup = asyncio.ensure_future(_fetch_go_import_repo_async(module_path, client))
+                self._pending.add(lookup)
+                lookup.add_done_callback(self._forget_go_import)
+        sent_at = time.monotonic()
+        proxy_error: MetadataFetchError | None = None
+        local_info = _local_proxy_info(self.go_proxy_roots, module_path, parsed.version)
+        if local_info is not None:
+            metadata["proxy_info"] = local_info
+        else:
+            try:
+                metadata["proxy_info"] = await client.get_json(_proxy_url(parsed, module_path))
+            except MetadataFetchError as exc:
+                proxy_error = exc
+
+        go_import_repo = known_repo
+        if lookup is not None:
+            timeout = self.go_import_timeout_seconds
+            try:
+                # Shielded so a late answer still records its import prefix.
+                go_import_repo = await asyncio.wait_for(
+                    asyncio.shield(lookup), _remaining(sent_at, timeout)
+                )
+            except TimeoutError:
+                missed = self._mark_slow_host(module_path, timeout)
+        return _merge_go_metadata(metadata, go_import_repo, proxy_error, missed)
+
+    def _go_import_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=GO_IMPORT_WORKERS, thread_name_prefix="purl2repo-go-get"
+                )
+            return self._executor
+
+    def _skip_slow_host(self, module_path: str) -> str | None:
+        """Return why no go-get lookup is sent, if the host recently missed the deadline.
+
+        Lookups under a slow host are not sent for ``SLOW_GO_IMPORT_HOST_SECONDS``;
+        the module resolves from the proxy and any prefix already learned.
+        """
+
+        host = _go_import_host(module_path)
+        slow_since = self._slow_hosts.get(host)
+        if slow_since is None or time.monotonic() - slow_since >= SLOW_GO_IMPORT_HOST_SECONDS:
+            return None
+        return f"go-get lookup for {module_path} skipped; {host} recently missed the deadline"
+
+    def _mark_slow_host(self, module_path: str, timeout: float | None) -> str:
+        self._slow_hosts[_go_import_host(module_path)] = time.monotonic()
+        return f"go-get lookup for {module_path} did not finish within {timeout}s"
+
+    def _forget_go_import(self, task: asyncio.Task[str | None]) -> None:
+        self._pending.discard(task)
+        if not task.cancelled():
+            task.exception()
 
     def extract_candidates(
         self, parsed: ParsedPurl, metadata: Metadata
@@ -100,19 +238,201 @@ class _GoImportParser(HTMLParser):
             self.entries.append((parts[0], parts[1], parts[2]))
 
 
-def _fetch_go_import_repo(module_path: str, client: HttpClient) -> str | None:
-    host = module_path.split("/", 1)[0].lower()
-    if host in DIRECT_GO_HOSTS:
+def _proxy_url(parsed: ParsedPurl, module_path: str) -> str:
+    escaped = quote(module_path, safe="/")
+    if parsed.version:
+        return f"https://proxy.golang.org/{escaped}/@v/{parsed.version}.info"
+    return f"https://proxy.golang.org/{escaped}/@latest"
+
+
+@cache
+def _local_proxy_roots(roots: tuple[str, ...]) -> tuple[Path, ...]:
+    """Resolve configured roots once per process rather than once per resolver."""
+
+    return tuple(_local_proxy_root(root) for root in roots)
+
+
+def _local_proxy_root(root: str) -> Path:
+    path = Path(url2pathname(urlsplit(root).path)) if root.startswith("file:") else Path(root)
+    path = path.expanduser()
+    # A GOMODCACHE directory keeps its proxy-layout downloads under cache/download.
+    download = path / "cache" / "download"
+    return download if download.is_dir() else path
+
+
+def _local_proxy_info(
+    roots: tuple[Path, ...], module_path: str, version: str | None
+) -> Metadata | None:
+    """Read ``.info`` metadata from GOPROXY-layout directories, in root order."""
+
+    for root in roots:
+        module_dir = root / _escape_go_path(module_path)
+        if version:
+            info = _read_json_file(module_dir / "@v" / f"{_escape_go_path(version)}.info")
+        else:
+            info = _read_json_file(module_dir / "@latest") or _local_latest_info(module_dir)
+        if info is not None:
+            return info
+    return None
+
+
+def _local_latest_info(module_dir: Path) -> Metadata | None:
+    version_dir = module_dir / "@v"
+    try:
+        versions = (version_dir / "list").read_text(encoding="utf-8").split()
+    except OSError:
+        versions = []
+    # The list names tagged versions only, so it is empty for pseudo-version-only modules.
+    if not versions:
+        versions = [path.stem for path in version_dir.glob("*.info")]
+    # Like the go command, prefer the newest release over any pre-release.
+    if not versions:
+        return None
+    releases = [version for version in versions if "-" not in version]
+    latest = max(releases or versions, key=_go_version_key)
+    return _read_json_file(version_dir / f"{_escape_go_path(latest)}.info")
+
+
+def _go_version_key(version: str) -> tuple[tuple[int, ...], str]:
+    core = version.removeprefix("v").split("-", 1)[0].split("+", 1)[0]
+    return tuple(int(part) if part.isdigit() else 0 for part in core.split(".")), version
+
+
+def _escape_go_path(path: str) -> str:
+    """Apply the module proxy's case encoding, which writes ``A`` as ``!a``."""
+
+    return "".join(f"!{char.lower()}" if char.isupper() else char for char in path)
+
+
+def _read_json_file(path: Path) -> Metadata | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
         return None
+    return data if isinstance(data, dict) else None
+
+
+def _merge_go_metadata(
+    metadata: Metadata,
+    go_import_repo: str | None,
+    proxy_error: MetadataFetchError | None,
+    missed_go_import: str | None = None,
+) -> Metadata:
+    """Combine the proxy answer and go-get lookup, warning about whichever fell short.
+
+    A warning marks the metadata inconclusive, so the engine neither memoizes the
+    result nor caches the distilled metadata.
+    """
+
+    module_path = str(metadata["module_path"])
+    if go_import_repo:
+        metadata["go_import_repo"] = go_import_repo
+    warnings = []
+    if proxy_error:
+        warnings.append(f"Could not fetch metadata from go-module-proxy: {proxy_error}")
+    if missed_go_import:
+        warnings.append(missed_go_import)
+    if warnings:
+        metadata["_purl2repo_metadata_warning"] = "; ".join(warnings)
+    if metadata.get("proxy_info") or go_import_repo or is_repo_like_url(module_path):
+        return metadata
+    raise proxy_error or MetadataFetchError(f"No Go metadata found for {module_path}")
+
+
+def _needs_go_import_lookup(module_path: str) -> bool:
+    return _go_import_host(module_path) not in DIRECT_GO_HOSTS
+
+
+def _go_import_host(module_path: str) -> str:
+    return module_path.split("/", 1)[0].lower()
+
+
+def _known_go_import_repo(
+    module_path: str, rules: GoImportTrie, client: BaseHttpClient
+) -> str | None:
+    if not _needs_go_import_lookup(module_path):
+        return None
+    known = rules.lookup(module_path)
+    if known is not None:
+        return known[1]
+    # A prefix learned from an earlier go-import answer; the longest one wins.
+    segments = module_path.split("/")
+    for depth in range(len(segments), 0, -1):
+        prefix = "/".join(segments[:depth])
+        learned = client.cached_summary(f"{GO_IMPORT_KEY_PREFIX}{prefix}", _go_get_url(prefix))
+        if learned is not None and isinstance(learned.get("repository"), str):
+            return str(learned["repository"])
+    return None
+
+
+class _SendTime:
+    """When a go-get lookup queued on the adapter's pool actually sent its request."""
+
+    def __init__(self) -> None:
+        self._sent = threading.Event()
+        self._at = 0.0
+
+    def mark(self) -> None:
+        self._at = time.monotonic()
+        self._sent.set()
+
+    def wait(self, timeout: float | None) -> float | None:
+        """Return the send time, or ``None`` if the lookup was still queued after ``timeout``."""
+
+        if not self._sent.wait(timeout):
+            return None
+        return self._at
+
+
+def _remaining(sent_at: float, timeout: float | None) -> float | None:
+    """How much of a go-get deadline counted from ``sent_at`` is left."""
+
+    if timeout is None:
+        return None
+    return max(0.0, sent_at + timeout - time.monotonic())
+
+
+def _fetch_go_import_repo(
+    module_path: str, client: HttpClient, sent: _SendTime | None = None
+) -> str | None:
+    if sent is not None:
+        sent.mark()
+    try:
+        html = client.get_text(_go_get_url(module_path))
+    except MetadataFetchError:
+        return None
+    return _learn_go_import(module_path, html, client)
+
+
+async def _fetch_go_import_repo_async(module_path: str, client: AsyncHttpClient) -> str | None:
     try:
-        html = client.get_text(f"https://{module_path}?go-get=1")
+        html = await client.get_text(_go_get_url(module_path))
     except MetadataFetchError:
         return None
+    return await asyncio.to_thread(_learn_go_import, module_path, html, client)
+
+
+def _learn_go_import(module_path: str, html: str, client: BaseHttpClient) -> str | None:
+    found = _go_import_from_html(module_path, html)
+    if found is None:
+        return None
+    prefix, repo_url = found
+    client.store_summary(f"{GO_IMPORT_KEY_PREFIX}{prefix}", {"repository": repo_url})
+    return repo_url
+
+
+def _go_get_url(module_path: str) -> str:
+    return f"https://{module_path}?go-get=1"
+
+
+def _go_import_from_html(module_path: str, html: str) -> tuple[str, str] | None:
+    """Return ``(prefix, repository)`` from the go-import tag that covers ``module_path``."""
+
     parser = _GoImportParser()
     parser.feed(html)
     for prefix, vcs, repo_url in parser.entries:
         if vcs == "mod":
             continue
         if module_path == prefix or module_path.startswith(f"{prefix}/"):
-            return repo_url
+            return prefix, repo_url
     return None
@@ -3,14 +3,29 @@
 from __future__ import annotations
 
 import xml.etree.ElementTree as ET
-from typing import Any
+from collections.abc import Iterator
+from typing import Any, cast
 
 from purl2repo.ecosystems.base import EcosystemResolver, Metadata, dedupe_candidates, make_candidate
+from purl2repo.http.async_client import AsyncHttpClient
 from purl2repo.http.client import HttpClient
 from purl2repo.models import ParsedPurl, RepositoryCandidate
 from purl2repo.utils.text import is_docs_like
 from purl2repo.utils.urls import is_repo_like_url
 
+PARENT_POM_KEY_PREFIX = "maven-parent:"
+XML_CHUNK_SIZE = 64 * 1024
+POM_PATHS = (
+    "url",
+    "parent/groupId",
+    "parent/artifactId",
+    "parent/version",
+    "scm/url",
+    "scm/connection",
+    "scm/developerConnection",
+)
+MAVEN_METADATA_PATHS = ("versioning/latest", "versioning/release")
+
 
 class MavenResolver(EcosystemResolver):
     ecosystem = "maven"
@@ -20,19 +35,26 @@ class MavenResolver(EcosystemResolver):
         if not parsed.namespace:
             return {}
         version = parsed.version or self._latest_version(parsed, client)
-        group_path = parsed.namespace.replace(".", "/")
-        url = (
-            "https://repo1.maven.org/maven2/"
-            f"{group_path}/{parsed.name}/{version}/{parsed.name}-{version}.pom"
-        )
-        pom = _parse_pom(client.get_text(url))
+        pom = _parse_pom(client.get_text(_pom_url(parsed.namespace, parsed.name, version)))
+        metadata: Metadata = {"pom": pom, "effective_version": version}
+        parent = _unresolved_parent(pom)
+        if parent is not None:
+            parent_poms = self._fetch_parent_chain(parent, client)
+            if parent_poms:
+                metadata["parent_poms"] = parent_poms
+        return metadata
+
+    async def fetch_metadata_async(self, parsed: ParsedPurl, client: AsyncHttpClient) -> Metadata:
+        if not parsed.namespace:
+            return {}
+        version = parsed.version or await self._latest_version_async(parsed, client)
+        pom = _parse_pom(await client.get_text(_pom_url(parsed.namespace, parsed.name, version)))
         metadata: Metadata = {"pom": pom, "effective_version": version}
-        if not _scm_has_value(pom):
-            parent = pom.get("parent")
-            if isinstance(parent, dict):
-                parent_poms = self._fetch_parent_chain(parent, client)
-                if parent_poms:
-                    metadata["parent_poms"] = parent_poms
+        parent = _unresolved_parent(pom)
+        if parent is not None:
+            parent_poms = await self._fetch_parent_chain_async(parent, client)
+            if parent_poms:
+                metadata["parent_poms"] = parent_poms
         return metadata
 
     def extract_candidates(
@@ -89,10 +111,14 @@ class MavenResolver(EcosystemResolver):
     def _latest_version(self, parsed: ParsedPurl, client: HttpClient) -> str:
         if not parsed.namespace:
             return ""
-        group_path = parsed.namespace.replace(".", "/")
-        url = f"https://repo1.maven.org/maven2/{group_path}/{parsed.name}/maven-metadata.xml"
-        metadata = _parse_maven_metadata(client.get_text(url))
-        return metadata.get("release") or metadata.get("latest") or ""
+        url = _maven_metadata_url(parsed.namespace, parsed.name)
+        return _latest_from_metadata(_parse_maven_metadata(client.get_text(url)))
+
+    async def _latest_version_async(self, parsed: ParsedPurl, client: AsyncHttpClient) -> str:
+        if not parsed.namespace:
+            return ""
+        url = _maven_metadata_url(parsed.namespace, parsed.name)
+        return _latest_from_metadata(_parse_maven_metadata(await client.get_text(url)))
 
     def _fetch_parent_chain(
         self, parent: dict[str, Any], client: HttpClient, max_depth: int = 4
@@ -106,73 +132,154 @@ class MavenResolver(EcosystemResolver):
             if parent_pom is None:
                 break
             chain.append(parent_pom)
-            if _scm_has_value(parent_pom):
+            current_parent = _unresolved_parent(parent_pom)
+        return chain
+
+    async def _fetch_parent_chain_async(
+        self, parent: dict[str, Any], client: AsyncHttpClient, max_depth: int = 4
+    ) -> list[Metadata]:
+        chain: list[Metadata] = []
+        current_parent: dict[str, Any] | None = parent
+        for _ in range(max_depth):
+            if current_parent is None:
                 break
-            next_parent = parent_pom.get("parent")
-            current_parent = next_parent if isinstance(next_parent, dict) else None
+            parent_pom = await self._fetch_parent_pom_async(current_parent, client)
+            if parent_pom is None:
+                break
+            chain.append(parent_pom)
+            current_parent = _unresolved_parent(parent_pom)
         return chain
 
     def _fetch_parent_pom(self, parent: dict[str, Any], client: HttpClient) -> Metadata | None:
-        group_id = parent.get("groupId")
-        artifact_id = parent.get("artifactId")
-        version = parent.get("version")
-        if not isinstance(group_id, str) or not group_id:
+        url = _parent_pom_url(parent)
+        if url is None:
             return None
-        if not isinstance(artifact_id, str) or not artifact_id:
-            return None
-        if not isinstance(version, str) or not version:
+        return client.get_parsed_text(url, _parent_pom_key(parent), _parse_pom)
+
+    async def _fetch_parent_pom_async(
+        self, parent: dict[str, Any], client: AsyncHttpClient
+    ) -> Metadata | None:
+        url = _parent_pom_url(parent)
+        if url is None:
             return None
-        group_path = group_id.replace(".", "/")
-        url = (
-            "https://repo1.maven.org/maven2/"
-            f"{group_path}/{artifact_id}/{version}/{artifact_id}-{version}.pom"
-        )
-        return _parse_pom(client.get_text(url))
+        return await client.get_parsed_text(url, _parent_pom_key(parent), _parse_pom)
+
+
+def _pom_url(group_id: str, artifact_id: str, version: str) -> str:
+    group_path = group_id.replace(".", "/")
+    return (
+        "https://repo1.maven.org/maven2/"
+        f"{group_path}/{artifact_id}/{version}/{artifact_id}-{version}.pom"
+    )
+
+
+def _maven_metadata_url(group_id: str, artifact_id: str) -> str:
+    group_path = group_id.replace(".", "/")
+    return f"https://repo1.maven.org/maven2/{group_path}/{artifact_id}/maven-metadata.xml"
+
+
+def _latest_from_metadata(metadata: dict[str, str]) -> str:
+    return metadata.get("release") or metadata.get("latest") or ""
+
+
+def _parent_pom_url(parent: dict[str, Any]) -> str | None:
+    group_id = parent.get("groupId")
+    artifact_id = parent.get("artifactId")
+    version = parent.get("version")
+    if not isinstance(group_id, str) or not group_id:
+        return None
+    if not isinstance(artifact_id, str) or not artifact_id:
+        return None
+    if not isinstance(version, str) or not version:
+        return None
+    return _pom_url(group_id, artifact_id, version)
+
+
+def _parent_pom_key(parent: dict[str, Any]) -> str:
+    """Cache key for a parsed parent POM summary.
+
+    Corporate and foundation parents (``org.apache:apache``,
+    ``org.sonatype.oss:oss-parent``) are shared by most artifacts in a Java SBOM,
+    so their summaries are cached by coordinates and parsed once.
+    """
+
+    return f"{PARENT_POM_KEY_PREFIX}{parent['groupId']}:{parent['artifactId']}:{parent['version']}"
+
+
+def _unresolved_parent(pom: Metadata) -> dict[str, Any] | None:
+    """Return the parent coordinates to follow when this POM has no SCM data."""
+
+    if _scm_has_value(pom):
+        return None
+    parent = pom.get("parent")
+    return parent if isinstance(parent, dict) else None
 
 
 def _parse_pom(xml_text: str) -> dict[str, Any]:
-    root = ET.fromstring(xml_text)
+    fields = _extract_xml_text(xml_text, POM_PATHS)
     return {
-        "url": _find_text(root, "url"),
+        "url": fields["url"],
         "parent": {
-            "groupId": _find_text(root, "parent/groupId"),
-            "artifactId": _find_text(root, "parent/artifactId"),
-            "version": _find_text(root, "parent/version"),
+            "groupId": fields["parent/groupId"],
+            "artifactId": fields["parent/artifactId"],
+            "version": fields["parent/version"],
         },
         "scm": {
-            "url": _find_text(root, "scm/url"),
-            "connection": _find_text(root, "scm/connection"),
-            "developerConnection": _find_text(root, "scm/developerConnection"),
+            "url": fields["scm/url"],
+            "connection": fields["scm/connection"],
+            "developerConnection": fields["scm/developerConnection"],
         },
     }
 
 
 def _parse_maven_metadata(xml_text: str) -> dict[str, str]:
-    root = ET.fromstring(xml_text)
+    fields = _extract_xml_text(xml_text, MAVEN_METADATA_PATHS)
     return {
-        "latest": _find_text(root, "versioning/latest") or "",
-        "release": _find_text(root, "versioning/release") or "",
+        "latest": fields["versioning/latest"] or "",
+        "release": fields["versioning/release"] or "",
     }
 
 
-def _find_text(root: ET.Element, path: str) -> str | None:
-    parts = path.split("/")
-    current: ET.Element | None = root
-    for part in parts:
-        if current is None:
-            return None
-        current = _find_child(current, part)
-    if current is None or current.text is None:
-        return None
-    value = current.text.strip()
-    return value or None
+def _extract_xml_text(xml_text: str, paths: tuple[str, ...]) -> dict[str, str | None]:
+    """Return the stripped text of the first element at each path below the root.
 
+    Paths use local names, so POM namespaces are ignored. The response text is
+    already in memory; what this avoids is building it into a tree. Closed
+    elements are dropped, and reading stops once every path is either found or
+    its top-level element (``scm``, ``parent``, ...) has closed, since POMs and
+    ``maven-metadata.xml`` allow each of those only once. The dependency lists
+    that follow in BOM POMs are then never parsed.
+    """
 
-def _find_child(element: ET.Element, local_name: str) -> ET.Element | None:
-    for child in element:
-        if child.tag.rsplit("}", 1)[-1] == local_name:
-            return child
-    return None
+    sections = {path: path.split("/", 1)[0] for path in paths}
+    found: dict[str, str | None] = {}
+    closed: set[str] = set()
+    parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("start", "end"))
+    open_elements: list[ET.Element] = []
+    names: list[str] = []
+    for offset in range(0, len(xml_text), XML_CHUNK_SIZE):
+        parser.feed(xml_text[offset : offset + XML_CHUNK_SIZE])
+        # Only start/end events are requested, and both carry the element.
+        events = cast("Iterator[tuple[str, ET.Element]]", parser.read_events())
+        for event, element in events:
+            if event == "start":
+                open_elements.append(element)
+                names.append(element.tag.rsplit("}", 1)[-1])
+                continue
+            path = "/".join(names[1:])
+            if path in sections and path not in found:
+                found[path] = (element.text or "").strip() or None
+            if len(names) == 2:
+                closed.add(names[1])
+            open_elements.pop()
+            names.pop()
+            if open_elements:
+                del open_elements[-1][-1]
+        if all(path in found or section in closed for path, section in sections.items()):
+            break
+    else:
+        parser.close()
+    return {path: found.get(path) for path in paths}
 
 
 def _scm_has_value(pom: Metadata) -> bool:
@@ -2,24 +2,39 @@
 
 from __future__ import annotations
 
+from contextlib import suppress
 from typing import Any
 from urllib.parse import quote
 
 from purl2repo.ecosystems.base import EcosystemResolver, Metadata, dedupe_candidates, make_candidate
+from purl2repo.errors import MetadataFetchError
+from purl2repo.http.async_client import AsyncHttpClient
 from purl2repo.http.client import HttpClient
+from purl2repo.http.jsonstream import JsonPath
 from purl2repo.models import ParsedPurl, RepositoryCandidate
 from purl2repo.utils.text import is_docs_like
 from purl2repo.utils.urls import is_repo_like_url
 
+PACKUMENT_FIELDS: tuple[JsonPath, ...] = (("repository",), ("homepage",))
+
 
 class NpmResolver(EcosystemResolver):
     ecosystem = "npm"
     metadata_source = "npm-registry"
 
     def fetch_metadata(self, parsed: ParsedPurl, client: HttpClient) -> Metadata:
-        package_name = npm_package_name(parsed)
-        encoded = quote(package_name, safe="")
-        return client.get_json(f"https://registry.npmjs.org/{encoded}")
+        if parsed.version:
+            with suppress(MetadataFetchError):
+                manifest = client.get_json(_version_url(parsed, parsed.version))
+                return _version_document(manifest, parsed.version)
+        return client.get_json_fields(_packument_url(parsed), _packument_paths(parsed))
+
+    async def fetch_metadata_async(self, parsed: ParsedPurl, client: AsyncHttpClient) -> Metadata:
+        if parsed.version:
+            with suppress(MetadataFetchError):
+                manifest = await client.get_json(_version_url(parsed, parsed.version))
+                return _version_document(manifest, parsed.version)
+        return await client.get_json_fields(_packument_url(parsed), _packument_paths(parsed))
 
     def extract_candidates(
         self, parsed: ParsedPurl, metadata: Metadata
@@ -55,6 +70,15 @@ class NpmResolver(EcosystemResolver):
                 pages.append(url)
         return pages
 
+    def distill_metadata(self, parsed: ParsedPurl, metadata: Metadata) -> Metadata:
+        distilled = _pick(metadata, ("repository", "homepage"))
+        version_metadata = self._version_metadata(parsed, metadata)
+        if version_metadata and parsed.version:
+            distilled["versions"] = {
+                parsed.version: _pick(version_metadata, ("repository", "homepage"))
+            }
+        return distilled
+
     def _version_metadata(self, parsed: ParsedPurl, metadata: Metadata) -> Metadata:
         if not parsed.version:
             return {}
@@ -70,6 +94,42 @@ def npm_package_name(parsed: ParsedPurl) -> str:
     return f"{parsed.namespace}/{parsed.name}" if parsed.namespace else parsed.name
 
 
+def _packument_url(parsed: ParsedPurl) -> str:
+    return f"https://registry.npmjs.org/{quote(npm_package_name(parsed), safe='')}"
+
+
+def _packument_paths(parsed: ParsedPurl) -> tuple[JsonPath, ...]:
+    """Packument fields the adapter reads; popular packuments run to tens of megabytes."""
+
+    paths: list[JsonPath] = [("name",), *PACKUMENT_FIELDS]
+    if parsed.version:
+        paths.extend(("versions", parsed.version, *field) for field in PACKUMENT_FIELDS)
+    return tuple(paths)
+
+
+def _version_url(parsed: ParsedPurl, version: str) -> str:
+    name = quote(npm_package_name(parsed), safe="@/")
+    return f"https://registry.npmjs.org/{name}/{quote(version, safe='')}"
+
+
+def _version_document(manifest: Metadata, version: str) -> Metadata:
+    """Shape a single-version manifest like a packument that only lists that version.
+
+    The full packument carries every published manifest; for a pinned version the
+    registry's ``/<name>/<version>`` document holds everything the adapter reads.
+    Unversioned lookups, and versions the registry cannot serve that way, still
+    use the packument.
+    """
+
+    document = _pick(manifest, ("name", "repository", "homepage"))
+    document["versions"] = {version: manifest}
+    return document
+
+
+def _pick(metadata: Metadata, keys: tuple[str, ...]) -> Metadata:
+    return {key: metadata[key] for key in keys if key in metadata}
+
+
 def _repository_candidates(repository: Any) -> list[RepositoryCandidate | None]:
     if isinstance(repository, str):
         return [
@@ -6,22 +6,32 @@ from typing import Any
 
 from purl2repo.ecosystems.base import EcosystemResolver, Metadata, dedupe_candidates, make_candidate
 from purl2repo.hosts.base import HostAdapter
+from purl2repo.http.async_client import AsyncHttpClient
 from purl2repo.http.client import HttpClient
+from purl2repo.http.jsonstream import ARRAY_ITEM, JsonPath
 from purl2repo.models import ParsedPurl, ReleaseLink, RepositoryCandidate
 from purl2repo.utils.text import is_docs_like
 from purl2repo.utils.urls import is_repo_like_url
 
+DISTILLED_ENTRY_KEYS = ("repository", "repositoryUrl", "projectUrl")
+REGISTRATION_PATHS: tuple[JsonPath, ...] = tuple(
+    (*parent, "catalogEntry", key)
+    for parent in ((), ("items", ARRAY_ITEM), ("items", ARRAY_ITEM, "items", ARRAY_ITEM))
+    for key in DISTILLED_ENTRY_KEYS
+)
+
 
 class NuGetResolver(EcosystemResolver):
     ecosystem = "nuget"
     metadata_source = "nuget-registration"
 
     def fetch_metadata(self, parsed: ParsedPurl, client: HttpClient) -> Metadata:
-        package = parsed.name.lower()
-        url = f"https://api.nuget.org/v3/registration5-semver1/{package}/index.json"
-        metadata = client.get_json(url)
-        metadata["package_id"] = parsed.name
-        return metadata
+        registration = client.get_json_fields(_registration_url(parsed), REGISTRATION_PATHS)
+        return {**registration, "package_id": parsed.name}
+
+    async def fetch_metadata_async(self, parsed: ParsedPurl, client: AsyncHttpClient) -> Metadata:
+        registration = await client.get_json_fields(_registration_url(parsed), REGISTRATION_PATHS)
+        return {**registration, "package_id": parsed.name}
 
     def extract_candidates(
         self, parsed: ParsedPurl, metadata: Metadata
@@ -89,6 +99,23 @@ class NuGetResolver(EcosystemResolver):
                 pages.append(project_url)
         return pages
 
+    def distill_metadata(self, parsed: ParsedPurl, metadata: Metadata) -> Metadata:
+        _ = parsed
+        entries: list[dict[str, Any]] = []
+        for entry in _catalog_entries(metadata):
+            distilled = {key: entry[key] for key in DISTILLED_ENTRY_KEYS if key in entry}
+            if distilled and distilled not in entries:
+                entries.append(distilled)
+        return {
+            "package_id": metadata.get("package_id"),
+            "items": [{"catalogEntry": entry} for entry in entries],
+        }
+
+
+def _registration_url(parsed: ParsedPurl) -> str:
+    package = parsed.name.lower()
+    return f"https://api.nuget.org/v3/registration5-semver1/{package}/index.json"
+
 
 def _catalog_entries(metadata: Metadata) -> list[dict[str, Any]]:
     entries: list[dict[str, Any]] = []
@@ -6,11 +6,14 @@ from typing import Any
 
 from purl2repo.ecosystems.base import EcosystemResolver, Metadata, dedupe_candidates, make_candidate
 from purl2repo.errors import MetadataFetchError
+from purl2repo.http.async_client import AsyncHttpClient
 from purl2repo.http.client import HttpClient
 from purl2repo.models import ParsedPurl, RepositoryCandidate
 from purl2repo.utils.text import is_docs_like, is_source_label, normalize_label
 from purl2repo.utils.urls import is_repo_like_url
 
+DISTILLED_INFO_KEYS = ("project_urls", "home_page", "download_url")
+
 
 class PyPiResolver(EcosystemResolver):
     ecosystem = "pypi"
@@ -18,14 +21,21 @@ class PyPiResolver(EcosystemResolver):
 
     def fetch_metadata(self, parsed: ParsedPurl, client: HttpClient) -> Metadata:
         if parsed.version:
-            url = f"https://pypi.org/pypi/{parsed.name}/{parsed.version}/json"
             try:
-                return client.get_json(url)
+                return client.get_json(_version_url(parsed, parsed.version))
+            except MetadataFetchError:
+                project_metadata = client.get_json(_project_url(parsed))
+                return _with_missing_version(project_metadata, parsed.version)
+        return client.get_json(_project_url(parsed))
+
+    async def fetch_metadata_async(self, parsed: ParsedPurl, client: AsyncHttpClient) -> Metadata:
+        if parsed.version:
+            try:
+                return await client.get_json(_version_url(parsed, parsed.version))
             except MetadataFetchError:
-                project_metadata = client.get_json(f"https://pypi.org/pypi/{parsed.name}/json")
-                project_metadata["_purl2repo_version_metadata_missing"] = parsed.version
-                return project_metadata
-        return client.get_json(f"https://pypi.org/pypi/{parsed.name}/json")
+                project_metadata = await client.get_json(_project_url(parsed))
+                return _with_missing_version(project_metadata, parsed.version)
+        return await client.get_json(_project_url(parsed))
 
     def extract_candidates(
         self, parsed: ParsedPurl, metadata: Metadata
@@ -88,6 +98,31 @@ class PyPiResolver(EcosystemResolver):
             pages.extend(_metadata_urls(info))
         return pages
 
+    def distill_metadata(self, parsed: ParsedPurl, metadata: Metadata) -> Metadata:
+        _ = parsed
+        info = metadata.get("info")
+        distilled: Metadata = {}
+        if isinstance(info, dict):
+            distilled["info"] = {key: info[key] for key in DISTILLED_INFO_KEYS if key in info}
+        if "_purl2repo_version_metadata_missing" in metadata:
+            distilled["_purl2repo_version_metadata_missing"] = metadata[
+                "_purl2repo_version_metadata_missing"
+            ]
+        return distilled
+
+
+def _project_url(parsed: ParsedPurl) -> str:
+    return f"https://pypi.org/pypi/{parsed.name}/json"
+
+
+def _version_url(parsed: ParsedPurl, version: str) -> str:
+    return f"https://pypi.org/pypi/{parsed.name}/{version}/json"
+
+
+def _with_missing_version(project_metadata: Metadata, version: str) -> Metadata:
+    # Shared client responses are never mutated; the marker goes on a shallow copy.
+    return {**project_metadata, "_purl2repo_version_metadata_missing": version}
+
 
 def _string_value(value: Any) -> str | None:
     return value if isinstance(value, str) and value.strip() else None
@@ -1,5 +1,6 @@
 """HTTP helpers."""
 
+from .async_client import AsyncHttpClient
 from .client import HttpClient
 
-__all__ = ["HttpClient"]
+__all__ = ["AsyncHttpClient", "HttpClient"]
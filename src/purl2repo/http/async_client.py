@@ -0,0 +1,280 @@
+"""asyncio HTTP client mirroring :class:`purl2repo.http.client.HttpClient`."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from functools import partial
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+import httpx
+
+from purl2repo.errors import MetadataFetchError
+from purl2repo.http.client import (
+    FIELDS_PREFIX,
+    NOT_MODIFIED,
+    RELEASE_TTL_SECONDS,
+    BaseHttpClient,
+    T,
+    fetch_failed,
+    json_object,
+    require_web_url,
+    response_cache_writes_disabled,
+)
+from purl2repo.http.jsonstream import JsonFieldExtractor, JsonPath, path_key
+from purl2repo.http.singleflight import AsyncSingleFlight
+from purl2repo.models import ResolverSettings
+
+if TYPE_CHECKING:
+    from purl2repo.resolution.cache import ResponseCache
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class AsyncHttpClient(BaseHttpClient):
+    def __init__(
+        self,
+        settings: ResolverSettings,
+        cache: ResponseCache | None = None,
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        super().__init__(settings, cache)
+        self._client = httpx.AsyncClient(**self._client_options(), transport=transport)
+        self._flights = AsyncSingleFlight()
+        self._refreshes: dict[str, asyncio.Task[Any]] = {}
+
+    async def aclose(self) -> None:
+        refreshes = list(self._refreshes.values())
+        for task in refreshes:
+            task.cancel()
+        await asyncio.gather(*refreshes, return_exceptions=True)
+        await self._client.aclose()
+
+    async def get_json(self, url: str, *, ttl_seconds: int | None = None) -> dict[str, Any]:
+        ttl_seconds = self._ttl_for(url, ttl_seconds)
+        cached = await self._cache_io(self._get_cached, url, ttl_seconds, revalidatable=True)
+        if isinstance(cached, dict):
+            return cached
+        return await self._load(
+            url,
+            ttl_seconds,
+            dict,
+            lambda: self._flights.do(f"json:{url}", lambda: self._fetch_json(url)),
+        )
+
+    async def get_text(self, url: str, *, ttl_seconds: int | None = None) -> str:
+        ttl_seconds = self._ttl_for(url, ttl_seconds)
+        cached = await self._cache_io(self._get_cached, url, ttl_seconds, revalidatable=True)
+        if isinstance(cached, str):
+            return cached
+        return await self._load(
+            url,
+            ttl_seconds,
+            str,
+            lambda: self._flights.do(f"text:{url}", lambda: self._fetch_text(url)),
+        )
+
+    async def get_json_fields(
+        self, url: str, paths: tuple[JsonPath, ...], *, ttl_seconds: int | None = None
+    ) -> dict[str, Any]:
+        if not self.stream_json:
+            return await self.get_json(url, ttl_seconds=ttl_seconds)
+        ttl_seconds = self._ttl_for(url, ttl_seconds)
+        key = f"{FIELDS_PREFIX}{path_key(paths)}:{url}"
+        cached = await self._cache_io(self._get_cached, key, ttl_seconds)
+        if isinstance(cached, dict):
+            return cached
+        failure = await self._cache_io(self._cached_failure, url)
+        if failure is not None:
+            raise failure
+        self._require_network(url)
+        return await self._flights.do(key, lambda: self._fetch_fields(url, key, paths))
+
+    async def get_parsed_text(
+        self,
+        url: str,
+        key: str,
+        parse: Callable[[str], dict[str, Any]],
+        *,
+        ttl_seconds: int | None = None,
+    ) -> dict[str, Any]:
+        ttl_seconds = self._ttl_for(url, ttl_seconds)
+        cached = await self._cache_io(self._get_cached, key, ttl_seconds)
+        if isinstance(cached, dict):
+            return cached
+        return await self._flights.do(key, lambda: self._parse_text(url, key, parse, ttl_seconds))
+
+    async def _cache_io(self, call: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """Run a response-cache call, in a worker thread when it can reach the disk tier."""
+
+        if self.cache is None or not self.cache.persistent:
+            return call(*args, **kwargs)
+        return await asyncio.to_thread(call, *args, **kwargs)
+
+    async def _load(
+        self, url: str, ttl_seconds: int, kind: type[T], fetch: Callable[[], Awaitable[T]]
+    ) -> T:
+        stale = await self._cache_io(
+            self._stale_value, url, kind, ttl_seconds, self.settings.stale_while_revalidate_seconds
+        )
+        if stale is not None:
+            self._refresh_in_background(url, fetch)
+            value: T = stale
+            return value
+        try:
+            failure = await self._cache_io(self._cached_failure, url)
+            if failure is not None:
+                raise failure
+            self._require_network(url)
+            return await fetch()
+        except MetadataFetchError:
+            stale = await self._cache_io(
+                self._stale_value, url, kind, ttl_seconds, self.settings.stale_if_error_seconds
+            )
+            if stale is None:
+                raise
+            value = stale
+            return value
+
+    def _refresh_in_background(self, url: str, fetch: Callable[[], Awaitable[Any]]) -> None:
+        if self.settings.no_network or url in self._refreshes:
+            return
+        task = asyncio.ensure_future(self._refresh(fetch))
+        self._refreshes[url] = task
+        task.add_done_callback(lambda _: self._refreshes.pop(url, None))
+
+    async def _refresh(self, fetch: Callable[[], Awaitable[Any]]) -> None:
+        with suppress(MetadataFetchError):
+            await fetch()
+
+    async def url_exists(self, url: str, *, ttl_seconds: int = RELEASE_TTL_SECONDS) -> bool:
+        cached = await self._cache_io(self._get_cached, f"exists:{url}", ttl_seconds)
+        if isinstance(cached, bool):
+            return cached
+        self._require_network(url)
+        require_web_url(url)
+        return await self._flights.do(f"exists:{url}", lambda: self._check_url_exists(url))
+
+    async def _fetch_json(self, url: str) -> dict[str, Any]:
+        revalidation = await self._cache_io(self._revalidation, url, dict)
+        response = await self._get_remembering_failure(url, revalidation)
+        if revalidation is not None and response.status_code == NOT_MODIFIED:
+            data: dict[str, Any] = revalidation[0]
+        else:
+            data = json_object(url, response)
+        await self._cache_io(self._store_response, url, data, response)
+        return data
+
+    async def _fetch_text(self, url: str) -> str:
+        revalidation = await self._cache_io(self._revalidation, url, str)
+        response = await self._get_remembering_failure(url, revalidation)
+        if revalidation is not None and response.status_code == NOT_MODIFIED:
+            text: str = revalidation[0]
+        else:
+            text = response.text
+        await self._cache_io(self._store_response, url, text, response)
+        return text
+
+    async def _get_remembering_failure(
+        self, url: str, revalidation: tuple[Any, dict[str, str]] | None = None
+    ) -> httpx.Response:
+        try:
+            return await self._get(url, headers=revalidation[1] if revalidation else None)
+        except MetadataFetchError as exc:
+            await self._cache_io(self._remember_failure, url, exc)
+            raise
+
+    async def _parse_text(
+        self, url: str, key: str, parse: Callable[[str], dict[str, Any]], ttl_seconds: int
+    ) -> dict[str, Any]:
+        with response_cache_writes_disabled():
+            text = await self.get_text(url, ttl_seconds=ttl_seconds)
+        value = parse(text)
+        await self._cache_io(self.store_summary, key, value)
+        return value
+
+    async def _fetch_fields(
+        self, url: str, key: str, paths: tuple[JsonPath, ...]
+    ) -> dict[str, Any]:
+        try:
+            response = await self._get(url, stream=True)
+        except MetadataFetchError as exc:
+            await self._cache_io(self._remember_failure, url, exc)
+            raise
+        extractor = JsonFieldExtractor(paths)
+        try:
+            async for chunk in response.aiter_bytes():
+                extractor.feed(chunk)
+            data = extractor.close()
+        except (httpx.HTTPError, ValueError) as exc:
+            raise MetadataFetchError(f"Invalid JSON response from {url}") from exc
+        finally:
+            await response.aclose()
+        await self._cache_io(self._set_cached, key, data)
+        return data
+
+    async def _check_url_exists(self, url: str) -> bool:
+        exists = await self._url_exists_uncached(url)
+        await self._cache_io(self._set_cached, f"exists:{url}", exists)
+        return exists
+
+    async def _send(
+        self, send: Callable[[str], Awaitable[httpx.Response]], url: str
+    ) -> httpx.Response:
+        throttle = self._throttle(url)
+        if throttle is None:
+            return await send(url)
+        await throttle.acquire_async()
+        started = time.monotonic()
+        status_code: int | None = None
+        try:
+            response = await send(url)
+            status_code = response.status_code
+            return response
+        finally:
+            throttle.release(status_code, time.monotonic() - started)
+
+    async def _get(
+        self, url: str, *, headers: dict[str, str] | None = None, stream: bool = False
+    ) -> httpx.Response:
+        require_web_url(url)
+        send: Callable[[str], Awaitable[httpx.Response]] = (
+            self._client.get if headers is None else partial(self._client.get, headers=headers)
+        )
+        if stream:
+            send = self._open_stream
+        attempt = 0
+        while True:
+            try:
+                response = await self._send(send, url)
+                if headers is not None and response.status_code == NOT_MODIFIED:
+                    return response
+                try:
+                    response.raise_for_status()
+                except httpx.HTTPStatusError:
+                    if stream:
+                        await response.aclose()
+                    raise
+                return response
+            except httpx.HTTPError as exc:
+                delay = self._retry_delay(attempt, exc)
+                if delay is None:
+                    raise fetch_failed(url, exc) from exc
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _open_stream(self, url: str) -> httpx.Response:
+        return await self._client.send(self._client.build_request("GET", url), stream=True)
+
+    async def _url_exists_uncached(self, url: str) -> bool:
+        try:
+            response = await self._send(self._client.head, url)
+            if response.status_code == 405 or response.status_code >= 400:
+                response = await self._send(self._client.get, url)
+            return 200 <= response.status_code < 400
+        except httpx.HTTPError as exc:
+            raise MetadataFetchError(f"Failed to verify URL {url}: {exc}") from exc
@@ -1,108 +1,514 @@
-"""HTTP client with retries, timeouts, and resolver cache support."""
+"""HTTP client with retries, timeouts, pooling, and resolver cache support."""
 
 from __future__ import annotations
 
+import contextvars
+import threading
 import time
-from typing import Any
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import httpx
 
 from purl2repo.errors import MetadataFetchError
-from purl2repo.http.retry import backoff_seconds
+from purl2repo.http.jsonstream import (
+    JsonFieldExtractor,
+    JsonPath,
+    path_key,
+    streaming_available,
+)
+from purl2repo.http.ratelimit import DEFAULT_HOST_LIMITS, HostRateLimiter, HostThrottle
+from purl2repo.http.retry import RetryBudget, RetryPolicy, is_permanent_status
+from purl2repo.http.singleflight import SingleFlight
+from purl2repo.http.ttl import DEFAULT_TTL_RULES, TtlPolicy
 from purl2repo.models import ResolverSettings
-from purl2repo.resolution.cache import ResponseCache
+
+if TYPE_CHECKING:
+    from purl2repo.resolution.cache import ResponseCache
+
+T = TypeVar("T")
 
 REGISTRY_TTL_SECONDS = 3600
 RELEASE_TTL_SECONDS = 900
+NEGATIVE_CACHE_PREFIX = "negative:"
+FIELDS_PREFIX = "fields:"
+REFRESH_WORKERS = 2
+VALIDATORS_PREFIX = "validators:"
+NOT_MODIFIED = 304
+
+_store_responses: ContextVar[bool] = ContextVar("purl2repo_store_responses", default=True)
+_stale_responses: ContextVar[list[str] | None] = ContextVar(
+    "purl2repo_stale_responses", default=None
+)
+_requested_ttls: ContextVar[list[int] | None] = ContextVar("purl2repo_requested_ttls", default=None)
+
+
+@contextmanager
+def response_cache_writes_disabled() -> Iterator[None]:
+    """Serve cached responses but do not store new ones within this context."""
+
+    token = _store_responses.set(False)
+    try:
+        yield
+    finally:
+        _store_responses.reset(token)
+
 
+@contextmanager
+def served_stale_responses() -> Iterator[list[str]]:
+    """Collect the URLs answered from expired cache entries within this context."""
+
+    served: list[str] = []
+    token = _stale_responses.set(served)
+    try:
+        yield served
+    finally:
+        _stale_responses.reset(token)
+
+
+@contextmanager
+def requested_ttls() -> Iterator[list[int]]:
+    """Collect the cache lifetimes chosen for the documents requested within this context."""
+
+    ttls: list[int] = []
+    token = _requested_ttls.set(ttls)
+    try:
+        yield ttls
+    finally:
+        _requested_ttls.reset(token)
+
+
+class BaseHttpClient:
+    """Cache and request policy shared by the blocking and asyncio clients."""
 
-class HttpClient:
     def __init__(self, settings: ResolverSettings, cache: ResponseCache | None = None) -> None:
         self.settings = settings
         self.cache = cache if settings.use_cache else None
-        self._client = httpx.Client(
-            timeout=settings.timeout,
-            follow_redirects=True,
-            headers={"User-Agent": settings.user_agent},
+        self.retry_policy = settings.retry_policy or RetryPolicy()
+        self.retry_budget = RetryBudget(settings.retry_budget)
+        self.ttl_policy = TtlPolicy((*(settings.ttl_rules or ()), *DEFAULT_TTL_RULES))
+        self.stream_json = settings.stream_json and streaming_available()
+        self.rate_limiter = (
+            HostRateLimiter({**DEFAULT_HOST_LIMITS, **(settings.host_limits or {})})
+            if settings.rate_limiting
+            else None
+        )
+
+    def _client_options(self) -> dict[str, Any]:
+        return {
+            "timeout": self.settings.timeout,
+            "follow_redirects": True,
+            "headers": {"User-Agent": self.settings.user_agent},
+            "limits": httpx.Limits(
+                max_connections=self.settings.max_connections,
+                max_keepalive_connections=self.settings.max_keepalive_connections,
+            ),
+        }
+
+    def _require_network(self, url: str) -> None:
+        if self.settings.no_network:
+            raise MetadataFetchError(f"Network disabled and no cached response for {url}")
+
+    def _ttl_for(self, url: str, ttl_seconds: int | None) -> int:
+        """An explicit ``ttl_seconds`` wins; otherwise the TTL policy decides."""
+
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_policy.ttl_for(url, REGISTRY_TTL_SECONDS)
+        ttls = _requested_ttls.get()
+        if ttls is not None:
+            ttls.append(ttl_seconds)
+        return ttl_seconds
+
+    def _get_cached(self, url: str, ttl_seconds: int, *, revalidatable: bool = False) -> Any | None:
+        if not self.cache:
+            return None
+        return self.cache.get(url, ttl_seconds, keep_expired=revalidatable)
+
+    def _set_cached(self, url: str, value: Any) -> None:
+        if self.cache and _store_responses.get():
+            self.cache.set(url, value)
+
+    def cached_summary(self, key: str, url: str) -> dict[str, Any] | None:
+        """Return the summary stored under ``key`` while ``url``'s TTL has not passed."""
+
+        cached = self._get_cached(key, self._ttl_for(url, None))
+        return cached if isinstance(cached, dict) else None
+
+    def store_summary(self, key: str, value: dict[str, Any]) -> None:
+        """Store a summary derived from a response in place of the response itself.
+
+        Like negative entries, summaries are kept even where response writes are
+        disabled: the raw document is never stored, so the summary is all there is.
+        """
+
+        if self.cache:
+            self.cache.set(key, value)
+
+    def _revalidation(self, url: str, kind: type) -> tuple[Any, dict[str, str]] | None:
+        """Return the expired cached value and the conditional headers that revalidate it."""
+
+        if not self.cache:
+            return None
+        stale = self.cache.get_entry(url)
+        validators = self.cache.get_entry(f"{VALIDATORS_PREFIX}{url}")
+        if stale is None or not isinstance(stale[1], kind) or validators is None:
+            return None
+        stored = validators[1] if isinstance(validators[1], dict) else {}
+        headers = {
+            header: stored[name]
+            for name, header in (("etag", "If-None-Match"), ("last_modified", "If-Modified-Since"))
+            if isinstance(stored.get(name), str)
+        }
+        return (stale[1], headers) if headers else None
+
+    def _store_response(self, url: str, value: Any, response: httpx.Response) -> None:
+        """Cache ``value`` with the response's validators; a 304 just renews the entry."""
+
+        self._set_cached(url, value)
+        headers = getattr(response, "headers", {})
+        validators = {
+            name: headers[header]
+            for name, header in (("etag", "ETag"), ("last_modified", "Last-Modified"))
+            if header in headers
+        }
+        if validators:
+            self._set_cached(f"{VALIDATORS_PREFIX}{url}", validators)
+
+    def _throttle(self, url: str) -> HostThrottle | None:
+        return self.rate_limiter.throttle(url) if self.rate_limiter else None
+
+    def _retry_delay(self, attempt: int, error: httpx.HTTPError) -> float | None:
+        """Seconds to sleep before the next attempt, or ``None`` to stop retrying."""
+
+        delay = self.retry_policy.delay_seconds(attempt, error)
+        if delay is None or not self.retry_budget.try_spend():
+            return None
+        return delay
+
+    def _stale_value(
+        self, url: str, kind: type, ttl_seconds: int, max_staleness: int | None
+    ) -> Any | None:
+        """Return an expired cached value no more than ``max_staleness`` seconds past expiry."""
+
+        if max_staleness is None or not self.cache:
+            return None
+        entry = self.cache.get_entry(url)
+        if entry is None or not isinstance(entry[1], kind):
+            return None
+        if time.time() - entry[0] > ttl_seconds + max_staleness:
+            return None
+        served = _stale_responses.get()
+        if served is not None:
+            served.append(url)
+        return entry[1]
+
+    def _cached_failure(self, url: str) -> MetadataFetchError | None:
+        ttl_seconds = self.settings.negative_cache_ttl_seconds
+        if ttl_seconds is None:
+            return None
+        cached = self._get_cached(f"{NEGATIVE_CACHE_PREFIX}{url}", ttl_seconds)
+        if isinstance(cached, dict) and isinstance(cached.get("error"), str):
+            return MetadataFetchError(cached["error"])
+        return None
+
+    def _remember_failure(self, url: str, error: MetadataFetchError) -> None:
+        """Cache permanent HTTP failures so missing packages are not fetched again."""
+
+        cause = error.__cause__
+        if (
+            self.cache is None
+            or self.settings.negative_cache_ttl_seconds is None
+            or not isinstance(cause, httpx.HTTPStatusError)
+            or not is_permanent_status(cause.response.status_code)
+        ):
+            return
+        # Stored even while response writes are suppressed: the entry is tiny and
+        # is what stops repeated lookups of private or mistyped package names.
+        self.cache.set(
+            f"{NEGATIVE_CACHE_PREFIX}{url}",
+            {"status": cause.response.status_code, "error": str(error)},
         )
 
+
+class HttpClient(BaseHttpClient):
+    def __init__(
+        self,
+        settings: ResolverSettings,
+        cache: ResponseCache | None = None,
+        *,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        super().__init__(settings, cache)
+        self._client = httpx.Client(**self._client_options(), transport=transport)
+        self._flights = SingleFlight()
+        self._refresher: ThreadPoolExecutor | None = None
+        self._refreshing: set[str] = set()
+        self._refresh_lock = threading.Lock()
+
     def close(self) -> None:
+        if self._refresher is not None:
+            self._refresher.shutdown(wait=True, cancel_futures=True)
         self._client.close()
 
-    def get_json(self, url: str, *, ttl_seconds: int = REGISTRY_TTL_SECONDS) -> dict[str, Any]:
-        cached = self._get_cached(url, ttl_seconds)
+    def get_json(self, url: str, *, ttl_seconds: int | None = None) -> dict[str, Any]:
+        ttl_seconds = self._ttl_for(url, ttl_seconds)
+        cached = self._get_cached(url, ttl_seconds, revalidatable=True)
         if isinstance(cached, dict):
             return cached
-        if self.settings.no_network:
-            raise MetadataFetchError(f"Network disabled and no cached response for {url}")
-        response = self._get(url)
-        try:
-            data = response.json()
-        except ValueError as exc:
-            raise MetadataFetchError(f"Invalid JSON response from {url}") from exc
-        if not isinstance(data, dict):
-            raise MetadataFetchError(f"Expected JSON object response from {url}")
-        self._set_cached(url, data)
-        return data
+        return self._load(
+            url,
+            ttl_seconds,
+            dict,
+            lambda: self._flights.do(f"json:{url}", lambda: self._fetch_json(url)),
+        )
 
-    def get_text(self, url: str, *, ttl_seconds: int = REGISTRY_TTL_SECONDS) -> str:
-        cached = self._get_cached(url, ttl_seconds)
+    def get_text(self, url: str, *, ttl_seconds: int | None = None) -> str:
+        ttl_seconds = self._ttl_for(url, ttl_seconds)
+        cached = self._get_cached(url, ttl_seconds, revalidatable=True)
         if isinstance(cached, str):
             return cached
+        return self._load(
+            url,
+            ttl_seconds,
+            str,
+            lambda: self._flights.do(f"text:{url}", lambda: self._fetch_text(url)),
+        )
+
+    def get_json_fields(
+        self, url: str, paths: tuple[JsonPath, ...], *, ttl_seconds: int | None = None
+    ) -> dict[str, Any]:
+        """Return ``paths`` of a JSON document, streaming it when ``stream_json`` is enabled.
+
+        Without streaming (or without ``ijson``) this is :meth:`get_json`, so callers
+        must read the result the same way either way.
+        """
+
+        if not self.stream_json:
+            return self.get_json(url, ttl_seconds=ttl_seconds)
+        ttl_seconds = self._ttl_for(url, ttl_seconds)
+        key = f"{FIELDS_PREFIX}{path_key(paths)}:{url}"
+        cached = self._get_cached(key, ttl_seconds)
+        if isinstance(cached, dict):
+            return cached
+        failure = self._cached_failure(url)
+        if failure is not None:
+            raise failure
+        self._require_network(url)
+        return self._flights.do(key, lambda: self._fetch_fields(url, key, paths))
+
+    def get_parsed_text(
+        self,
+        url: str,
+        key: str,
+        parse: Callable[[str], dict[str, Any]],
+        *,
+        ttl_seconds: int | None = None,
+    ) -> dict[str, Any]:
+        """Return ``parse(get_text(url))``, caching the parsed value under ``key``.
+
+        Documents that many packages share are then parsed once per cache rather
+        than once per resolution.
+        """
+
+        ttl_seconds = self._ttl_for(url, ttl_seconds)
+        cached = self._get_cached(key, ttl_seconds)
+        if isinstance(cached, dict):
+            return cached
+        return self._flights.do(key, lambda: self._parse_text(url, key, parse, ttl_seconds))
+
+    def _load(self, url: str, ttl_seconds: int, kind: type[T], fetch: Callable[[], T]) -> T:
+        """Fetch a cache miss, serving an expired entry instead where the stale settings allow."""
+
+        stale = self._stale_value(
+            url, kind, ttl_seconds, self.settings.stale_while_revalidate_seconds
+        )
+        if stale is not None:
+            self._refresh_in_background(url, fetch)
+            value: T = stale
+            return value
+        try:
+            failure = self._cached_failure(url)
+            if failure is not None:
+                raise failure
+            self._require_network(url)
+            return fetch()
+        except MetadataFetchError:
+            stale = self._stale_value(url, kind, ttl_seconds, self.settings.stale_if_error_seconds)
+            if stale is None:
+                raise
+            value = stale
+            return value
+
+    def _refresh_in_background(self, url: str, fetch: Callable[[], Any]) -> None:
         if self.settings.no_network:
-            raise MetadataFetchError(f"Network disabled and no cached response for {url}")
-        response = self._get(url)
-        self._set_cached(url, response.text)
-        return response.text
+            return
+        with self._refresh_lock:
+            if url in self._refreshing:
+                return
+            self._refreshing.add(url)
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(
+                    max_workers=REFRESH_WORKERS, thread_name_prefix="purl2repo-refresh"
+                )
+        self._refresher.submit(contextvars.copy_context().run, self._refresh, url, fetch)
+
+    def _refresh(self, url: str, fetch: Callable[[], Any]) -> None:
+        try:
+            fetch()
+        except MetadataFetchError:
+            pass
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(url)
 
     def url_exists(self, url: str, *, ttl_seconds: int = RELEASE_TTL_SECONDS) -> bool:
         cached = self._get_cached(f"exists:{url}", ttl_seconds)
         if isinstance(cached, bool):
             return cached
-        if self.settings.no_network:
-            raise MetadataFetchError(f"Network disabled and no cached response for {url}")
-        if not url.startswith(("https://", "http://")):
-            raise MetadataFetchError(f"Refusing to fetch non-web URL: {url}")
+        self._require_network(url)
+        require_web_url(url)
+        return self._flights.do(f"exists:{url}", lambda: self._check_url_exists(url))
 
+    def _fetch_json(self, url: str) -> dict[str, Any]:
+        revalidation = self._revalidation(url, dict)
+        response = self._get_remembering_failure(url, revalidation)
+        if revalidation is not None and response.status_code == NOT_MODIFIED:
+            data: dict[str, Any] = revalidation[0]
+        else:
+            data = json_object(url, response)
+        self._store_response(url, data, response)
+        return data
+
+    def _fetch_text(self, url: str) -> str:
+        revalidation = self._revalidation(url, str)
+        response = self._get_remembering_failure(url, revalidation)
+        if revalidation is not None and response.status_code == NOT_MODIFIED:
+            text: str = revalidation[0]
+        else:
+            text = response.text
+        self._store_response(url, text, response)
+        return text
+
+    def _get_remembering_failure(
+        self, url: str, revalidation: tuple[Any, dict[str, str]] | None = None
+    ) -> httpx.Response:
+        try:
+            return self._get(url, headers=revalidation[1] if revalidation else None)
+        except MetadataFetchError as exc:
+            self._remember_failure(url, exc)
+            raise
+
+    def _parse_text(
+        self, url: str, key: str, parse: Callable[[str], dict[str, Any]], ttl_seconds: int
+    ) -> dict[str, Any]:
+        with response_cache_writes_disabled():
+            text = self.get_text(url, ttl_seconds=ttl_seconds)
+        value = parse(text)
+        self.store_summary(key, value)
+        return value
+
+    def _fetch_fields(self, url: str, key: str, paths: tuple[JsonPath, ...]) -> dict[str, Any]:
+        try:
+            response = self._get(url, stream=True)
+        except MetadataFetchError as exc:
+            self._remember_failure(url, exc)
+            raise
+        extractor = JsonFieldExtractor(paths)
+        try:
+            for chunk in response.iter_bytes():
+                extractor.feed(chunk)
+            data = extractor.close()
+        except (httpx.HTTPError, ValueError) as exc:
+            raise MetadataFetchError(f"Invalid JSON response from {url}") from exc
+        finally:
+            response.close()
+        self._set_cached(key, data)
+        return data
+
+    def _check_url_exists(self, url: str) -> bool:
         exists = self._url_exists_uncached(url)
         self._set_cached(f"exists:{url}", exists)
         return exists
 
-    def _get(self, url: str) -> httpx.Response:
-        if not url.startswith(("https://", "http://")):
-            raise MetadataFetchError(f"Refusing to fetch non-web URL: {url}")
-        last_error: Exception | None = None
-        for attempt in range(3):
+    def _send(self, send: Callable[[str], httpx.Response], url: str) -> httpx.Response:
+        throttle = self._throttle(url)
+        if throttle is None:
+            return send(url)
+        throttle.acquire()
+        started = time.monotonic()
+        status_code: int | None = None
+        try:
+            response = send(url)
+            status_code = response.status_code
+            return response
+        finally:
+            throttle.release(status_code, time.monotonic() - started)
+
+    def _get(
+        self, url: str, *, headers: dict[str, str] | None = None, stream: bool = False
+    ) -> httpx.Response:
+        """GET ``url`` with retries; with conditional ``headers`` a 304 is returned as is.
+
+        With ``stream`` the body is left unread and the caller must close the response.
+        """
+
+        require_web_url(url)
+        send: Callable[[str], httpx.Response] = (
+            self._client.get if headers is None else partial(self._client.get, headers=headers)
+        )
+        if stream:
+            send = self._open_stream
+        attempt = 0
+        while True:
             try:
-                response = self._client.get(url)
-                if response.status_code in {429, 500, 502, 503, 504} and attempt < 2:
-                    time.sleep(backoff_seconds(attempt))
-                    continue
-                response.raise_for_status()
+                response = self._send(send, url)
+                if headers is not None and response.status_code == NOT_MODIFIED:
+                    return response
+                try:
+                    response.raise_for_status()
+                except httpx.HTTPStatusError:
+                    if stream:
+                        response.close()
+                    raise
                 return response
             except httpx.HTTPError as exc:
-                last_error = exc
-                if attempt < 2:
-                    time.sleep(backoff_seconds(attempt))
-                    continue
-        raise MetadataFetchError(
-            f"Failed to fetch metadata from {url}: {last_error}"
-        ) from last_error
+                delay = self._retry_delay(attempt, exc)
+                if delay is None:
+                    raise fetch_failed(url, exc) from exc
+                time.sleep(delay)
+                attempt += 1
+
+    def _open_stream(self, url: str) -> httpx.Response:
+        return self._client.send(self._client.build_request("GET", url), stream=True)
 
     def _url_exists_uncached(self, url: str) -> bool:
         try:
-            response = self._client.head(url)
+            response = self._send(self._client.head, url)
             if response.status_code == 405 or response.status_code >= 400:
-                response = self._client.get(url)
+                response = self._send(self._client.get, url)
             return 200 <= response.status_code < 400
         except httpx.HTTPError as exc:
             raise MetadataFetchError(f"Failed to verify URL {url}: {exc}") from exc
 
-    def _get_cached(self, url: str, ttl_seconds: int) -> Any | None:
-        if not self.cache:
-            return None
-        return self.cache.get(url, ttl_seconds)
 
-    def _set_cached(self, url: str, value: Any) -> None:
-        if self.cache:
-            self.cache.set(url, value)
+def require_web_url(url: str) -> None:
+    if not url.startswith(("https://", "http://")):
+        raise MetadataFetchError(f"Refusing to fetch non-web URL: {url}")
+
+
+def fetch_failed(url: str, last_error: Exception) -> MetadataFetchError:
+    return MetadataFetchError(f"Failed to fetch metadata from {url}: {last_error}")
+
+
+def json_object(url: str, response: httpx.Response) -> dict[str, Any]:
+    try:
+        data = response.json()
+    except ValueError as exc:
+        raise MetadataFetchError(f"Invalid JSON response from {url}") from exc
+    if not isinstance(data, dict):
+        raise MetadataFetchError(f"Expected JSON object response from {url}")
+    return data
@@ -0,0 +1,122 @@
+"""Incremental extraction of selected fields from large JSON documents.
+
+Requires the optional ``ijson`` package (``pip install purl2repo[stream]``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from importlib.util import find_spec
+from typing import Any
+
+JsonPath = tuple[str, ...]
+
+# ijson names every array element "item" in its prefixes; paths use the same word.
+ARRAY_ITEM = "item"
+_CONTAINER_STARTS = {"start_map": dict, "start_array": list}
+_CONTAINER_ENDS = {"end_map", "end_array"}
+
+
+def streaming_available() -> bool:
+    return find_spec("ijson") is not None
+
+
+def path_key(paths: Iterable[JsonPath]) -> str:
+    """Stable text form of a path set, used in cache keys."""
+
+    return "|".join(sorted(".".join(path) for path in paths))
+
+
+class JsonFieldExtractor:
+    """Parse JSON bytes as they arrive and keep only the values at ``paths``.
+
+    The result has the same shape as the full document restricted to the requested
+    paths; arrays on the way to a path keep one (possibly empty) object per element.
+    Everything else is parsed and dropped without being built into Python objects.
+    """
+
+    def __init__(self, paths: Iterable[JsonPath]) -> None:
+        import ijson
+
+        paths = list(paths)
+        self._ijson = ijson
+        self._wanted = {".".join(path) for path in paths}
+        self._ancestors = {".".join(path[:depth]) for path in paths for depth in range(len(path))}
+        self._events: list[tuple[str, str, Any]] = ijson.sendable_list()
+        self._parser = ijson.parse_coro(self._events, use_float=True)
+        self._root: dict[str, Any] = {}
+        self._stack: list[tuple[Any, str | None]] = []
+        self._builder: Any = None
+        self._builder_depth = 0
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse ``chunk``; malformed JSON raises :class:`ValueError`."""
+
+        try:
+            self._parser.send(chunk)
+        except self._ijson.JSONError as exc:
+            raise ValueError(str(exc)) from exc
+        self._drain()
+
+    def close(self) -> dict[str, Any]:
+        try:
+            self._parser.close()
+        except self._ijson.JSONError as exc:
+            raise ValueError(str(exc)) from exc
+        self._drain()
+        return self._root
+
+    def _drain(self) -> None:
+        for prefix, event, value in self._events:
+            self._handle(prefix, event, value)
+        del self._events[:]
+
+    def _handle(self, prefix: str, event: str, value: Any) -> None:
+        if self._builder is not None:
+            self._builder.event(event, value)
+            if event in _CONTAINER_STARTS:
+                self._builder_depth += 1
+            elif event in _CONTAINER_ENDS:
+                self._builder_depth -= 1
+            if self._builder_depth == 0:
+                self._attach(self._builder.value)
+                self._builder = None
+            return
+        if event == "map_key":
+            if self._stack:
+                container, _ = self._stack[-1]
+                self._stack[-1] = (container, value)
+            return
+        if event in _CONTAINER_ENDS:
+            self._stack.pop()
+            return
+        if not self._stack and event == "start_map":
+            self._stack.append((self._root, None))
+            return
+        if prefix in self._wanted and self._wants_children():
+            if event in _CONTAINER_STARTS:
+                self._builder = self._ijson.ObjectBuilder()
+                self._builder.event(event, value)
+                self._builder_depth = 1
+            else:
+                self._attach(value)
+            return
+        if event in _CONTAINER_STARTS:
+            container = (
+                _CONTAINER_STARTS[event]()
+                if prefix in self._ancestors and self._wants_children()
+                else None
+            )
+            if container is not None:
+                self._attach(container)
+            self._stack.append((container, None))
+
+    def _wants_children(self) -> bool:
+        return bool(self._stack) and self._stack[-1][0] is not None
+
+    def _attach(self, value: Any) -> None:
+        container, key = self._stack[-1]
+        if isinstance(container, list):
+            container.append(value)
+        elif key is not None:
+            container[key] = value
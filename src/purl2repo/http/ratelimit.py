@@ -0,0 +1,181 @@
+"""Per-host token-bucket rate limiting with AIMD adaptive concurrency."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections.abc import Callable, Mapping
+from contextlib import suppress
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+DECREASE_FACTOR = 0.5
+DECREASE_COOLDOWN_SECONDS = 1.0
+LATENCY_SPIKE_FACTOR = 3.0
+LATENCY_SMOOTHING = 0.2
+LATENCY_WARMUP_SAMPLES = 5
+DEFAULT_HOST_KEY = "*"
+
+
+@dataclass(frozen=True)
+class HostLimit:
+    """Sustained request rate, burst size, and concurrency ceiling for one host."""
+
+    rate: float
+    burst: int
+    max_concurrency: int
+    min_concurrency: int = 1
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+        if not 1 <= self.min_concurrency <= self.max_concurrency:
+            raise ValueError("concurrency bounds must satisfy 1 <= min <= max")
+
+
+DEFAULT_HOST_LIMITS: dict[str, HostLimit] = {
+    "registry.npmjs.org": HostLimit(rate=50.0, burst=100, max_concurrency=32),
+    "pypi.org": HostLimit(rate=50.0, burst=100, max_concurrency=32),
+    "api.nuget.org": HostLimit(rate=50.0, burst=100, max_concurrency=32),
+    "proxy.golang.org": HostLimit(rate=50.0, burst=100, max_concurrency=32),
+    "repo1.maven.org": HostLimit(rate=20.0, burst=40, max_concurrency=16),
+    "api.deps.dev": HostLimit(rate=20.0, burst=40, max_concurrency=16),
+    "www.nuget.org": HostLimit(rate=10.0, burst=20, max_concurrency=8),
+    "github.com": HostLimit(rate=10.0, burst=20, max_concurrency=8),
+    "gitlab.com": HostLimit(rate=5.0, burst=10, max_concurrency=4),
+    # crates.io asks API clients for at most one request per second.
+    "crates.io": HostLimit(rate=1.0, burst=5, max_concurrency=2),
+}
+
+
+class HostThrottle:
+    """Token bucket plus an AIMD concurrency window for a single host.
+
+    The window halves (at most once per cooldown) on 429s, 5xx responses,
+    transport errors, and latency spikes, and grows by roughly one slot per
+    window of healthy responses up to ``max_concurrency``.
+    """
+
+    def __init__(self, limit: HostLimit, clock: Callable[[], float] = time.monotonic) -> None:
+        self.limit = limit
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._tokens = float(limit.burst)
+        self._refilled_at = clock()
+        self._window = float(limit.max_concurrency)
+        self._in_flight = 0
+        self._latency: float | None = None
+        self._samples = 0
+        self._decreased_at = -math.inf
+        # Futures of event-loop callers waiting for a slot; released with the condition.
+        self._async_waiters: list[asyncio.Future[None]] = []
+
+    @property
+    def concurrency(self) -> int:
+        return max(self.limit.min_concurrency, int(self._window))
+
+    def acquire(self) -> None:
+        with self._condition:
+            while (delay := self._try_acquire()) != 0.0:
+                self._condition.wait(delay)
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                delay = self._try_acquire()
+                if delay == 0.0:
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append(waiter)
+            try:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(waiter, delay)
+            finally:
+                with self._condition, suppress(ValueError):
+                    self._async_waiters.remove(waiter)
+
+    def release(self, status_code: int | None, elapsed: float) -> None:
+        """Return the slot and adapt the window; ``status_code`` is None for transport errors."""
+
+        with self._condition:
+            self._in_flight -= 1
+            if self._is_congested(status_code, elapsed):
+                now = self._clock()
+                if now - self._decreased_at >= DECREASE_COOLDOWN_SECONDS:
+                    self._decreased_at = now
+                    self._window = max(
+                        float(self.limit.min_concurrency), self._window * DECREASE_FACTOR
+                    )
+            else:
+                self._window = min(
+                    float(self.limit.max_concurrency), self._window + 1.0 / self._window
+                )
+            self._observe_latency(elapsed)
+            self._condition.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+        for waiter in waiters:
+            waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+
+    def _try_acquire(self) -> float | None:
+        """Take a slot and return 0.0, or return how long to wait: None means until a release."""
+
+        now = self._clock()
+        elapsed = max(0.0, now - self._refilled_at)
+        self._tokens = min(float(self.limit.burst), self._tokens + elapsed * self.limit.rate)
+        self._refilled_at = now
+        if self._in_flight >= self.concurrency:
+            return None
+        if self._tokens < 1.0:
+            return (1.0 - self._tokens) / self.limit.rate
+        self._tokens -= 1.0
+        self._in_flight += 1
+        return 0.0
+
+    def _is_congested(self, status_code: int | None, elapsed: float) -> bool:
+        if status_code is None or status_code == 429 or status_code >= 500:
+            return True
+        return (
+            self._latency is not None
+            and self._samples >= LATENCY_WARMUP_SAMPLES
+            and elapsed > self._latency * LATENCY_SPIKE_FACTOR
+        )
+
+    def _observe_latency(self, elapsed: float) -> None:
+        self._samples += 1
+        if self._latency is None:
+            self._latency = elapsed
+        else:
+            self._latency += LATENCY_SMOOTHING * (elapsed - self._latency)
+
+
+def _wake(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class HostRateLimiter:
+    """Hand out one :class:`HostThrottle` per host named in the limit table.
+
+    Hosts missing from the table are not throttled unless a ``"*"`` entry is given.
+    """
+
+    def __init__(self, limits: Mapping[str, HostLimit]) -> None:
+        self._limits = dict(limits)
+        self._throttles: dict[str, HostThrottle] = {}
+        self._lock = threading.Lock()
+
+    def throttle(self, url: str) -> HostThrottle | None:
+        host = (urlsplit(url).hostname or "").lower()
+        limit = self._limits.get(host) or self._limits.get(DEFAULT_HOST_KEY)
+        if limit is None:
+            return None
+        with self._lock:
+            throttle = self._throttles.get(host)
+            if throttle is None:
+                throttle = self._throttles[host] = HostThrottle(limit)
+            return throttle
@@ -1,11 +1,111 @@
-"""Retry timing helpers."""
+"""Retry timing helpers and the status-aware retry policy."""
 
 from __future__ import annotations
 
 import random
+import threading
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+TRANSIENT_CLIENT_ERROR_CODES = frozenset({408, 429})
+RETRY_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
 
 
 def backoff_seconds(attempt: int, base: float = 0.2, jitter: float = 0.1) -> float:
     jitter_value: float = float(random.uniform(0, jitter))
     delay: float = base * (2.0**attempt) + jitter_value
     return delay
+
+
+def is_permanent_status(status_code: int) -> bool:
+    """Client errors other than timeouts and rate limiting will not succeed on retry."""
+
+    return 400 <= status_code < 500 and status_code not in TRANSIENT_CLIENT_ERROR_CODES
+
+
+def retry_after_seconds(value: str | None, *, now: datetime | None = None) -> float | None:
+    """Parse a ``Retry-After`` header given either as delta-seconds or an HTTP date."""
+
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    current = now or datetime.now(UTC)
+    return max(0.0, (when - current).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Decide whether a failed request is retried and how long to wait first.
+
+    Permanent client errors are never retried. A ``Retry-After`` header on 429 and
+    503 responses replaces the exponential backoff; if the server asks for a longer
+    wait than ``max_retry_after_seconds`` the request fails instead of sleeping.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.2
+    backoff_jitter: float = 0.1
+    max_retry_after_seconds: float = 30.0
+    retry_status_codes: frozenset[int] = RETRY_STATUS_CODES
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+    def is_retryable(self, error: httpx.HTTPError) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.retry_status_codes
+        return isinstance(error, httpx.TransportError) and not isinstance(
+            error, httpx.UnsupportedProtocol | httpx.TooManyRedirects
+        )
+
+    def delay_seconds(self, attempt: int, error: httpx.HTTPError) -> float | None:
+        """Seconds to wait before retrying after ``attempt`` failed, or ``None`` to give up."""
+
+        if attempt >= self.max_attempts - 1 or not self.is_retryable(error):
+            return None
+        if (
+            isinstance(error, httpx.HTTPStatusError)
+            and error.response.status_code in RETRY_AFTER_STATUS_CODES
+        ):
+            retry_after = retry_after_seconds(error.response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after_seconds else None
+        return backoff_seconds(attempt, self.backoff_base, self.backoff_jitter)
+
+
+class RetryBudget:
+    """Thread-safe allowance of retries shared by every request a resolver makes.
+
+    ``None`` means unlimited. Once spent, failures are reported after the first
+    attempt so one bad registry cannot stall a long batch run.
+    """
+
+    def __init__(self, retries: int | None) -> None:
+        self._remaining = retries
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int | None:
+        return self._remaining
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._remaining is None:
+                return True
+            if self._remaining <= 0:
+                return False
+            self._remaining -= 1
+            return True
@@ -0,0 +1,80 @@
+"""Cache lifetimes per registry endpoint."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+IMMUTABLE_TTL_SECONDS = 365 * 86400
+LATEST_TTL_SECONDS = 600
+
+
+@dataclass(frozen=True)
+class TtlRule:
+    """Cache lifetime for registry URLs whose full text matches ``pattern``."""
+
+    kind: str
+    pattern: str
+    ttl_seconds: int
+    _regex: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_regex", re.compile(self.pattern))
+
+    def matches(self, url: str) -> bool:
+        return self._regex.fullmatch(url) is not None
+
+
+# Version-pinned documents do not change once published, so they are kept for a
+# year. Documents that track the newest release are kept only briefly. Anything
+# else, such as npm packuments and NuGet registration indexes, uses the caller's
+# default TTL.
+DEFAULT_TTL_RULES: tuple[TtlRule, ...] = (
+    TtlRule("pypi-version", r"https://pypi\.org/pypi/[^/]+/[^/]+/json", IMMUTABLE_TTL_SECONDS),
+    TtlRule(
+        "npm-version",
+        r"https://registry\.npmjs\.org/(@[^/]+/)?[^/@][^/]*/v?\d[^/]*",
+        IMMUTABLE_TTL_SECONDS,
+    ),
+    TtlRule(
+        "crates-version",
+        r"https://crates\.io/api/v1/crates/[^/]+/\d[^/]*",
+        IMMUTABLE_TTL_SECONDS,
+    ),
+    TtlRule(
+        "maven-release-pom",
+        r"https://repo1\.maven\.org/maven2/(?!.*-SNAPSHOT/).+/[^/]+/[^/]+\.pom",
+        IMMUTABLE_TTL_SECONDS,
+    ),
+    TtlRule(
+        "maven-metadata",
+        r"https://repo1\.maven\.org/maven2/.+/maven-metadata\.xml",
+        LATEST_TTL_SECONDS,
+    ),
+    TtlRule(
+        "go-proxy-version",
+        r"https://proxy\.golang\.org/.+/@v/[^/]+\.(info|mod)",
+        IMMUTABLE_TTL_SECONDS,
+    ),
+    TtlRule("go-proxy-latest", r"https://proxy\.golang\.org/.+/@latest", LATEST_TTL_SECONDS),
+    TtlRule(
+        "deps-dev-version",
+        r"https://api\.deps\.dev/v3/systems/[^/]+/packages/[^/]+/versions/[^/]+",
+        IMMUTABLE_TTL_SECONDS,
+    ),
+)
+
+
+class TtlPolicy:
+    """Pick the cache lifetime for a URL from the first matching rule."""
+
+    def __init__(self, rules: Iterable[TtlRule] = DEFAULT_TTL_RULES) -> None:
+        self.rules = tuple(rules)
+
+    def rule_for(self, url: str) -> TtlRule | None:
+        return next((rule for rule in self.rules if rule.matches(url)), None)
+
+    def ttl_for(self, url: str, default: int) -> int:
+        rule = self.rule_for(url)
+        return rule.ttl_seconds if rule else default
@@ -3,7 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from purl2repo.ecosystems.go_imports import RepoRule
+    from purl2repo.http.ratelimit import HostLimit
+    from purl2repo.http.retry import RetryPolicy
+    from purl2repo.http.ttl import TtlRule
 
 JsonDict = dict[str, Any]
 
@@ -118,6 +124,47 @@ class ResolutionResult:
             "metadata_sources": list(self.metadata_sources),
         }
 
+    @classmethod
+    def from_dict(cls, data: JsonDict) -> ResolutionResult:
+        """Rebuild a result from :meth:`to_dict` output."""
+
+        canonical_repository = data.get("canonical_repository")
+        release_link = data.get("release_link")
+        version_reference = data.get("version_reference")
+        return cls(
+            purl=ParsedPurl(**data["purl"]),
+            repository_url=data.get("repository_url"),
+            repository_type=data.get("repository_type"),
+            repository_kind=data.get("repository_kind"),
+            repository_candidates=[
+                RepositoryCandidate(**candidate)
+                for candidate in data.get("repository_candidates", [])
+            ],
+            canonical_repository=(
+                RepositoryRef(**canonical_repository) if canonical_repository else None
+            ),
+            release_link=ReleaseLink(**release_link) if release_link else None,
+            version_reference=ReleaseLink(**version_reference) if version_reference else None,
+            confidence=data.get("confidence", "none"),
+            evidence=list(data.get("evidence", [])),
+            warnings=list(data.get("warnings", [])),
+            metadata_sources=list(data.get("metadata_sources", [])),
+            repository_validated=data.get("repository_validated", False),
+            repository_validation_status=data.get("repository_validation_status", "unknown"),
+        )
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    approximate_bytes: int | None
+
+    def to_dict(self) -> JsonDict:
+        return asdict(self)
+
 
 @dataclass(frozen=True)
 class ResolverSettings:
@@ -131,3 +178,27 @@ class ResolverSettings:
     use_deps_dev_fallback: bool = True
     use_scraper_fallback: bool = True
     user_agent: str = "purl2repo/2.x"
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    cache_backend: str = "json"
+    cache_max_bytes: int | None = None
+    cache_max_age_seconds: int | None = None
+    memory_cache_max_entries: int | None = None
+    memory_cache_max_bytes: int | None = None
+    cache_distilled_metadata: bool = False
+    result_cache_ttl_seconds: int | None = None
+    validation_concurrency: int = 1
+    validation_short_circuit: bool = False
+    release_probe_concurrency: int = 1
+    negative_cache_ttl_seconds: int | None = None
+    retry_policy: RetryPolicy | None = None
+    retry_budget: int | None = None
+    rate_limiting: bool = False
+    host_limits: dict[str, HostLimit] | None = None
+    stale_while_revalidate_seconds: int | None = None
+    stale_if_error_seconds: int | None = None
+    ttl_rules: tuple[TtlRule, ...] | None = None
+    stream_json: bool = False
+    go_import_timeout_seconds: float | None = 2.0
+    go_proxy_roots: tuple[str, ...] | None = None
+    go_import_rules: dict[str, str | RepoRule] | None = None
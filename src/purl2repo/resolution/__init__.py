@@ -1,5 +1,6 @@
 """Resolution pipeline internals."""
 
+from .async_engine import AsyncResolutionEngine
 from .engine import ResolutionEngine
 
-__all__ = ["ResolutionEngine"]
+__all__ = ["AsyncResolutionEngine", "ResolutionEngine"]
@@ -0,0 +1,446 @@
+"""asyncio resolution pipeline orchestration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Iterable
+from itertools import islice
+
+from purl2repo.ecosystems.base import EcosystemResolver, Metadata
+from purl2repo.errors import MetadataFetchError, NoReleaseFoundError
+from purl2repo.hosts.base import HostAdapter
+from purl2repo.http.async_client import AsyncHttpClient
+from purl2repo.http.client import (
+    RELEASE_TTL_SECONDS,
+    requested_ttls,
+    response_cache_writes_disabled,
+    served_stale_responses,
+)
+from purl2repo.models import (
+    ParsedPurl,
+    ReleaseLink,
+    RepositoryCandidate,
+    ResolutionResult,
+    ResolverSettings,
+)
+from purl2repo.resolution import evidence as evidence_messages
+from purl2repo.resolution.deps_dev import fetch_deps_dev_candidates_async
+from purl2repo.resolution.engine import (
+    ARTIFACT_HUB_TYPES,
+    DIRECT_HOST_TYPES,
+    GENERIC_TYPES,
+    REPOSITORY_TTL_SECONDS,
+    RESOLVE_MANY_WINDOW_PER_WORKER,
+    BaseResolutionEngine,
+    DirectTarget,
+    inconclusive_steps,
+)
+from purl2repo.resolution.scraper import AsyncFallbackScraper
+
+
+class AsyncResolutionEngine(BaseResolutionEngine):
+    """Resolution engine whose registry, deps.dev, validation, and probe requests are awaitable."""
+
+    def __init__(self, settings: ResolverSettings) -> None:
+        super().__init__(settings)
+        self.client = AsyncHttpClient(settings, self.cache)
+        self.scraper = AsyncFallbackScraper(self.client)
+
+    async def aclose(self) -> None:
+        for adapter in self._adapters.values():
+            await adapter.aclose()
+        await self.client.aclose()
+        if self.cache:
+            self.cache.close()
+
+    async def resolve(self, purl: str, *, include_release: bool = True) -> ResolutionResult:
+        parsed = self.parse(purl)
+        key = self._result_cache_key(parsed, include_release=include_release)
+        # Cache reads and writes may hit disk, so they run off the event loop.
+        cached = await asyncio.to_thread(self._cached_result, key, parsed)
+        if cached is not None:
+            return cached
+        with served_stale_responses() as stale, inconclusive_steps() as inconclusive:
+            result = await self._resolve_parsed(parsed, include_release=include_release)
+        if stale:
+            return self._with_stale_evidence(result, stale)
+        await asyncio.to_thread(self._store_result, key, result, inconclusive)
+        return result
+
+    async def _resolve_parsed(
+        self, parsed: ParsedPurl, *, include_release: bool
+    ) -> ResolutionResult:
+        if parsed.type in DIRECT_HOST_TYPES:
+            return await self._resolve_direct_host(parsed, include_release=include_release)
+        if parsed.type in ARTIFACT_HUB_TYPES:
+            return await self._resolve_artifact_hub(parsed, include_release=include_release)
+        if parsed.type in GENERIC_TYPES:
+            return await self._resolve_generic(parsed, include_release=include_release)
+
+        target = self._plan_registry(parsed)
+        try:
+            self._record_metadata(target, await self._fetch_metadata(target.adapter, parsed))
+        except MetadataFetchError as exc:
+            if self.settings.strict:
+                raise
+            stopped = self._recover_metadata(target, exc)
+            if stopped is not None:
+                return stopped
+
+        target.candidates = await self._validate_repository_candidates(
+            self._extracted_candidates(target), target.warnings, target.evidence
+        )
+        if self._wants_deps_dev(target):
+            deps_candidates = self._record_deps_dev(
+                target, await fetch_deps_dev_candidates_async(parsed, self.client)
+            )
+            if deps_candidates:
+                target.candidates = await self._validate_repository_candidates(
+                    self._rescored_candidates(target, deps_candidates),
+                    target.warnings,
+                    target.evidence,
+                )
+        if self._wants_scrape(target):
+            try:
+                scraped = await self.scraper.scrape(parsed, self._scrape_pages(target))
+            except MetadataFetchError:
+                if self.settings.strict:
+                    raise
+                scraped = self._scrape_failed(target)
+            scrape_candidates = self._scraped_repository_candidates(target, scraped)
+            if scrape_candidates:
+                target.candidates = await self._validate_repository_candidates(
+                    self._rescored_candidates(target, scrape_candidates),
+                    target.warnings,
+                    target.evidence,
+                )
+        best, confidence = self._select_best(target)
+
+        release_link = None
+        if include_release and self._wants_release(target):
+            release_link = await self._resolve_release_link(
+                adapter=target.adapter,
+                parsed=parsed,
+                repository=best,
+                metadata=target.metadata,
+                host_adapter=self._host_adapter(best.host if best else ""),
+                warnings=target.warnings,
+                evidence=target.evidence,
+            )
+            self._record_release(target, best, release_link)
+        return self._repository_result(target, best, confidence, release_link)
+
+    async def resolve_repository(self, purl: str) -> ResolutionResult:
+        return await self.resolve(purl, include_release=False)
+
+    async def resolve_release(self, purl: str) -> ResolutionResult:
+        result = await self.resolve(purl, include_release=True)
+        if self.settings.strict and result.release_link is None:
+            raise NoReleaseFoundError(f"No release link found for {purl}")
+        return result
+
+    async def resolve_many(
+        self,
+        purls: Iterable[str] | AsyncIterable[str],
+        *,
+        max_concurrency: int | None = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[ResolutionResult | tuple[int, ResolutionResult]]:
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than zero")
+        results = self._resolve_indexed(purls, max_concurrency, ordered=ordered)
+        try:
+            async for index, result in results:
+                yield result if ordered else (index, result)
+        finally:
+            await results.aclose()
+
+    async def _resolve_indexed(
+        self,
+        purls: Iterable[str] | AsyncIterable[str],
+        max_concurrency: int | None,
+        *,
+        ordered: bool,
+    ) -> AsyncGenerator[tuple[int, ResolutionResult], None]:
+        if max_concurrency is None or max_concurrency == 1:
+            index = 0
+            async for purl in _aiter_purls(purls):
+                yield index, await self.resolve(purl)
+                index += 1
+            return
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def resolve_one(purl: str) -> ResolutionResult:
+            async with semaphore:
+                return await self.resolve(purl)
+
+        window = max_concurrency * RESOLVE_MANY_WINDOW_PER_WORKER
+        source = _aiter_purls(purls)
+        in_flight: dict[asyncio.Task[ResolutionResult], int] = {}
+        next_index = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(in_flight) < window:
+                    try:
+                        purl = await anext(source)
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    in_flight[asyncio.create_task(resolve_one(purl))] = next_index
+                    next_index += 1
+                if not in_flight:
+                    return
+                waiting = {next(iter(in_flight))} if ordered else set(in_flight)
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield in_flight.pop(task), task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def _fetch_metadata(self, adapter: EcosystemResolver, parsed: ParsedPurl) -> Metadata:
+        key = self._distilled_metadata_key(parsed)
+        if key is None:
+            return await adapter.fetch_metadata_async(parsed, self.client)
+        cached = await asyncio.to_thread(self._cached_distilled_metadata, key)
+        if cached is not None:
+            return cached
+        with response_cache_writes_disabled(), requested_ttls() as ttls:
+            metadata = await adapter.fetch_metadata_async(parsed, self.client)
+        return await asyncio.to_thread(
+            self._store_distilled_metadata, adapter, parsed, key, metadata, ttls
+        )
+
+    async def _resolve_direct_host(
+        self, parsed: ParsedPurl, *, include_release: bool
+    ) -> ResolutionResult:
+        target = self._plan_direct_host(parsed)
+        if isinstance(target, ResolutionResult):
+            return target
+        release_link = None
+        if include_release:
+            release_link = await self._direct_release_link(target)
+        return await self._direct_result(target, release_link)
+
+    async def _resolve_artifact_hub(
+        self, parsed: ParsedPurl, *, include_release: bool
+    ) -> ResolutionResult:
+        if parsed.type == "huggingface":
+            return await self._resolve_huggingface(parsed, include_release=include_release)
+        return await self._resolve_mlflow(parsed, include_release=include_release)
+
+    async def _resolve_huggingface(
+        self, parsed: ParsedPurl, *, include_release: bool
+    ) -> ResolutionResult:
+        target = self._plan_huggingface(parsed)
+        release_link = None
+        if include_release:
+            if parsed.version:
+                revision_url = f"{target.repository.url}/tree/{parsed.version}"
+                try:
+                    exists = await self.client.url_exists(revision_url)
+                except MetadataFetchError:
+                    if self.settings.strict:
+                        raise
+                    self._huggingface_revision_unverifiable(target)
+                else:
+                    release_link = self._record_huggingface_revision(target, revision_url, exists)
+            else:
+                target.warnings.append(evidence_messages.skipped_release_no_version())
+                target.evidence.append(evidence_messages.skipped_release_no_version())
+        return await self._direct_result(target, release_link)
+
+    async def _resolve_mlflow(
+        self, parsed: ParsedPurl, *, include_release: bool
+    ) -> ResolutionResult:
+        target = self._plan_mlflow(parsed)
+        if isinstance(target, ResolutionResult):
+            return target
+        release_link = self._mlflow_release_link(target) if include_release else None
+        return await self._direct_result(target, release_link)
+
+    async def _resolve_generic(
+        self, parsed: ParsedPurl, *, include_release: bool
+    ) -> ResolutionResult:
+        target = self._plan_generic(parsed)
+        if isinstance(target, ResolutionResult):
+            return target
+        release_link = None
+        if include_release:
+            if parsed.version and target.repository.kind == "vcs":
+                release_link = await self._direct_release_link(target)
+            elif not parsed.version:
+                target.warnings.append(evidence_messages.skipped_release_no_version())
+                target.evidence.append(evidence_messages.skipped_release_no_version())
+        return await self._direct_result(target, release_link)
+
+    async def _resolve_release_link(
+        self,
+        *,
+        adapter: EcosystemResolver,
+        parsed: ParsedPurl,
+        repository: RepositoryCandidate | None,
+        metadata: Metadata,
+        host_adapter: HostAdapter | None,
+        warnings: list[str],
+        evidence: list[str],
+    ) -> ReleaseLink | None:
+        if host_adapter is None or not parsed.version:
+            return None
+        if not self.settings.verify_release_links:
+            return adapter.resolve_release_link(parsed, repository, metadata, host_adapter)
+
+        if repository is None:
+            return None
+        return await self._verify_release_candidates(
+            host_adapter.candidate_release_links(repository.normalized_url, parsed.version),
+            warnings,
+            evidence,
+        )
+
+    async def _direct_release_link(self, target: DirectTarget) -> ReleaseLink | None:
+        parsed = target.parsed
+        if not parsed.version:
+            target.warnings.append(evidence_messages.skipped_release_no_version())
+            target.evidence.append(evidence_messages.skipped_release_no_version())
+            return None
+        host_adapter = self._host_adapter(target.candidate.host)
+        if host_adapter is None:
+            return None
+        if self.settings.verify_release_links:
+            return await self._verify_release_candidates(
+                host_adapter.candidate_release_links(
+                    target.candidate.normalized_url, parsed.version
+                ),
+                target.warnings,
+                target.evidence,
+            )
+        return host_adapter.infer_release_link(target.candidate.normalized_url, parsed.version)
+
+    async def _verify_release_candidates(
+        self,
+        candidates: list[ReleaseLink],
+        warnings: list[str],
+        evidence: list[str],
+    ) -> ReleaseLink | None:
+        verified: ReleaseLink | None = None
+        outcomes = self._probe_outcomes(
+            [candidate.url for candidate in candidates],
+            concurrency=self.settings.release_probe_concurrency,
+            ttl_seconds=RELEASE_TTL_SECONDS,
+        )
+        try:
+            index = 0
+            async for outcome in outcomes:
+                if isinstance(outcome, MetadataFetchError):
+                    if self.settings.strict:
+                        raise outcome
+                    self._release_verification_failed(warnings)
+                    return None
+                if outcome:
+                    verified = candidates[index]
+                    break
+                index += 1
+        finally:
+            await outcomes.aclose()
+        return self._record_release_verification(verified, warnings, evidence)
+
+    async def _direct_result(
+        self, target: DirectTarget, release_link: ReleaseLink | None
+    ) -> ResolutionResult:
+        if release_link:
+            target.evidence.append(evidence_messages.resolved_release())
+        if not await self._repository_url_is_valid(
+            target.repository.url, target.warnings, target.evidence
+        ):
+            return self._direct_invalid(target)
+        return self._direct_success(target, release_link)
+
+    async def _validate_repository_candidates(
+        self,
+        candidates: list[RepositoryCandidate],
+        warnings: list[str],
+        evidence: list[str],
+    ) -> list[RepositoryCandidate]:
+        if not candidates or self._validation_skipped(evidence):
+            return candidates
+        validated: list[RepositoryCandidate] = []
+        outcomes = self._probe_outcomes(
+            [candidate.normalized_url for candidate in candidates],
+            concurrency=self.settings.validation_concurrency,
+            ttl_seconds=REPOSITORY_TTL_SECONDS,
+        )
+        try:
+            index = 0
+            async for outcome in outcomes:
+                kept = self._apply_validation_outcome(
+                    candidates[index], outcome, warnings, evidence
+                )
+                if kept is not None:
+                    validated.append(kept)
+                if self._validation_short_circuits(index, outcome):
+                    validated.extend(self._skip_validation(candidates[1:], evidence))
+                    break
+                index += 1
+        finally:
+            await outcomes.aclose()
+        return validated
+
+    async def _probe_outcomes(
+        self, urls: list[str], *, concurrency: int, ttl_seconds: int
+    ) -> AsyncGenerator[bool | MetadataFetchError, None]:
+        if min(concurrency, len(urls)) <= 1:
+            for url in urls:
+                yield await self._probe_url(url, ttl_seconds)
+            return
+        # Later probes start only as outcomes are consumed, as in the sync engine.
+        pending = iter(urls)
+        tasks = deque(
+            asyncio.create_task(self._probe_url(url, ttl_seconds))
+            for url in islice(pending, concurrency)
+        )
+        try:
+            while tasks:
+                yield await tasks.popleft()
+                for url in islice(pending, 1):
+                    tasks.append(asyncio.create_task(self._probe_url(url, ttl_seconds)))
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _probe_url(self, url: str, ttl_seconds: int) -> bool | MetadataFetchError:
+        try:
+            return await self.client.url_exists(url, ttl_seconds=ttl_seconds)
+        except MetadataFetchError as exc:
+            return exc
+
+    async def _repository_url_is_valid(
+        self,
+        url: str,
+        warnings: list[str],
+        evidence: list[str],
+    ) -> bool:
+        if self._validation_skipped(evidence):
+            return True
+        try:
+            exists = await self.client.url_exists(url, ttl_seconds=REPOSITORY_TTL_SECONDS)
+        except MetadataFetchError:
+            if self.settings.strict:
+                raise
+            self._validation_inconclusive(url, warnings)
+            return True
+        return self._record_url_validation(url, exists, warnings, evidence)
+
+
+async def _aiter_purls(purls: Iterable[str] | AsyncIterable[str]) -> AsyncIterator[str]:
+    if isinstance(purls, AsyncIterable):
+        async for purl in purls:
+            yield purl
+    else:
+        for purl in purls:
+            yield purl
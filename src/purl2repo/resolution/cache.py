@@ -4,28 +4,201 @@ from __future__ import annotations
 
 import hashlib
 import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any
+from typing import Any, Protocol
+
+from purl2repo.models import CacheStats, ResolverSettings
+
+CACHE_BACKENDS = ("json", "sqlite")
+SQLITE_FILENAME = "purl2repo-cache.sqlite3"
+SQLITE_BUSY_TIMEOUT_SECONDS = 30.0
+SQLITE_PRUNE_INTERVAL = 256
+
+logger = logging.getLogger(__name__)
+
+
+class DiskStore(Protocol):
+    """Persistent tier behind the in-memory cache."""
+
+    def load(self, key: str) -> tuple[float, Any] | None: ...
+
+    def save(self, key: str, stored_at: float, value: Any) -> None: ...
+
+    def purge(self, max_age_seconds: float) -> int: ...
+
+    def close(self) -> None: ...
 
 
 class ResponseCache:
-    def __init__(self, cache_dir: str | None = None) -> None:
-        self._memory: dict[str, tuple[float, Any]] = {}
+    """Memory and optional disk cache that is safe to share between worker threads.
+
+    The memory tier is an LRU bounded by ``memory_max_entries`` and an approximate
+    ``memory_max_bytes`` (JSON-encoded size); both default to unbounded. Without a
+    byte cap, structured values are not encoded just to be measured.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | None = None,
+        *,
+        backend: str = "json",
+        max_bytes: int | None = None,
+        max_age_seconds: int | None = None,
+        memory_max_entries: int | None = None,
+        memory_max_bytes: int | None = None,
+    ) -> None:
+        if backend not in CACHE_BACKENDS:
+            names = ", ".join(CACHE_BACKENDS)
+            raise ValueError(f"Unknown cache backend {backend!r}; expected one of: {names}")
+        if max_bytes is not None and backend != "sqlite":
+            raise ValueError("Cache size limits require the sqlite cache backend")
+        self._memory: OrderedDict[str, tuple[float, Any, int]] = OrderedDict()
+        self._memory_max_entries = memory_max_entries
+        self._memory_max_bytes = memory_max_bytes
+        self._memory_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
         self._cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self._store: DiskStore | None = None
         if self._cache_dir:
             self._cache_dir.mkdir(parents=True, exist_ok=True)
+            if backend == "sqlite":
+                self._store = SqliteStore(
+                    self._cache_dir / SQLITE_FILENAME,
+                    max_bytes=max_bytes,
+                    max_age_seconds=max_age_seconds,
+                )
+            else:
+                self._store = JsonFileStore(self._cache_dir)
+            if max_age_seconds is not None:
+                self._store.purge(max_age_seconds)
+
+    @classmethod
+    def from_settings(cls, settings: ResolverSettings) -> ResponseCache:
+        return cls(
+            settings.cache_dir,
+            backend=settings.cache_backend,
+            max_bytes=settings.cache_max_bytes,
+            max_age_seconds=settings.cache_max_age_seconds,
+            memory_max_entries=settings.memory_cache_max_entries,
+            memory_max_bytes=settings.memory_cache_max_bytes,
+        )
+
+    @property
+    def persistent(self) -> bool:
+        """Whether reads and writes can reach a disk tier."""
+
+        return self._store is not None
+
+    def get(self, key: str, ttl_seconds: int, *, keep_expired: bool = False) -> Any | None:
+        """Return the value stored under ``key`` if it is at most ``ttl_seconds`` old.
+
+        An expired read drops the memory copy. ``keep_expired`` holds on to it for
+        later revalidation, but only when there is no disk tier to read it back from.
+        """
 
-    def get(self, key: str, ttl_seconds: int) -> Any | None:
         now = time.time()
-        if key in self._memory:
-            stored_at, value = self._memory[key]
-            if now - stored_at <= ttl_seconds:
-                return value
-            del self._memory[key]
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and now - entry[0] <= ttl_seconds:
+                self._memory.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            if entry is not None and not (keep_expired and self._store is None):
+                self._discard(key)
 
-        if not self._cache_dir:
+        stored = self._store.load(key) if self._store else None
+        if stored is None or now - stored[0] > ttl_seconds:
+            with self._lock:
+                self._misses += 1
             return None
+        size = self._size_of(stored[1])
+        with self._lock:
+            self._hits += 1
+            self._remember(key, stored[0], stored[1], size)
+        return stored[1]
+
+    def get_entry(self, key: str) -> tuple[float, Any] | None:
+        """Return ``(stored_at, value)`` regardless of age, without counting a hit or miss."""
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                return entry[0], entry[1]
+        return self._store.load(key) if self._store else None
+
+    def set(self, key: str, value: Any) -> None:
+        stored_at = time.time()
+        size = self._size_of(value)
+        with self._lock:
+            self._remember(key, stored_at, value, size)
+        if self._store:
+            self._store.save(key, stored_at, value)
+
+    def purge(self, max_age_seconds: float) -> int:
+        """Drop entries older than ``max_age_seconds`` and return the disk entries removed."""
+
+        cutoff = time.time() - max_age_seconds
+        with self._lock:
+            for key in [key for key, entry in self._memory.items() if entry[0] < cutoff]:
+                self._discard(key)
+        return self._store.purge(max_age_seconds) if self._store else 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._memory),
+                approximate_bytes=None if self._memory_max_bytes is None else self._memory_bytes,
+            )
+
+    def _size_of(self, value: Any) -> int:
+        # Sizing a structured value means encoding it, so only pay for that under a byte cap.
+        return 0 if self._memory_max_bytes is None else _approximate_size(value)
+
+    def _remember(self, key: str, stored_at: float, value: Any, size: int) -> None:
+        self._discard(key)
+        if self._memory_max_bytes is not None and size > self._memory_max_bytes:
+            return
+        self._memory[key] = (stored_at, value, size)
+        self._memory_bytes += size
+        while self._memory and self._over_memory_limit():
+            self._discard(next(iter(self._memory)))
+            self._evictions += 1
+
+    def _discard(self, key: str) -> None:
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= entry[2]
+
+    def _over_memory_limit(self) -> bool:
+        if self._memory_max_entries is not None and len(self._memory) > self._memory_max_entries:
+            return True
+        return self._memory_max_bytes is not None and self._memory_bytes > self._memory_max_bytes
+
+    def close(self) -> None:
+        if self._store:
+            self._store.close()
+
+
+class JsonFileStore:
+    """One ``<sha256>.json`` file per key; simple and dependency free."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._cache_dir = cache_dir
+
+    def load(self, key: str) -> tuple[float, Any] | None:
         path = self._path_for_key(key)
         if not path.exists():
             return None
@@ -33,21 +206,198 @@ class ResponseCache:
             payload = json.loads(path.read_text(encoding="utf-8"))
         except (OSError, json.JSONDecodeError):
             return None
-        if now - float(payload.get("stored_at", 0)) > ttl_seconds:
-            return None
-        return payload.get("value")
+        return float(payload.get("stored_at", 0)), payload.get("value")
 
-    def set(self, key: str, value: Any) -> None:
-        stored = (time.time(), value)
-        self._memory[key] = stored
-        if not self._cache_dir:
-            return
-        path = self._path_for_key(key)
-        payload = {"stored_at": stored[0], "value": value}
-        path.write_text(json.dumps(payload), encoding="utf-8")
+    def save(self, key: str, stored_at: float, value: Any) -> None:
+        payload = {"stored_at": stored_at, "value": value}
+        _atomic_write_text(self._path_for_key(key), json.dumps(payload))
+
+    def purge(self, max_age_seconds: float) -> int:
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        for path in self._cache_dir.glob("*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def close(self) -> None:
+        return None
 
     def _path_for_key(self, key: str) -> Path:
-        if self._cache_dir is None:
-            raise RuntimeError("Cache directory is not configured.")
         digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
         return self._cache_dir / f"{digest}.json"
+
+
+class SqliteStore:
+    """Single-file WAL-mode SQLite store that several processes can share.
+
+    Every ``SQLITE_PRUNE_INTERVAL`` writes, entries older than ``max_age_seconds``
+    are purged and the oldest are evicted down to ``max_bytes``. SQLite errors,
+    such as a locked or corrupt database, are logged and treated as cache misses.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_bytes: int | None = None,
+        max_age_seconds: float | None = None,
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self._local = threading.local()
+        # Connections are per thread; those of threads that have exited are closed lazily.
+        self._connections: dict[threading.Thread, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
+        self._writes = 0
+        try:
+            connection = self._connection()
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, "
+                    "stored_at REAL NOT NULL, "
+                    "size INTEGER NOT NULL, "
+                    "value TEXT NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)"
+                )
+        except sqlite3.Error as exc:
+            logger.warning("Could not initialize SQLite cache %s: %s", path, exc)
+
+    def load(self, key: str) -> tuple[float, Any] | None:
+        try:
+            row = (
+                self._connection()
+                .execute("SELECT stored_at, value FROM responses WHERE key = ?", (key,))
+                .fetchone()
+            )
+        except sqlite3.Error as exc:
+            logger.debug("SQLite cache read failed for %s: %s", key, exc)
+            return None
+        if row is None:
+            return None
+        try:
+            return float(row[0]), json.loads(row[1])
+        except json.JSONDecodeError:
+            return None
+
+    def save(self, key: str, stored_at: float, value: Any) -> None:
+        encoded = json.dumps(value)
+        try:
+            connection = self._connection()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, stored_at, size, value) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, stored_at, len(encoded), encoded),
+                )
+        except sqlite3.Error as exc:
+            logger.debug("SQLite cache write failed for %s: %s", key, exc)
+            return
+        with self._connections_lock:
+            self._writes += 1
+            prune = self._writes % SQLITE_PRUNE_INTERVAL == 1
+        if prune:
+            if self.max_age_seconds is not None:
+                self.purge(self.max_age_seconds)
+            self.enforce_size_limit()
+
+    def purge(self, max_age_seconds: float) -> int:
+        try:
+            connection = self._connection()
+            with connection:
+                cursor = connection.execute(
+                    "DELETE FROM responses WHERE stored_at < ?", (time.time() - max_age_seconds,)
+                )
+        except sqlite3.Error as exc:
+            logger.warning("SQLite cache purge failed: %s", exc)
+            return 0
+        return cursor.rowcount
+
+    def enforce_size_limit(self) -> int:
+        """Evict the oldest entries until stored values fit within ``max_bytes``."""
+
+        if self.max_bytes is None:
+            return 0
+        try:
+            return self._evict_oldest(self.max_bytes)
+        except sqlite3.Error as exc:
+            logger.warning("SQLite cache size limit enforcement failed: %s", exc)
+            return 0
+
+    def _evict_oldest(self, max_bytes: int) -> int:
+        connection = self._connection()
+        with connection:
+            total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            excess = int(total) - max_bytes
+            if excess <= 0:
+                return 0
+            removed = 0
+            freed = 0
+            rows = connection.execute("SELECT key, size FROM responses ORDER BY stored_at")
+            doomed: list[tuple[str]] = []
+            for key, size in rows:
+                if freed >= excess:
+                    break
+                doomed.append((key,))
+                freed += int(size)
+                removed += 1
+            connection.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        return removed
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections, self._connections = self._connections, {}
+        for connection in connections.values():
+            connection.close()
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.path,
+                timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._connections_lock:
+                finished = [thread for thread in self._connections if not thread.is_alive()]
+                orphaned = [self._connections.pop(thread) for thread in finished]
+                self._connections[threading.current_thread()] = connection
+            for stale in orphaned:
+                stale.close()
+        return connection
+
+
+def _approximate_size(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, bool | int | float) or value is None:
+        return 8
+    try:
+        return len(json.dumps(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write through a temporary file so concurrent readers never see partial JSON."""
+
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
@@ -6,7 +6,9 @@ from urllib.parse import quote
 
 from purl2repo.ecosystems.base import Metadata, dedupe_candidates, make_candidate
 from purl2repo.errors import MetadataFetchError
+from purl2repo.http.async_client import AsyncHttpClient
 from purl2repo.http.client import HttpClient
+from purl2repo.http.jsonstream import ARRAY_ITEM, JsonPath
 from purl2repo.models import ParsedPurl, RepositoryCandidate
 from purl2repo.utils.text import is_docs_like, is_source_label
 from purl2repo.utils.urls import is_repo_like_url
@@ -19,6 +21,11 @@ DEPS_DEV_SYSTEMS = {
     "nuget": "NUGET",
     "pypi": "PYPI",
 }
+# The package document lists every published version; only the default one is needed.
+PACKAGE_PATHS: tuple[JsonPath, ...] = (
+    ("versions", ARRAY_ITEM, "versionKey", "version"),
+    ("versions", ARRAY_ITEM, "isDefault"),
+)
 
 
 def fetch_deps_dev_candidates(
@@ -32,7 +39,6 @@ def fetch_deps_dev_candidates(
         return [], [], []
 
     package_name = _deps_dev_package_name(parsed)
-    package_url = _package_url(system, package_name)
     evidence = ["Queried deps.dev as a third-party fallback metadata source"]
     warnings: list[str] = []
     payload: Metadata | None = None
@@ -45,26 +51,69 @@ def fetch_deps_dev_candidates(
 
     if payload is None:
         try:
-            package = client.get_json(package_url)
+            package = client.get_json_fields(_package_url(system, package_name), PACKAGE_PATHS)
         except MetadataFetchError as exc:
             warnings.append(f"deps.dev package lookup failed: {exc}")
             return [], evidence, warnings
         default_version = _default_version(package)
-        if default_version:
-            evidence.append(
-                f"Used deps.dev default version {default_version} for repository fallback"
+        if not default_version:
+            return [], evidence, warnings
+        evidence.append(_default_version_evidence(default_version))
+        try:
+            payload = client.get_json(_version_url(system, package_name, default_version))
+        except MetadataFetchError as exc:
+            warnings.append(f"deps.dev default version lookup failed: {exc}")
+            return [], evidence, warnings
+
+    return _extract_candidates(payload), evidence, warnings
+
+
+async def fetch_deps_dev_candidates_async(
+    parsed: ParsedPurl,
+    client: AsyncHttpClient,
+) -> tuple[list[RepositoryCandidate], list[str], list[str]]:
+    """Async counterpart of :func:`fetch_deps_dev_candidates`."""
+
+    system = DEPS_DEV_SYSTEMS.get(parsed.type)
+    if system is None:
+        return [], [], []
+
+    package_name = _deps_dev_package_name(parsed)
+    evidence = ["Queried deps.dev as a third-party fallback metadata source"]
+    warnings: list[str] = []
+    payload: Metadata | None = None
+
+    if parsed.version:
+        try:
+            payload = await client.get_json(_version_url(system, package_name, parsed.version))
+        except MetadataFetchError as exc:
+            warnings.append(f"deps.dev version lookup failed: {exc}")
+
+    if payload is None:
+        try:
+            package = await client.get_json_fields(
+                _package_url(system, package_name), PACKAGE_PATHS
             )
-            try:
-                payload = client.get_json(_version_url(system, package_name, default_version))
-            except MetadataFetchError as exc:
-                warnings.append(f"deps.dev default version lookup failed: {exc}")
-                return [], evidence, warnings
-        else:
+        except MetadataFetchError as exc:
+            warnings.append(f"deps.dev package lookup failed: {exc}")
+            return [], evidence, warnings
+        default_version = _default_version(package)
+        if not default_version:
+            return [], evidence, warnings
+        evidence.append(_default_version_evidence(default_version))
+        try:
+            payload = await client.get_json(_version_url(system, package_name, default_version))
+        except MetadataFetchError as exc:
+            warnings.append(f"deps.dev default version lookup failed: {exc}")
             return [], evidence, warnings
 
     return _extract_candidates(payload), evidence, warnings
 
 
+def _default_version_evidence(default_version: str) -> str:
+    return f"Used deps.dev default version {default_version} for repository fallback"
+
+
 def _deps_dev_package_name(parsed: ParsedPurl) -> str:
     if parsed.type == "maven" and parsed.namespace:
         return f"{parsed.namespace}:{parsed.name}"
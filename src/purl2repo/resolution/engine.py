@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import replace
+import json
+import time
+from collections import deque
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass, field, replace
+from itertools import islice
 from urllib.parse import urlsplit, urlunsplit
 
 from purl2repo.ecosystems.base import EcosystemResolver, Metadata
@@ -25,7 +31,14 @@ from purl2repo.hosts.bitbucket import BitbucketAdapter
 from purl2repo.hosts.generic_git import GenericGitAdapter
 from purl2repo.hosts.github import GitHubAdapter
 from purl2repo.hosts.gitlab import GitLabAdapter
-from purl2repo.http.client import HttpClient
+from purl2repo.http.client import (
+    REGISTRY_TTL_SECONDS,
+    RELEASE_TTL_SECONDS,
+    HttpClient,
+    requested_ttls,
+    response_cache_writes_disabled,
+    served_stale_responses,
+)
 from purl2repo.models import (
     ParsedPurl,
     ReleaseLink,
@@ -33,8 +46,9 @@ from purl2repo.models import (
     RepositoryRef,
     ResolutionResult,
     ResolverSettings,
+    ScrapedCandidate,
 )
-from purl2repo.purl.parse import parse_purl
+from purl2repo.purl.parse import parse_purl, purl_to_string
 from purl2repo.resolution import evidence as evidence_messages
 from purl2repo.resolution.cache import ResponseCache
 from purl2repo.resolution.deps_dev import fetch_deps_dev_candidates
@@ -67,127 +81,295 @@ HOSTS: dict[str, HostAdapter] = {
     "bitbucket.org": BitbucketAdapter(),
 }
 GENERIC_HOST = GenericGitAdapter()
+REPOSITORY_TTL_SECONDS = 86400
+RESOLVE_MANY_WINDOW_PER_WORKER = 2
+# Threads shared by the URL probes of every resolution on one engine.
+PROBE_POOL_SIZE = 32
+RESULT_CACHE_SOURCE = "result-cache"
+# Settings that change what a resolution returns; they are part of the result cache key.
+RESULT_AFFECTING_SETTINGS = (
+    "strict",
+    "no_network",
+    "verify_release_links",
+    "validate_repositories",
+    "validation_short_circuit",
+    "use_deps_dev_fallback",
+    "use_scraper_fallback",
+    "cache_distilled_metadata",
+    "stream_json",
+    "go_import_timeout_seconds",
+    "go_proxy_roots",
+    "go_import_rules",
+)
+
+# Steps of the current resolution whose request failed or was inconclusive.
+_inconclusive_steps: ContextVar[list[str] | None] = ContextVar(
+    "purl2repo_inconclusive_steps", default=None
+)
+
+
+@contextmanager
+def inconclusive_steps() -> Iterator[list[str]]:
+    """Collect the resolution steps that fell back after a failed request in this context."""
+
+    steps: list[str] = []
+    token = _inconclusive_steps.set(steps)
+    try:
+        yield steps
+    finally:
+        _inconclusive_steps.reset(token)
+
+
+def _note_inconclusive(step: str) -> None:
+    steps = _inconclusive_steps.get()
+    if steps is not None:
+        steps.append(step)
+
+
+@dataclass
+class DirectTarget:
+    """Repository identity planned from the PURL itself, before any network checks."""
+
+    parsed: ParsedPurl
+    candidate: RepositoryCandidate
+    repository: RepositoryRef
+    confidence: str
+    evidence: list[str]
+    warnings: list[str]
+    metadata_sources: list[str]
+
+
+@dataclass
+class RegistryTarget:
+    """State gathered while resolving a registry PURL through its ecosystem adapter."""
+
+    parsed: ParsedPurl
+    adapter: EcosystemResolver
+    metadata_sources: list[str]
+    metadata: Metadata = field(default_factory=dict)
+    candidates: list[RepositoryCandidate] = field(default_factory=list)
+    evidence: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
 
+class BaseResolutionEngine:
+    """Transport-independent resolution steps shared by the sync and asyncio engines.
+
+    Subclasses own the HTTP client and perform every network call; this class only
+    makes decisions from the outcomes of those calls so both engines stay in step.
+    """
 
-class ResolutionEngine:
     def __init__(self, settings: ResolverSettings) -> None:
+        if settings.validation_concurrency < 1:
+            raise ValueError("validation_concurrency must be greater than zero")
+        if settings.release_probe_concurrency < 1:
+            raise ValueError("release_probe_concurrency must be greater than zero")
         self.settings = settings
-        self.cache = ResponseCache(settings.cache_dir) if settings.use_cache else None
-        self.client = HttpClient(settings, self.cache)
-        self.scraper = FallbackScraper(self.client)
-
-    def close(self) -> None:
-        self.client.close()
+        self.cache = ResponseCache.from_settings(settings) if settings.use_cache else None
+        # One adapter per ecosystem, built from this engine's settings on first use.
+        self._adapters: dict[str, EcosystemResolver] = {}
 
     def parse(self, purl: str) -> ParsedPurl:
         return parse_purl(purl)
 
-    def resolve(self, purl: str, *, include_release: bool = True) -> ResolutionResult:
-        parsed = self.parse(purl)
-        if parsed.type in DIRECT_HOST_TYPES:
-            return self._resolve_direct_host(parsed, include_release=include_release)
-        if parsed.type in ARTIFACT_HUB_TYPES:
-            return self._resolve_artifact_hub(parsed, include_release=include_release)
-        if parsed.type in GENERIC_TYPES:
-            return self._resolve_generic(parsed, include_release=include_release)
+    def _adapter_for(self, parsed: ParsedPurl) -> EcosystemResolver:
+        adapter = self._adapters.get(parsed.type)
+        if adapter is not None:
+            return adapter
+        adapter_cls = ECOSYSTEMS.get(parsed.type)
+        if not adapter_cls:
+            raise UnsupportedEcosystemError(f"Unsupported package type: {parsed.type}")
+        return self._adapters.setdefault(parsed.type, adapter_cls.from_settings(self.settings))
+
+    def _host_adapter(self, host: str) -> HostAdapter | None:
+        if not host:
+            return None
+        return HOSTS.get(host, GENERIC_HOST)
 
+    def _plan_registry(self, parsed: ParsedPurl) -> RegistryTarget:
         adapter = self._adapter_for(parsed)
-        warnings: list[str] = []
-        evidence: list[str] = []
-        metadata_sources = [adapter.metadata_source]
-        metadata: Metadata = {}
+        return RegistryTarget(
+            parsed=parsed, adapter=adapter, metadata_sources=[adapter.metadata_source]
+        )
+
+    def _record_metadata(self, target: RegistryTarget, metadata: Metadata) -> None:
+        target.metadata = metadata
+        target.evidence.append(evidence_messages.fetched(target.adapter.metadata_source))
+        metadata_warning = metadata.get("_purl2repo_metadata_warning")
+        if isinstance(metadata_warning, str):
+            _note_inconclusive("metadata")
+            target.warnings.append(metadata_warning)
+        missing_version = metadata.get("_purl2repo_version_metadata_missing")
+        if isinstance(missing_version, str):
+            target.warnings.append(
+                "Version-specific metadata was not found; "
+                f"used project metadata for {missing_version}"
+            )
+            target.evidence.append(
+                "Used project-level metadata after version-specific metadata failed"
+            )
+
+    def _distilled_metadata_key(self, parsed: ParsedPurl) -> str | None:
+        if self.cache is None or not self.settings.cache_distilled_metadata:
+            return None
+        return (
+            f"metadata:{parsed.type}:{parsed.namespace or ''}:{parsed.name}:{parsed.version or ''}"
+        )
+
+    def _cached_distilled_metadata(self, key: str) -> Metadata | None:
+        entry = self.cache.get_entry(key) if self.cache else None
+        if entry is None or not isinstance(entry[1], dict):
+            return None
+        stored_at, value = entry
+        ttl_seconds, metadata = value.get("ttl_seconds"), value.get("metadata")
+        if not isinstance(ttl_seconds, int) or time.time() - stored_at > ttl_seconds:
+            return None
+        return metadata if isinstance(metadata, dict) else None
+
+    def _store_distilled_metadata(
+        self,
+        adapter: EcosystemResolver,
+        parsed: ParsedPurl,
+        key: str,
+        metadata: Metadata,
+        ttls: list[int],
+    ) -> Metadata:
+        """Cache the distilled fields for as long as the shortest-lived source document."""
+
+        if metadata.get("_purl2repo_metadata_warning"):
+            # Degraded metadata is used for this resolution only.
+            return metadata
+        distilled = adapter.distill_metadata(parsed, metadata)
+        if self.cache:
+            ttl_seconds = min(ttls, default=REGISTRY_TTL_SECONDS)
+            self.cache.set(key, {"ttl_seconds": ttl_seconds, "metadata": distilled})
+        return distilled
 
+    def _result_cache_key(self, parsed: ParsedPurl, *, include_release: bool) -> str | None:
+        if self.cache is None or self.settings.result_cache_ttl_seconds is None:
+            return None
+        flags = ",".join(
+            f"{name}={json.dumps(getattr(self.settings, name), default=_qualified_name)}"
+            for name in RESULT_AFFECTING_SETTINGS
+        )
+        mode = "release" if include_release else "repository"
+        return f"result:{mode}:{flags}:{purl_to_string(parsed)}"
+
+    def _cached_result(self, key: str | None, parsed: ParsedPurl) -> ResolutionResult | None:
+        if key is None or self.cache is None or self.settings.result_cache_ttl_seconds is None:
+            return None
+        cached = self.cache.get(key, self.settings.result_cache_ttl_seconds)
+        if not isinstance(cached, dict):
+            return None
         try:
-            metadata = adapter.fetch_metadata(parsed, self.client)
-            evidence.append(evidence_messages.fetched(adapter.metadata_source))
-            metadata_warning = metadata.get("_purl2repo_metadata_warning")
-            if isinstance(metadata_warning, str):
-                warnings.append(metadata_warning)
-            missing_version = metadata.get("_purl2repo_version_metadata_missing")
-            if isinstance(missing_version, str):
-                warnings.append(
-                    "Version-specific metadata was not found; "
-                    f"used project metadata for {missing_version}"
-                )
-                evidence.append(
-                    "Used project-level metadata after version-specific metadata failed"
-                )
-        except MetadataFetchError as exc:
-            if self.settings.strict:
-                raise
-            warnings.append(f"Could not fetch metadata from {adapter.metadata_source}")
-            fallback_metadata = adapter.metadata_fetch_fallback(parsed)
-            if fallback_metadata is None and self.settings.no_network:
-                return self._empty_result(parsed, warnings, evidence, metadata_sources)
-            metadata = fallback_metadata or {}
-            if fallback_metadata is not None:
-                evidence.append(
-                    f"Used resolver-local fallback metadata after {adapter.metadata_source} failed"
-                )
-            warnings.append(f"Continuing after metadata fetch failure: {exc}")
+            result = ResolutionResult.from_dict(cached)
+        except (KeyError, TypeError):
+            return None
+        return replace(
+            result,
+            purl=parsed,
+            evidence=[*result.evidence, evidence_messages.reused_cached_result()],
+            metadata_sources=[*result.metadata_sources, RESULT_CACHE_SOURCE],
+        )
 
-        candidates = self._validate_repository_candidates(
-            score_candidates(adapter.extract_candidates(parsed, metadata), parsed),
-            warnings,
-            evidence,
+    def _with_stale_evidence(self, result: ResolutionResult, urls: list[str]) -> ResolutionResult:
+        stale_evidence = [evidence_messages.used_stale_metadata(url) for url in dict.fromkeys(urls)]
+        return replace(result, evidence=[*result.evidence, *stale_evidence])
+
+    def _store_result(
+        self, key: str | None, result: ResolutionResult, inconclusive: list[str]
+    ) -> None:
+        """Memoize results that did not depend on a failed or inconclusive request."""
+
+        if key is None or self.cache is None or result.repository_url is None or inconclusive:
+            return
+        self.cache.set(key, result.to_dict())
+
+    def _recover_metadata(
+        self, target: RegistryTarget, exc: MetadataFetchError
+    ) -> ResolutionResult | None:
+        """Continue with fallback metadata after a fetch failure, or return the empty result."""
+
+        adapter = target.adapter
+        _note_inconclusive("metadata")
+        target.warnings.append(f"Could not fetch metadata from {adapter.metadata_source}")
+        fallback_metadata = adapter.metadata_fetch_fallback(target.parsed)
+        if fallback_metadata is None and self.settings.no_network:
+            return self._empty_result(
+                target.parsed, target.warnings, target.evidence, target.metadata_sources
+            )
+        if fallback_metadata is not None:
+            target.evidence.append(
+                f"Used resolver-local fallback metadata after {adapter.metadata_source} failed"
+            )
+        target.warnings.append(f"Continuing after metadata fetch failure: {exc}")
+        target.metadata = fallback_metadata or {}
+        return None
+
+    def _extracted_candidates(self, target: RegistryTarget) -> list[RepositoryCandidate]:
+        return score_candidates(
+            target.adapter.extract_candidates(target.parsed, target.metadata), target.parsed
         )
-        structured_confidence = confidence_from_score(candidates[0].score if candidates else 0.0)
-        if (
-            structured_confidence == "none"
+
+    def _rescored_candidates(
+        self, target: RegistryTarget, extra: list[RepositoryCandidate]
+    ) -> list[RepositoryCandidate]:
+        return score_candidates([*target.candidates, *extra], target.parsed)
+
+    def _wants_deps_dev(self, target: RegistryTarget) -> bool:
+        return (
+            _top_confidence(target.candidates) == "none"
             and not self.settings.no_network
             and self.settings.use_deps_dev_fallback
-        ):
-            deps_candidates, deps_evidence, deps_warnings = fetch_deps_dev_candidates(
-                parsed,
-                self.client,
-            )
-            evidence.extend(deps_evidence)
-            warnings.extend(deps_warnings)
-            if deps_evidence:
-                metadata_sources.append("deps-dev")
-            if deps_candidates:
-                candidates = self._validate_repository_candidates(
-                    score_candidates([*candidates, *deps_candidates], parsed),
-                    warnings,
-                    evidence,
-                )
-                structured_confidence = confidence_from_score(
-                    candidates[0].score if candidates else 0.0
-                )
-        if (
-            structured_confidence == "none"
+        )
+
+    def _record_deps_dev(
+        self,
+        target: RegistryTarget,
+        found: tuple[list[RepositoryCandidate], list[str], list[str]],
+    ) -> list[RepositoryCandidate]:
+        deps_candidates, deps_evidence, deps_warnings = found
+        if deps_warnings:
+            _note_inconclusive("deps-dev")
+        target.evidence.extend(deps_evidence)
+        target.warnings.extend(deps_warnings)
+        if deps_evidence:
+            target.metadata_sources.append("deps-dev")
+        return deps_candidates
+
+    def _wants_scrape(self, target: RegistryTarget) -> bool:
+        return (
+            _top_confidence(target.candidates) == "none"
             and not self.settings.no_network
             and self.settings.use_scraper_fallback
-            and should_scrape_purl(parsed)
-        ):
-            scrape_pages = [
-                *adapter.fallback_scrape_pages(parsed, metadata),
-                *default_fallback_pages(parsed, metadata),
-            ]
-            try:
-                scraped = self.scraper.scrape(parsed, scrape_pages)
-            except MetadataFetchError:
-                if self.settings.strict:
-                    raise
-                scraped = []
-                warnings.append("Fallback scraping failed")
-            scraped_candidates = [
-                scraped_to_repository_candidate(candidate) for candidate in scraped
-            ]
-            scrape_repository_candidates = [
-                candidate for candidate in scraped_candidates if candidate is not None
-            ]
-            if scrape_repository_candidates:
-                warnings.append(evidence_messages.used_fallback_scraping())
-                evidence.append(evidence_messages.used_fallback_scraping())
-                candidates = self._validate_repository_candidates(
-                    score_candidates(
-                        [*candidates, *scrape_repository_candidates],
-                        parsed,
-                    ),
-                    warnings,
-                    evidence,
-                )
+            and should_scrape_purl(target.parsed)
+        )
+
+    def _scrape_pages(self, target: RegistryTarget) -> list[str]:
+        return [
+            *target.adapter.fallback_scrape_pages(target.parsed, target.metadata),
+            *default_fallback_pages(target.parsed, target.metadata),
+        ]
+
+    def _scrape_failed(self, target: RegistryTarget) -> list[ScrapedCandidate]:
+        _note_inconclusive("scrape")
+        target.warnings.append("Fallback scraping failed")
+        return []
+
+    def _scraped_repository_candidates(
+        self, target: RegistryTarget, scraped: list[ScrapedCandidate]
+    ) -> list[RepositoryCandidate]:
+        scraped_candidates = [scraped_to_repository_candidate(candidate) for candidate in scraped]
+        repository_candidates = [
+            candidate for candidate in scraped_candidates if candidate is not None
+        ]
+        if repository_candidates:
+            target.warnings.append(evidence_messages.used_fallback_scraping())
+            target.evidence.append(evidence_messages.used_fallback_scraping())
+        return repository_candidates
+
+    def _select_best(self, target: RegistryTarget) -> tuple[RepositoryCandidate | None, str]:
+        candidates, warnings, parsed = target.candidates, target.warnings, target.parsed
         best = candidates[0] if candidates else None
         confidence = confidence_from_score(best.score if best else 0.0)
 
@@ -202,47 +384,53 @@ class ResolutionEngine:
                     f"Only weak repository candidates found for {parsed.raw}"
                 )
         else:
-            evidence.append(evidence_messages.selected_candidate())
+            target.evidence.append(evidence_messages.selected_candidate())
 
         if len(candidates) > 1 and best and best.score - candidates[1].score <= 10:
             warnings.append(evidence_messages.ambiguous_warning())
+        return best, confidence
 
-        release_link = None
-        if include_release:
-            if parsed.version:
-                host_adapter = self._host_adapter(best.host if best else "")
-                release_link = self._resolve_release_link(
-                    adapter=adapter,
-                    parsed=parsed,
-                    repository=best,
-                    metadata=metadata,
-                    host_adapter=host_adapter,
-                    warnings=warnings,
-                    evidence=evidence,
-                )
-                if release_link:
-                    evidence.append(evidence_messages.resolved_release())
-                elif best:
-                    warnings.append(evidence_messages.no_release_warning())
-                    if self.settings.strict:
-                        raise NoReleaseFoundError(f"No release link found for {parsed.raw}")
-            else:
-                warnings.append(evidence_messages.skipped_release_no_version())
-                evidence.append(evidence_messages.skipped_release_no_version())
+    def _wants_release(self, target: RegistryTarget) -> bool:
+        if target.parsed.version:
+            return True
+        target.warnings.append(evidence_messages.skipped_release_no_version())
+        target.evidence.append(evidence_messages.skipped_release_no_version())
+        return False
+
+    def _record_release(
+        self,
+        target: RegistryTarget,
+        best: RepositoryCandidate | None,
+        release_link: ReleaseLink | None,
+    ) -> None:
+        if release_link:
+            target.evidence.append(evidence_messages.resolved_release())
+        elif best:
+            target.warnings.append(evidence_messages.no_release_warning())
+            if self.settings.strict:
+                raise NoReleaseFoundError(f"No release link found for {target.parsed.raw}")
 
+    def _repository_result(
+        self,
+        target: RegistryTarget,
+        best: RepositoryCandidate | None,
+        confidence: str,
+        release_link: ReleaseLink | None,
+    ) -> ResolutionResult:
+        warnings, evidence = target.warnings, target.evidence
         repository_url = best.normalized_url if best and confidence != "none" else None
         repository_validation_status = self._repository_validation_status(
             repository_url, warnings, evidence
         )
 
         return ResolutionResult(
-            purl=parsed,
+            purl=target.parsed,
             repository_url=repository_url,
             repository_type=best.repository_type if best and confidence != "none" else None,
             repository_kind=(
                 _repository_kind_for_candidate(best) if best and confidence != "none" else None
             ),
-            repository_candidates=candidates,
+            repository_candidates=target.candidates,
             canonical_repository=(
                 _repository_ref_from_candidate(best, confidence)
                 if best and confidence != "none"
@@ -255,50 +443,10 @@ class ResolutionEngine:
             confidence=confidence,
             evidence=evidence,
             warnings=warnings,
-            metadata_sources=metadata_sources,
+            metadata_sources=target.metadata_sources,
         )
 
-    def resolve_repository(self, purl: str) -> ResolutionResult:
-        return self.resolve(purl, include_release=False)
-
-    def resolve_release(self, purl: str) -> ResolutionResult:
-        result = self.resolve(purl, include_release=True)
-        if self.settings.strict and result.release_link is None:
-            raise NoReleaseFoundError(f"No release link found for {purl}")
-        return result
-
-    def resolve_many(
-        self,
-        purls: Iterable[str],
-        *,
-        max_workers: int | None = None,
-    ) -> Iterator[ResolutionResult]:
-        if max_workers is not None and max_workers < 1:
-            raise ValueError("max_workers must be greater than zero")
-        if max_workers is None or max_workers == 1:
-            for purl in purls:
-                yield self.resolve(purl)
-            return
-
-        def resolve_one(purl: str) -> ResolutionResult:
-            engine = ResolutionEngine(self.settings)
-            try:
-                return engine.resolve(purl)
-            finally:
-                engine.close()
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            yield from executor.map(resolve_one, purls)
-
-    def _adapter_for(self, parsed: ParsedPurl) -> EcosystemResolver:
-        adapter_cls = ECOSYSTEMS.get(parsed.type)
-        if not adapter_cls:
-            raise UnsupportedEcosystemError(f"Unsupported package type: {parsed.type}")
-        return adapter_cls()
-
-    def _resolve_direct_host(
-        self, parsed: ParsedPurl, *, include_release: bool
-    ) -> ResolutionResult:
+    def _plan_direct_host(self, parsed: ParsedPurl) -> DirectTarget | ResolutionResult:
         warnings: list[str] = []
         evidence = [f"Resolved {parsed.type} purl directly without repository inference"]
         if not parsed.namespace:
@@ -330,34 +478,19 @@ class ResolutionEngine:
             confidence="high",
             reasons=list(candidate.reasons),
         )
-        release_link = None
-        if include_release:
-            release_link = self._direct_release_link(parsed, candidate, warnings, evidence)
-        return self._direct_result(
+        return DirectTarget(
             parsed=parsed,
-            repository=repository,
             candidate=candidate,
-            release_link=release_link,
+            repository=repository,
             confidence="high",
             evidence=evidence,
             warnings=warnings,
             metadata_sources=[f"{parsed.type}-direct"],
         )
 
-    def _resolve_artifact_hub(
-        self, parsed: ParsedPurl, *, include_release: bool
-    ) -> ResolutionResult:
-        if parsed.type == "huggingface":
-            return self._resolve_huggingface(parsed, include_release=include_release)
-        return self._resolve_mlflow(parsed, include_release=include_release)
-
-    def _resolve_huggingface(
-        self, parsed: ParsedPurl, *, include_release: bool
-    ) -> ResolutionResult:
+    def _plan_huggingface(self, parsed: ParsedPurl) -> DirectTarget:
         repo_path = f"{parsed.namespace}/{parsed.name}" if parsed.namespace else parsed.name
         url = f"https://huggingface.co/{repo_path}"
-        evidence = ["Resolved Hugging Face purl to canonical artifact hub repository"]
-        warnings: list[str] = []
         candidate = RepositoryCandidate(
             url=url,
             normalized_url=url,
@@ -378,50 +511,45 @@ class ResolutionEngine:
             confidence="high",
             reasons=list(candidate.reasons),
         )
-        release_link = None
-        if include_release:
-            if parsed.version:
-                revision_url = f"{url}/tree/{parsed.version}"
-                try:
-                    if self.client.url_exists(revision_url):
-                        release_link = ReleaseLink(
-                            url=revision_url,
-                            kind="revision",
-                            version=parsed.version,
-                            source="huggingface",
-                        )
-                        evidence.append("Verified Hugging Face revision link exists")
-                    else:
-                        warnings.append(
-                            "Hugging Face revision link could not be verified; "
-                            "returning canonical repository only"
-                        )
-                        if self.settings.strict:
-                            raise NoReleaseFoundError(
-                                f"No Hugging Face revision link found for {parsed.raw}"
-                            )
-                except MetadataFetchError:
-                    if self.settings.strict:
-                        raise
-                    warnings.append(
-                        "Could not verify Hugging Face revision link; "
-                        "returning canonical repository only"
-                    )
-            else:
-                warnings.append(evidence_messages.skipped_release_no_version())
-                evidence.append(evidence_messages.skipped_release_no_version())
-        return self._direct_result(
+        return DirectTarget(
             parsed=parsed,
-            repository=repository,
             candidate=candidate,
-            release_link=release_link,
+            repository=repository,
             confidence="high",
-            evidence=evidence,
-            warnings=warnings,
+            evidence=["Resolved Hugging Face purl to canonical artifact hub repository"],
+            warnings=[],
             metadata_sources=["huggingface-purl"],
         )
 
-    def _resolve_mlflow(self, parsed: ParsedPurl, *, include_release: bool) -> ResolutionResult:
+    def _record_huggingface_revision(
+        self,
+        target: DirectTarget,
+        revision_url: str,
+        exists: bool,
+    ) -> ReleaseLink | None:
+        parsed = target.parsed
+        if exists:
+            target.evidence.append("Verified Hugging Face revision link exists")
+            return ReleaseLink(
+                url=revision_url,
+                kind="revision",
+                version=parsed.version,
+                source="huggingface",
+            )
+        target.warnings.append(
+            "Hugging Face revision link could not be verified; returning canonical repository only"
+        )
+        if self.settings.strict:
+            raise NoReleaseFoundError(f"No Hugging Face revision link found for {parsed.raw}")
+        return None
+
+    def _huggingface_revision_unverifiable(self, target: DirectTarget) -> None:
+        _note_inconclusive("release")
+        target.warnings.append(
+            "Could not verify Hugging Face revision link; returning canonical repository only"
+        )
+
+    def _plan_mlflow(self, parsed: ParsedPurl) -> DirectTarget | ResolutionResult:
         registry_url = (
             parsed.qualifiers.get("registry_url")
             or parsed.qualifiers.get("tracking_uri")
@@ -458,30 +586,30 @@ class ResolutionEngine:
             confidence="medium",
             reasons=list(candidate.reasons),
         )
-        release_link = None
-        if include_release:
-            if parsed.version:
-                release_link = ReleaseLink(
-                    url=url,
-                    kind="version",
-                    version=parsed.version,
-                    source="mlflow",
-                )
-            else:
-                warnings.append(evidence_messages.skipped_release_no_version())
-                evidence.append(evidence_messages.skipped_release_no_version())
-        return self._direct_result(
+        return DirectTarget(
             parsed=parsed,
-            repository=repository,
             candidate=candidate,
-            release_link=release_link,
+            repository=repository,
             confidence="medium",
             evidence=evidence,
             warnings=warnings,
             metadata_sources=["mlflow-purl"],
         )
 
-    def _resolve_generic(self, parsed: ParsedPurl, *, include_release: bool) -> ResolutionResult:
+    def _mlflow_release_link(self, target: DirectTarget) -> ReleaseLink | None:
+        parsed = target.parsed
+        if not parsed.version:
+            target.warnings.append(evidence_messages.skipped_release_no_version())
+            target.evidence.append(evidence_messages.skipped_release_no_version())
+            return None
+        return ReleaseLink(
+            url=target.repository.url,
+            kind="version",
+            version=parsed.version,
+            source="mlflow",
+        )
+
+    def _plan_generic(self, parsed: ParsedPurl) -> DirectTarget | ResolutionResult:
         evidence = ["Resolved generic purl from explicit URL qualifiers"]
         warnings: list[str] = []
         selected_key = next(
@@ -532,207 +660,135 @@ class ResolutionEngine:
             confidence=confidence,
             reasons=list(candidate.reasons),
         )
-        release_link = None
-        if include_release:
-            if parsed.version and kind == "vcs":
-                release_link = self._direct_release_link(parsed, candidate, warnings, evidence)
-            elif not parsed.version:
-                warnings.append(evidence_messages.skipped_release_no_version())
-                evidence.append(evidence_messages.skipped_release_no_version())
-        return self._direct_result(
+        return DirectTarget(
             parsed=parsed,
-            repository=repository,
             candidate=candidate,
-            release_link=release_link,
+            repository=repository,
             confidence=confidence,
             evidence=evidence,
             warnings=warnings,
             metadata_sources=["generic-purl-qualifiers"],
         )
 
-    def _host_adapter(self, host: str) -> HostAdapter | None:
-        if not host:
-            return None
-        return HOSTS.get(host, GENERIC_HOST)
-
-    def _resolve_release_link(
+    def _record_release_verification(
         self,
-        *,
-        adapter: EcosystemResolver,
-        parsed: ParsedPurl,
-        repository: RepositoryCandidate | None,
-        metadata: Metadata,
-        host_adapter: HostAdapter | None,
-        warnings: list[str],
-        evidence: list[str],
-    ) -> ReleaseLink | None:
-        if host_adapter is None or not parsed.version:
-            return None
-        if not self.settings.verify_release_links:
-            return adapter.resolve_release_link(parsed, repository, metadata, host_adapter)
-
-        if repository is None:
-            return None
-        try:
-            candidates = host_adapter.candidate_release_links(
-                repository.normalized_url,
-                parsed.version,
-            )
-            for candidate in candidates:
-                if self.client.url_exists(candidate.url):
-                    evidence.append(evidence_messages.verified_release())
-                    return candidate
-        except MetadataFetchError:
-            if self.settings.strict:
-                raise
-            warnings.append("Could not verify inferred release links")
-            return None
-        warnings.append(evidence_messages.unverified_release_warning())
-        return None
-
-    def _direct_release_link(
-        self,
-        parsed: ParsedPurl,
-        candidate: RepositoryCandidate,
+        release_link: ReleaseLink | None,
         warnings: list[str],
         evidence: list[str],
     ) -> ReleaseLink | None:
-        if not parsed.version:
-            warnings.append(evidence_messages.skipped_release_no_version())
-            evidence.append(evidence_messages.skipped_release_no_version())
-            return None
-        host_adapter = self._host_adapter(candidate.host)
-        if host_adapter is None:
-            return None
-        if self.settings.verify_release_links:
-            try:
-                for release_candidate in host_adapter.candidate_release_links(
-                    candidate.normalized_url,
-                    parsed.version,
-                ):
-                    if self.client.url_exists(release_candidate.url):
-                        evidence.append(evidence_messages.verified_release())
-                        return release_candidate
-            except MetadataFetchError:
-                if self.settings.strict:
-                    raise
-                warnings.append("Could not verify inferred release links")
-                return None
+        if release_link is None:
             warnings.append(evidence_messages.unverified_release_warning())
-            return None
-        return host_adapter.infer_release_link(candidate.normalized_url, parsed.version)
+        else:
+            evidence.append(evidence_messages.verified_release())
+        return release_link
 
-    def _direct_result(
-        self,
-        *,
-        parsed: ParsedPurl,
-        repository: RepositoryRef,
-        candidate: RepositoryCandidate,
-        release_link: ReleaseLink | None,
-        confidence: str,
-        evidence: list[str],
-        warnings: list[str],
-        metadata_sources: list[str],
+    def _release_verification_failed(self, warnings: list[str]) -> None:
+        _note_inconclusive("release")
+        warnings.append("Could not verify inferred release links")
+
+    def _direct_success(
+        self, target: DirectTarget, release_link: ReleaseLink | None
     ) -> ResolutionResult:
-        if release_link:
-            evidence.append(evidence_messages.resolved_release())
-        if not self._repository_url_is_valid(repository.url, warnings, evidence):
-            if self.settings.strict:
-                raise NoRepositoryFoundError(f"Repository URL did not validate: {repository.url}")
-            return self._empty_result(parsed, warnings, evidence, metadata_sources)
+        repository = target.repository
         repository_validation_status = self._repository_validation_status(
-            repository.url, warnings, evidence
+            repository.url, target.warnings, target.evidence
         )
 
         return ResolutionResult(
-            purl=parsed,
+            purl=target.parsed,
             repository_url=repository.url,
             repository_type=repository.platform,
             repository_kind=repository.kind,
-            repository_candidates=[candidate],
+            repository_candidates=[target.candidate],
             canonical_repository=repository,
             release_link=release_link,
             version_reference=release_link,
             repository_validated=repository_validation_status == "validated",
             repository_validation_status=repository_validation_status,
-            confidence=confidence,
-            evidence=evidence,
-            warnings=warnings,
-            metadata_sources=metadata_sources,
+            confidence=target.confidence,
+            evidence=target.evidence,
+            warnings=target.warnings,
+            metadata_sources=target.metadata_sources,
         )
 
-    def _validate_repository_candidates(
-        self,
-        candidates: list[RepositoryCandidate],
-        warnings: list[str],
-        evidence: list[str],
-    ) -> list[RepositoryCandidate]:
-        validated: list[RepositoryCandidate] = []
-        for candidate in candidates:
-            validated_candidate = self._validate_repository_candidate(candidate, warnings, evidence)
-            if validated_candidate is not None:
-                validated.append(validated_candidate)
-        return validated
+    def _direct_invalid(self, target: DirectTarget) -> ResolutionResult:
+        if self.settings.strict:
+            raise NoRepositoryFoundError(
+                f"Repository URL did not validate: {target.repository.url}"
+            )
+        return self._empty_result(
+            target.parsed, target.warnings, target.evidence, target.metadata_sources
+        )
 
-    def _validate_repository_candidate(
-        self,
-        candidate: RepositoryCandidate,
-        warnings: list[str],
-        evidence: list[str],
-    ) -> RepositoryCandidate | None:
+    def _validation_skipped(self, evidence: list[str]) -> bool:
         if self.settings.no_network:
-            return candidate
+            return True
         if not self.settings.validate_repositories:
             message = "Repository URL validation skipped by settings"
             if message not in evidence:
                 evidence.append(message)
-            return candidate
-        try:
-            if self.client.url_exists(candidate.normalized_url, ttl_seconds=86400):
-                evidence.append(f"Validated repository URL: {candidate.normalized_url}")
-                return candidate
-        except MetadataFetchError:
-            if self.settings.strict:
-                raise
-            warnings.append(f"Could not validate repository URL: {candidate.normalized_url}")
-            return replace(
-                candidate,
-                score=min(candidate.score, 64.0),
-                reasons=[
-                    *candidate.reasons,
-                    "Repository URL validation was inconclusive; confidence capped below medium",
-                ],
-            )
-        warnings.append(
-            f"Repository URL did not validate and was discarded: {candidate.normalized_url}"
-        )
-        return None
+            return True
+        return False
 
-    def _repository_url_is_valid(
+    def _record_url_validation(
         self,
         url: str,
+        exists: bool,
         warnings: list[str],
         evidence: list[str],
     ) -> bool:
-        if self.settings.no_network:
-            return True
-        if not self.settings.validate_repositories:
-            message = "Repository URL validation skipped by settings"
-            if message not in evidence:
-                evidence.append(message)
-            return True
-        try:
-            if self.client.url_exists(url, ttl_seconds=86400):
-                evidence.append(f"Validated repository URL: {url}")
-                return True
-        except MetadataFetchError:
-            if self.settings.strict:
-                raise
-            warnings.append(f"Could not validate repository URL: {url}")
+        if exists:
+            evidence.append(f"Validated repository URL: {url}")
             return True
         warnings.append(f"Repository URL did not validate and was discarded: {url}")
         return False
 
+    def _validation_inconclusive(self, url: str, warnings: list[str]) -> None:
+        _note_inconclusive("validation")
+        warnings.append(f"Could not validate repository URL: {url}")
+
+    def _inconclusive_candidate(
+        self, candidate: RepositoryCandidate, warnings: list[str]
+    ) -> RepositoryCandidate:
+        self._validation_inconclusive(candidate.normalized_url, warnings)
+        return replace(
+            candidate,
+            score=min(candidate.score, 64.0),
+            reasons=[
+                *candidate.reasons,
+                "Repository URL validation was inconclusive; confidence capped below medium",
+            ],
+        )
+
+    def _apply_validation_outcome(
+        self,
+        candidate: RepositoryCandidate,
+        outcome: bool | MetadataFetchError,
+        warnings: list[str],
+        evidence: list[str],
+    ) -> RepositoryCandidate | None:
+        if isinstance(outcome, MetadataFetchError):
+            if self.settings.strict:
+                raise outcome
+            return self._inconclusive_candidate(candidate, warnings)
+        if self._record_url_validation(candidate.normalized_url, outcome, warnings, evidence):
+            return candidate
+        return None
+
+    def _validation_short_circuits(self, index: int, outcome: bool | MetadataFetchError) -> bool:
+        # Validation never raises a score, so a validated top candidate cannot be outranked.
+        return self.settings.validation_short_circuit and index == 0 and outcome is True
+
+    def _skip_validation(
+        self, remaining: list[RepositoryCandidate], evidence: list[str]
+    ) -> list[RepositoryCandidate]:
+        if remaining:
+            evidence.append(
+                f"Skipped validation of {len(remaining)} lower-scoring candidate(s) "
+                "after the top candidate validated"
+            )
+        return remaining
+
     def _repository_validation_status(
         self,
         repository_url: str | None,
@@ -779,6 +835,393 @@ class ResolutionEngine:
         )
 
 
+class ResolutionEngine(BaseResolutionEngine):
+    def __init__(self, settings: ResolverSettings) -> None:
+        super().__init__(settings)
+        self.client = HttpClient(settings, self.cache)
+        self.scraper = FallbackScraper(self.client)
+        # Probe threads are created on demand and reused for the engine's lifetime.
+        self._probe_executor = ThreadPoolExecutor(
+            max_workers=max(
+                PROBE_POOL_SIZE, settings.validation_concurrency, settings.release_probe_concurrency
+            ),
+            thread_name_prefix="purl2repo-probe",
+        )
+
+    def close(self) -> None:
+        self._probe_executor.shutdown(wait=False, cancel_futures=True)
+        for adapter in self._adapters.values():
+            adapter.close()
+        self.client.close()
+        if self.cache:
+            self.cache.close()
+
+    def resolve(self, purl: str, *, include_release: bool = True) -> ResolutionResult:
+        parsed = self.parse(purl)
+        key = self._result_cache_key(parsed, include_release=include_release)
+        cached = self._cached_result(key, parsed)
+        if cached is not None:
+            return cached
+        with served_stale_responses() as stale, inconclusive_steps() as inconclusive:
+            result = self._resolve_parsed(parsed, include_release=include_release)
+        if stale:
+            # Results built from stale metadata are not memoized.
+            return self._with_stale_evidence(result, stale)
+        self._store_result(key, result, inconclusive)
+        return result
+
+    def _resolve_parsed(self, parsed: ParsedPurl, *, include_release: bool) -> ResolutionResult:
+        if parsed.type in DIRECT_HOST_TYPES:
+            return self._resolve_direct_host(parsed, include_release=include_release)
+        if parsed.type in ARTIFACT_HUB_TYPES:
+            return self._resolve_artifact_hub(parsed, include_release=include_release)
+        if parsed.type in GENERIC_TYPES:
+            return self._resolve_generic(parsed, include_release=include_release)
+
+        target = self._plan_registry(parsed)
+        try:
+            self._record_metadata(target, self._fetch_metadata(target.adapter, parsed))
+        except MetadataFetchError as exc:
+            if self.settings.strict:
+                raise
+            stopped = self._recover_metadata(target, exc)
+            if stopped is not None:
+                return stopped
+
+        target.candidates = self._validate_repository_candidates(
+            self._extracted_candidates(target), target.warnings, target.evidence
+        )
+        if self._wants_deps_dev(target):
+            deps_candidates = self._record_deps_dev(
+                target, fetch_deps_dev_candidates(parsed, self.client)
+            )
+            if deps_candidates:
+                target.candidates = self._validate_repository_candidates(
+                    self._rescored_candidates(target, deps_candidates),
+                    target.warnings,
+                    target.evidence,
+                )
+        if self._wants_scrape(target):
+            try:
+                scraped = self.scraper.scrape(parsed, self._scrape_pages(target))
+            except MetadataFetchError:
+                if self.settings.strict:
+                    raise
+                scraped = self._scrape_failed(target)
+            scrape_candidates = self._scraped_repository_candidates(target, scraped)
+            if scrape_candidates:
+                target.candidates = self._validate_repository_candidates(
+                    self._rescored_candidates(target, scrape_candidates),
+                    target.warnings,
+                    target.evidence,
+                )
+        best, confidence = self._select_best(target)
+
+        release_link = None
+        if include_release and self._wants_release(target):
+            release_link = self._resolve_release_link(
+                adapter=target.adapter,
+                parsed=parsed,
+                repository=best,
+                metadata=target.metadata,
+                host_adapter=self._host_adapter(best.host if best else ""),
+                warnings=target.warnings,
+                evidence=target.evidence,
+            )
+            self._record_release(target, best, release_link)
+        return self._repository_result(target, best, confidence, release_link)
+
+    def resolve_repository(self, purl: str) -> ResolutionResult:
+        return self.resolve(purl, include_release=False)
+
+    def resolve_release(self, purl: str) -> ResolutionResult:
+        result = self.resolve(purl, include_release=True)
+        if self.settings.strict and result.release_link is None:
+            raise NoReleaseFoundError(f"No release link found for {purl}")
+        return result
+
+    def resolve_many(
+        self,
+        purls: Iterable[str],
+        *,
+        max_workers: int | None = None,
+        ordered: bool = True,
+    ) -> Iterator[ResolutionResult | tuple[int, ResolutionResult]]:
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be greater than zero")
+        for index, result in self._resolve_indexed(purls, max_workers, ordered=ordered):
+            yield result if ordered else (index, result)
+
+    def _resolve_indexed(
+        self, purls: Iterable[str], max_workers: int | None, *, ordered: bool
+    ) -> Iterator[tuple[int, ResolutionResult]]:
+        if max_workers is None or max_workers == 1:
+            for index, purl in enumerate(purls):
+                yield index, self.resolve(purl)
+            return
+
+        # Workers share this engine so TLS sessions, keep-alive connections, and the
+        # response cache stay warm across the whole batch. PURLs are pulled from the
+        # input only as window slots free up, so memory stays bounded for any input.
+        window = max_workers * RESOLVE_MANY_WINDOW_PER_WORKER
+        source = enumerate(purls)
+        in_flight: dict[Future[ResolutionResult], int] = {}
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            while True:
+                for index, purl in islice(source, window - len(in_flight)):
+                    in_flight[executor.submit(self.resolve, purl)] = index
+                if not in_flight:
+                    return
+                if ordered:
+                    done: Iterable[Future[ResolutionResult]] = [next(iter(in_flight))]
+                else:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield in_flight.pop(future), future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _fetch_metadata(self, adapter: EcosystemResolver, parsed: ParsedPurl) -> Metadata:
+        key = self._distilled_metadata_key(parsed)
+        if key is None:
+            return adapter.fetch_metadata(parsed, self.client)
+        cached = self._cached_distilled_metadata(key)
+        if cached is not None:
+            return cached
+        with response_cache_writes_disabled(), requested_ttls() as ttls:
+            metadata = adapter.fetch_metadata(parsed, self.client)
+        return self._store_distilled_metadata(adapter, parsed, key, metadata, ttls)
+
+    def _resolve_direct_host(
+        self, parsed: ParsedPurl, *, include_release: bool
+    ) -> ResolutionResult:
+        target = self._plan_direct_host(parsed)
+        if isinstance(target, ResolutionResult):
+            return target
+        release_link = None
+        if include_release:
+            release_link = self._direct_release_link(target)
+        return self._direct_result(target, release_link)
+
+    def _resolve_artifact_hub(
+        self, parsed: ParsedPurl, *, include_release: bool
+    ) -> ResolutionResult:
+        if parsed.type == "huggingface":
+            return self._resolve_huggingface(parsed, include_release=include_release)
+        return self._resolve_mlflow(parsed, include_release=include_release)
+
+    def _resolve_huggingface(
+        self, parsed: ParsedPurl, *, include_release: bool
+    ) -> ResolutionResult:
+        target = self._plan_huggingface(parsed)
+        release_link = None
+        if include_release:
+            if parsed.version:
+                revision_url = f"{target.repository.url}/tree/{parsed.version}"
+                try:
+                    exists = self.client.url_exists(revision_url)
+                except MetadataFetchError:
+                    if self.settings.strict:
+                        raise
+                    self._huggingface_revision_unverifiable(target)
+                else:
+                    release_link = self._record_huggingface_revision(target, revision_url, exists)
+            else:
+                target.warnings.append(evidence_messages.skipped_release_no_version())
+                target.evidence.append(evidence_messages.skipped_release_no_version())
+        return self._direct_result(target, release_link)
+
+    def _resolve_mlflow(self, parsed: ParsedPurl, *, include_release: bool) -> ResolutionResult:
+        target = self._plan_mlflow(parsed)
+        if isinstance(target, ResolutionResult):
+            return target
+        release_link = self._mlflow_release_link(target) if include_release else None
+        return self._direct_result(target, release_link)
+
+    def _resolve_generic(self, parsed: ParsedPurl, *, include_release: bool) -> ResolutionResult:
+        target = self._plan_generic(parsed)
+        if isinstance(target, ResolutionResult):
+            return target
+        release_link = None
+        if include_release:
+            if parsed.version and target.repository.kind == "vcs":
+                release_link = self._direct_release_link(target)
+            elif not parsed.version:
+                target.warnings.append(evidence_messages.skipped_release_no_version())
+                target.evidence.append(evidence_messages.skipped_release_no_version())
+        return self._direct_result(target, release_link)
+
+    def _resolve_release_link(
+        self,
+        *,
+        adapter: EcosystemResolver,
+        parsed: ParsedPurl,
+        repository: RepositoryCandidate | None,
+        metadata: Metadata,
+        host_adapter: HostAdapter | None,
+        warnings: list[str],
+        evidence: list[str],
+    ) -> ReleaseLink | None:
+        if host_adapter is None or not parsed.version:
+            return None
+        if not self.settings.verify_release_links:
+            return adapter.resolve_release_link(parsed, repository, metadata, host_adapter)
+
+        if repository is None:
+            return None
+        return self._verify_release_candidates(
+            host_adapter.candidate_release_links(repository.normalized_url, parsed.version),
+            warnings,
+            evidence,
+        )
+
+    def _direct_release_link(self, target: DirectTarget) -> ReleaseLink | None:
+        parsed = target.parsed
+        if not parsed.version:
+            target.warnings.append(evidence_messages.skipped_release_no_version())
+            target.evidence.append(evidence_messages.skipped_release_no_version())
+            return None
+        host_adapter = self._host_adapter(target.candidate.host)
+        if host_adapter is None:
+            return None
+        if self.settings.verify_release_links:
+            return self._verify_release_candidates(
+                host_adapter.candidate_release_links(
+                    target.candidate.normalized_url, parsed.version
+                ),
+                target.warnings,
+                target.evidence,
+            )
+        return host_adapter.infer_release_link(target.candidate.normalized_url, parsed.version)
+
+    def _verify_release_candidates(
+        self,
+        candidates: list[ReleaseLink],
+        warnings: list[str],
+        evidence: list[str],
+    ) -> ReleaseLink | None:
+        verified: ReleaseLink | None = None
+        outcomes = self._probe_outcomes(
+            [candidate.url for candidate in candidates],
+            concurrency=self.settings.release_probe_concurrency,
+            ttl_seconds=RELEASE_TTL_SECONDS,
+        )
+        try:
+            for candidate, outcome in zip(candidates, outcomes, strict=False):
+                if isinstance(outcome, MetadataFetchError):
+                    if self.settings.strict:
+                        raise outcome
+                    self._release_verification_failed(warnings)
+                    return None
+                if outcome:
+                    verified = candidate
+                    break
+        finally:
+            outcomes.close()
+        return self._record_release_verification(verified, warnings, evidence)
+
+    def _direct_result(
+        self, target: DirectTarget, release_link: ReleaseLink | None
+    ) -> ResolutionResult:
+        if release_link:
+            target.evidence.append(evidence_messages.resolved_release())
+        if not self._repository_url_is_valid(
+            target.repository.url, target.warnings, target.evidence
+        ):
+            return self._direct_invalid(target)
+        return self._direct_success(target, release_link)
+
+    def _validate_repository_candidates(
+        self,
+        candidates: list[RepositoryCandidate],
+        warnings: list[str],
+        evidence: list[str],
+    ) -> list[RepositoryCandidate]:
+        if not candidates or self._validation_skipped(evidence):
+            return candidates
+        validated: list[RepositoryCandidate] = []
+        outcomes = self._probe_outcomes(
+            [candidate.normalized_url for candidate in candidates],
+            concurrency=self.settings.validation_concurrency,
+            ttl_seconds=REPOSITORY_TTL_SECONDS,
+        )
+        try:
+            for index, outcome in enumerate(outcomes):
+                kept = self._apply_validation_outcome(
+                    candidates[index], outcome, warnings, evidence
+                )
+                if kept is not None:
+                    validated.append(kept)
+                if self._validation_short_circuits(index, outcome):
+                    validated.extend(self._skip_validation(candidates[1:], evidence))
+                    break
+        finally:
+            outcomes.close()
+        return validated
+
+    def _probe_outcomes(
+        self, urls: list[str], *, concurrency: int, ttl_seconds: int
+    ) -> Generator[bool | MetadataFetchError, None, None]:
+        """Yield ``url_exists`` outcomes in input order, probing up to ``concurrency`` at once.
+
+        Probes are submitted to the engine's shared pool only as earlier outcomes are
+        consumed, so closing the generator early never starts the remaining probes.
+        """
+
+        if min(concurrency, len(urls)) <= 1:
+            for url in urls:
+                yield self._probe_url(url, ttl_seconds)
+            return
+        pending = iter(urls)
+        futures: deque[Future[bool | MetadataFetchError]] = deque()
+        try:
+            for url in islice(pending, concurrency):
+                futures.append(self._submit_probe(url, ttl_seconds))
+            while futures:
+                yield futures.popleft().result()
+                for url in islice(pending, 1):
+                    futures.append(self._submit_probe(url, ttl_seconds))
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _submit_probe(self, url: str, ttl_seconds: int) -> Future[bool | MetadataFetchError]:
+        return self._probe_executor.submit(copy_context().run, self._probe_url, url, ttl_seconds)
+
+    def _probe_url(self, url: str, ttl_seconds: int) -> bool | MetadataFetchError:
+        try:
+            return self.client.url_exists(url, ttl_seconds=ttl_seconds)
+        except MetadataFetchError as exc:
+            return exc
+
+    def _repository_url_is_valid(
+        self,
+        url: str,
+        warnings: list[str],
+        evidence: list[str],
+    ) -> bool:
+        if self._validation_skipped(evidence):
+            return True
+        try:
+            exists = self.client.url_exists(url, ttl_seconds=REPOSITORY_TTL_SECONDS)
+        except MetadataFetchError:
+            if self.settings.strict:
+                raise
+            self._validation_inconclusive(url, warnings)
+            return True
+        return self._record_url_validation(url, exists, warnings, evidence)
+
+
+def _qualified_name(value: object) -> str:
+    # Callable settings (Go import rules) enter the result cache key by name.
+    return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', repr(value))}"
+
+
+def _top_confidence(candidates: list[RepositoryCandidate]) -> str:
+    return confidence_from_score(candidates[0].score if candidates else 0.0)
+
+
 def _repository_kind_for_candidate(candidate: RepositoryCandidate) -> str:
     if candidate.repository_type in {"github", "gitlab", "bitbucket", "generic_git"}:
         return "source_code"
@@ -5,6 +5,14 @@ def fetched(source: str) -> str:
     return f"Fetched package metadata from {source}"
 
 
+def reused_cached_result() -> str:
+    return "Reused cached resolution result"
+
+
+def used_stale_metadata(url: str) -> str:
+    return f"Used stale cached metadata from {url}"
+
+
 def selected_candidate() -> str:
     return "Selected highest scoring repository candidate"
 
@@ -6,6 +6,7 @@ from html.parser import HTMLParser
 from urllib.parse import urljoin, urlsplit
 
 from purl2repo.ecosystems.base import Metadata
+from purl2repo.http.async_client import AsyncHttpClient
 from purl2repo.http.client import HttpClient
 from purl2repo.models import ParsedPurl, RepositoryCandidate, ScrapedCandidate
 from purl2repo.utils.text import normalize_label
@@ -62,32 +63,54 @@ class FallbackScraper:
 
         scraped: list[ScrapedCandidate] = []
         for page in _dedupe_pages(pages)[: self.max_pages]:
-            html = self.client.get_text(page)
-            parser = _AnchorParser(page)
-            parser.feed(html)
-            for url, label in parser.links:
-                normalized = normalize_repo_url(url)
-                if not normalized or normalized == page.rstrip("/"):
-                    continue
-                if not _looks_like_scraped_repo_candidate(url, normalized, label):
-                    continue
-                scraped.append(
-                    ScrapedCandidate(
-                        url=url,
-                        normalized_url=normalized,
-                        source_page=page,
-                        extraction_method="html_anchor",
-                        label_context=label,
-                        score_cap=SCRAPE_SCORE_CAP,
-                        reasons=[
-                            f"Scraped repository-like link from {page}",
-                            _label_reason(label),
-                        ],
-                    )
-                )
+            scraped.extend(_scrape_page(page, self.client.get_text(page)))
         return _dedupe_scraped(scraped)
 
 
+class AsyncFallbackScraper:
+    """asyncio counterpart of :class:`FallbackScraper`."""
+
+    def __init__(self, client: AsyncHttpClient, max_pages: int = MAX_SCRAPE_PAGES) -> None:
+        self.client = client
+        self.max_pages = max_pages
+
+    async def scrape(self, parsed: ParsedPurl, pages: list[str]) -> list[ScrapedCandidate]:
+        if not should_scrape_purl(parsed):
+            return []
+
+        scraped: list[ScrapedCandidate] = []
+        for page in _dedupe_pages(pages)[: self.max_pages]:
+            scraped.extend(_scrape_page(page, await self.client.get_text(page)))
+        return _dedupe_scraped(scraped)
+
+
+def _scrape_page(page: str, html: str) -> list[ScrapedCandidate]:
+    parser = _AnchorParser(page)
+    parser.feed(html)
+    scraped: list[ScrapedCandidate] = []
+    for url, label in parser.links:
+        normalized = normalize_repo_url(url)
+        if not normalized or normalized == page.rstrip("/"):
+            continue
+        if not _looks_like_scraped_repo_candidate(url, normalized, label):
+            continue
+        scraped.append(
+            ScrapedCandidate(
+                url=url,
+                normalized_url=normalized,
+                source_page=page,
+                extraction_method="html_anchor",
+                label_context=label,
+                score_cap=SCRAPE_SCORE_CAP,
+                reasons=[
+                    f"Scraped repository-like link from {page}",
+                    _label_reason(label),
+                ],
+            )
+        )
+    return scraped
+
+
 def should_scrape_purl(parsed: ParsedPurl) -> bool:
     return parsed.type not in DIRECT_HOST_PURL_TYPES | NO_UPSTREAM_SCRAPE_TYPES
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -19,6 +20,7 @@ class FakeHttpClient:
     ):
         self.json_payloads = json_payloads or {}
         self.text_payloads = text_payloads or {}
+        self.summaries: dict[str, dict[str, Any]] = {}
 
     def get_json(self, url: str, *, ttl_seconds: int = 3600) -> dict[str, Any]:
         _ = ttl_seconds
@@ -28,12 +30,36 @@ class FakeHttpClient:
             raise AssertionError(f"Unexpected JSON URL: {url}")
         return self.json_payloads[url]
 
+    def get_json_fields(
+        self, url: str, paths: tuple[tuple[str, ...], ...], *, ttl_seconds: int = 3600
+    ) -> dict[str, Any]:
+        _ = paths
+        return self.get_json(url, ttl_seconds=ttl_seconds)
+
     def get_text(self, url: str, *, ttl_seconds: int = 3600) -> str:
         _ = ttl_seconds
         if url not in self.text_payloads:
             raise AssertionError(f"Unexpected text URL: {url}")
         return self.text_payloads[url]
 
+    def get_parsed_text(
+        self,
+        url: str,
+        key: str,
+        parse: Callable[[str], dict[str, Any]],
+        *,
+        ttl_seconds: int = 3600,
+    ) -> dict[str, Any]:
+        _ = key
+        return parse(self.get_text(url, ttl_seconds=ttl_seconds))
+
+    def cached_summary(self, key: str, url: str) -> dict[str, Any] | None:
+        _ = url
+        return self.summaries.get(key)
+
+    def store_summary(self, key: str, value: dict[str, Any]) -> None:
+        self.summaries[key] = value
+
     def url_exists(self, url: str, *, ttl_seconds: int = 900) -> bool:
         _ = ttl_seconds
         if "missing" in url or "404" in url:
@@ -66,6 +92,46 @@ class FakeHttpClient:
         return None
 
 
+class FakeAsyncHttpClient:
+    """Awaitable facade over :class:`FakeHttpClient` for the asyncio engine."""
+
+    def __init__(self, sync_client: FakeHttpClient):
+        self.sync_client = sync_client
+
+    async def get_json(self, url: str, *, ttl_seconds: int = 3600) -> dict[str, Any]:
+        return self.sync_client.get_json(url, ttl_seconds=ttl_seconds)
+
+    async def get_json_fields(
+        self, url: str, paths: tuple[tuple[str, ...], ...], *, ttl_seconds: int = 3600
+    ) -> dict[str, Any]:
+        return self.sync_client.get_json_fields(url, paths, ttl_seconds=ttl_seconds)
+
+    async def get_text(self, url: str, *, ttl_seconds: int = 3600) -> str:
+        return self.sync_client.get_text(url, ttl_seconds=ttl_seconds)
+
+    async def get_parsed_text(
+        self,
+        url: str,
+        key: str,
+        parse: Callable[[str], dict[str, Any]],
+        *,
+        ttl_seconds: int = 3600,
+    ) -> dict[str, Any]:
+        return self.sync_client.get_parsed_text(url, key, parse, ttl_seconds=ttl_seconds)
+
+    def cached_summary(self, key: str, url: str) -> dict[str, Any] | None:
+        return self.sync_client.cached_summary(key, url)
+
+    def store_summary(self, key: str, value: dict[str, Any]) -> None:
+        self.sync_client.store_summary(key, value)
+
+    async def url_exists(self, url: str, *, ttl_seconds: int = 900) -> bool:
+        return self.sync_client.url_exists(url, ttl_seconds=ttl_seconds)
+
+    async def aclose(self) -> None:
+        return None
+
+
 def load_json(relative: str) -> dict[str, Any]:
     return json.loads((FIXTURES / relative).read_text(encoding="utf-8"))
 
@@ -85,3 +151,19 @@ def fake_http_factory(monkeypatch: pytest.MonkeyPatch):
         return fake
 
     return install
+
+
+@pytest.fixture
+def fake_async_http_factory(monkeypatch: pytest.MonkeyPatch):
+    def install(
+        json_payloads: dict[str, dict[str, Any]] | None = None,
+        text_payloads: dict[str, str] | None = None,
+    ) -> FakeHttpClient:
+        fake = FakeHttpClient(json_payloads, text_payloads)
+        monkeypatch.setattr(
+            "purl2repo.resolution.async_engine.AsyncHttpClient",
+            lambda settings, cache: FakeAsyncHttpClient(fake),
+        )
+        return fake
+
+    return install
@@ -1,8 +1,22 @@
-import pytest
-from tests.conftest import load_json, load_text
+import itertools
+import threading
+import time
 
-from purl2repo import Resolver, parse_purl, resolve, resolve_release, resolve_repository
+import httpx
+import pytest
+from tests.conftest import FakeHttpClient, load_json, load_text
+
+from purl2repo import (
+    Resolver,
+    RetryPolicy,
+    TtlRule,
+    parse_purl,
+    resolve,
+    resolve_release,
+    resolve_repository,
+)
 from purl2repo.errors import MetadataFetchError, NoReleaseFoundError, UnsupportedEcosystemError
+from purl2repo.http.ttl import IMMUTABLE_TTL_SECONDS
 from purl2repo.resolution.engine import ResolutionEngine
 
 
@@ -110,7 +124,7 @@ def test_pypi_version_metadata_falls_back_to_project_metadata(fake_http_factory)
 def test_resolve_npm_cargo_and_maven_with_fixtures(fake_http_factory):
     fake_http_factory(
         {
-            "https://registry.npmjs.org/react": load_json("npm/react.json"),
+            "https://registry.npmjs.org/react/18.2.0": load_json("npm/react-18.2.0.json"),
             "https://crates.io/api/v1/crates/rand": load_json("cargo/rand.json"),
         },
         {
@@ -160,6 +174,75 @@ def test_resolve_many_parallel_preserves_order():
     assert all(result.repository_validation_status == "skipped" for result in results)
 
 
+def test_resolve_many_parallel_shares_engine_client(monkeypatch):
+    created = []
+
+    class CountingClient(FakeHttpClient):
+        def __init__(self, settings, cache):
+            super().__init__(
+                {"https://pypi.org/pypi/requests/json": load_json("pypi/requests.json")}
+            )
+            self.cache = cache
+            created.append(self)
+
+    monkeypatch.setattr("purl2repo.resolution.engine.HttpClient", CountingClient)
+
+    with Resolver() as resolver:
+        results = list(resolver.resolve_many(["pkg:pypi/requests"] * 6, max_workers=3))
+
+    assert len(created) == 1
+    assert created[0].cache is resolver._engine.cache
+    assert all(result.repository_url == "https://github.com/psf/requests" for result in results)
+
+
+def test_resolve_many_pulls_input_lazily_within_window():
+    pulled = []
+
+    def source():
+        for index in itertools.count():
+            pulled.append(index)
+            yield f"pkg:github/org/repo{index}"
+
+    with Resolver(no_network=True) as resolver:
+        results = resolver.resolve_many(source(), max_workers=2)
+        first = next(results)
+        pulled_at_first = len(pulled)
+        rest = list(itertools.islice(results, 9))
+        results.close()
+
+    assert first.purl.raw == "pkg:github/org/repo0"
+    assert pulled_at_first == 4
+    assert [result.purl.raw for result in rest] == [
+        f"pkg:github/org/repo{index}" for index in range(1, 10)
+    ]
+    assert len(pulled) <= 14
+
+
+def test_resolve_many_unordered_yields_in_completion_order(monkeypatch):
+    release_first = threading.Event()
+
+    class SlowFirstClient(FakeHttpClient):
+        def url_exists(self, url, *, ttl_seconds=900):
+            if url.endswith("/repo0"):
+                release_first.wait(5)
+            return super().url_exists(url, ttl_seconds=ttl_seconds)
+
+    monkeypatch.setattr(
+        "purl2repo.resolution.engine.HttpClient", lambda settings, cache: SlowFirstClient()
+    )
+    purls = [f"pkg:github/org/repo{index}" for index in range(6)]
+
+    with Resolver() as resolver:
+        pairs = []
+        for index, result in resolver.resolve_many(purls, max_workers=3, ordered=False):
+            pairs.append((index, result.purl.raw))
+            if len(pairs) == len(purls) - 1:
+                release_first.set()
+
+    assert pairs[-1] == (0, purls[0])
+    assert sorted(pairs) == list(enumerate(purls))
+
+
 def test_resolve_many_rejects_invalid_worker_count():
     with Resolver(no_network=True) as resolver, pytest.raises(ValueError):
         list(resolver.resolve_many(["pkg:github/package-url/purl-spec"], max_workers=0))
@@ -193,3 +276,292 @@ def parse_settings():
     from purl2repo.models import ResolverSettings
 
     return ResolverSettings()
+
+
+def test_distilled_metadata_cache_skips_registry_documents():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        return httpx.Response(200, json=load_json("npm/react-18.2.0.json"))
+
+    with Resolver(validate_repositories=False, cache_distilled_metadata=True) as resolver:
+        resolver._engine.client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        first = resolver.resolve_repository("pkg:npm/react@18.2.0")
+        second = resolver.resolve_repository("pkg:npm/react@18.2.0")
+        cache = resolver._engine.cache
+
+    assert requests == ["https://registry.npmjs.org/react/18.2.0"]
+    assert first.to_dict() == second.to_dict()
+    assert first.repository_url == "https://github.com/facebook/react"
+    assert cache.get("https://registry.npmjs.org/react/18.2.0", 3600) is None
+    distilled = cache.get("metadata:npm::react:18.2.0", 3600)
+    assert "name" not in distilled["metadata"]
+    # The version document is immutable under the default TTL rules, and so is its distillate.
+    assert distilled["ttl_seconds"] == IMMUTABLE_TTL_SECONDS
+
+
+def test_distilled_metadata_expires_with_the_shortest_source_ttl():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        return httpx.Response(200, json=load_json("npm/react-18.2.0.json"))
+
+    rule = TtlRule("npm-short", r"https://registry\.npmjs\.org/react/.*", 60)
+    with Resolver(
+        validate_repositories=False, cache_distilled_metadata=True, ttl_rules=[rule]
+    ) as resolver:
+        resolver._engine.client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        resolver.resolve_repository("pkg:npm/react@18.2.0")
+        cache = resolver._engine.cache
+        key = "metadata:npm::react:18.2.0"
+        stored_at, value = cache.get_entry(key)
+        assert value["ttl_seconds"] == 60
+        cache._memory[key] = (stored_at - 61, value, 0)
+        resolver.resolve_repository("pkg:npm/react@18.2.0")
+
+    assert requests == ["https://registry.npmjs.org/react/18.2.0"] * 2
+
+
+def test_stale_if_error_serves_expired_metadata_with_evidence(monkeypatch):
+    registry_up = [True]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if registry_up[0]:
+            return httpx.Response(200, json=load_json("npm/react.json"))
+        return httpx.Response(503)
+
+    with Resolver(
+        validate_repositories=False,
+        stale_if_error_seconds=86400,
+        retry_policy=RetryPolicy(max_attempts=1),
+    ) as resolver:
+        resolver._engine.client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        fresh = resolver.resolve_repository("pkg:npm/react")
+        registry_up[0] = False
+        later = time.time() + 7200
+        monkeypatch.setattr("purl2repo.resolution.cache.time.time", lambda: later)
+        stale = resolver.resolve_repository("pkg:npm/react")
+
+    assert stale.repository_url == fresh.repository_url
+    assert "Used stale cached metadata from https://registry.npmjs.org/react" in stale.evidence
+    assert not any("stale" in line for line in fresh.evidence)
+
+
+def test_result_cache_reuses_results_per_canonical_purl_and_settings(fake_http_factory, tmp_path):
+    fake = fake_http_factory(
+        {"https://pypi.org/pypi/requests/2.31.0/json": load_json("pypi/requests.json")}
+    )
+    with Resolver(result_cache_ttl_seconds=3600, cache_dir=str(tmp_path)) as resolver:
+        first = resolver.resolve("pkg:pypi/requests@2.31.0")
+        fake.json_payloads.clear()
+        second = resolver.resolve("pkg:pypi/Requests@2.31.0")
+        with pytest.raises(AssertionError, match="Unexpected JSON URL"):
+            resolver.resolve_repository("pkg:pypi/requests@2.31.0")
+
+    with Resolver(result_cache_ttl_seconds=3600, cache_dir=str(tmp_path)) as reopened:
+        from_disk = reopened.resolve("pkg:pypi/requests@2.31.0")
+
+    assert "result-cache" not in first.metadata_sources
+    assert second.metadata_sources == [*first.metadata_sources, "result-cache"]
+    assert second.evidence[-1] == "Reused cached resolution result"
+    assert second.purl.raw == "pkg:pypi/Requests@2.31.0"
+    assert second.release_link == first.release_link
+    assert from_disk.repository_candidates == first.repository_candidates
+
+
+def test_result_cache_key_covers_go_settings(fake_http_factory, tmp_path):
+    proxy_url = "https://proxy.golang.org/github.com/acme/widget/@latest"
+    fake = fake_http_factory({proxy_url: {"Version": "v1.0.0"}})
+    options = {"result_cache_ttl_seconds": 3600, "cache_dir": str(tmp_path)}
+    with Resolver(**options) as resolver:
+        resolver.resolve_repository("pkg:golang/github.com/acme/widget")
+    fake.json_payloads.clear()
+
+    with Resolver(**options) as same:
+        cached = same.resolve_repository("pkg:golang/github.com/acme/widget")
+    with (
+        Resolver(**options, go_proxy_roots=(str(tmp_path / "mirror"),)) as other_roots,
+        pytest.raises(AssertionError, match="Unexpected JSON URL"),
+    ):
+        other_roots.resolve_repository("pkg:golang/github.com/acme/widget")
+    with (
+        Resolver(**options, go_import_timeout_seconds=None) as unbounded,
+        pytest.raises(AssertionError, match="Unexpected JSON URL"),
+    ):
+        unbounded.resolve_repository("pkg:golang/github.com/acme/widget")
+
+    assert "result-cache" in cached.metadata_sources
+
+
+def test_result_cache_skips_failed_resolutions():
+    with Resolver(result_cache_ttl_seconds=3600, no_network=True) as resolver:
+        resolver.resolve("pkg:pypi/requests")
+        assert resolver.cache_stats().entries == 0
+
+
+def test_result_cache_skips_only_resolutions_with_inconclusive_requests(fake_http_factory):
+    fake = fake_http_factory(
+        {
+            "https://pypi.org/pypi/failed/json": {
+                "info": {
+                    "project_urls": {
+                        "Source": "https://github.com/org/failed",
+                        "Repository": "https://gitlab.com/org/failed-missing",
+                    }
+                }
+            }
+        }
+    )
+    reachable = fake.url_exists
+
+    def unreachable(url, *, ttl_seconds=900):
+        raise MetadataFetchError(f"Failed to verify URL {url}")
+
+    fake.url_exists = unreachable
+    with Resolver(result_cache_ttl_seconds=3600, use_deps_dev_fallback=False) as resolver:
+        inconclusive = resolver.resolve_repository("pkg:pypi/failed")
+        assert resolver.cache_stats().entries == 0
+
+        fake.url_exists = reachable
+        validated = resolver.resolve_repository("pkg:pypi/failed")
+        assert resolver.cache_stats().entries == 1
+
+    assert inconclusive.repository_validation_status == "inconclusive"
+    # A discarded candidate is a definitive answer, whatever its warning happens to say.
+    assert validated.warnings == [
+        "Repository URL did not validate and was discarded: https://gitlab.com/org/failed-missing"
+    ]
+
+
+MULTI_CANDIDATE_METADATA = {
+    "info": {
+        "project_urls": {
+            "Source": "https://github.com/org/demo",
+            "Repository": "https://gitlab.com/org/demo-missing",
+            "Code": "https://bitbucket.org/org/demo",
+        }
+    }
+}
+
+
+def test_repository_candidates_validate_concurrently_in_stable_order(monkeypatch):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    class SlowClient(FakeHttpClient):
+        def url_exists(self, url, *, ttl_seconds=900):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return super().url_exists(url, ttl_seconds=ttl_seconds)
+
+    monkeypatch.setattr(
+        "purl2repo.resolution.engine.HttpClient",
+        lambda settings, cache: SlowClient(
+            {"https://pypi.org/pypi/demo/json": MULTI_CANDIDATE_METADATA}
+        ),
+    )
+    with Resolver(validation_concurrency=2) as resolver:
+        result = resolver.resolve_repository("pkg:pypi/demo")
+    with Resolver(validation_concurrency=1) as resolver:
+        sequential = resolver.resolve_repository("pkg:pypi/demo")
+
+    assert peak == 2
+    assert result.to_dict() == sequential.to_dict()
+    assert [candidate.normalized_url for candidate in result.repository_candidates] == [
+        "https://bitbucket.org/org/demo",
+        "https://github.com/org/demo",
+    ]
+
+
+def test_repository_validation_short_circuits_after_top_candidate(monkeypatch):
+    checked = []
+
+    class RecordingClient(FakeHttpClient):
+        def url_exists(self, url, *, ttl_seconds=900):
+            checked.append(url)
+            return super().url_exists(url, ttl_seconds=ttl_seconds)
+
+    monkeypatch.setattr(
+        "purl2repo.resolution.engine.HttpClient",
+        lambda settings, cache: RecordingClient(
+            {"https://pypi.org/pypi/demo/json": MULTI_CANDIDATE_METADATA}
+        ),
+    )
+    with Resolver(validation_concurrency=1, validation_short_circuit=True) as resolver:
+        result = resolver.resolve_repository("pkg:pypi/demo")
+
+    assert checked == ["https://bitbucket.org/org/demo"]
+    assert result.repository_url == "https://bitbucket.org/org/demo"
+    assert len(result.repository_candidates) == 3
+    assert (
+        "Skipped validation of 2 lower-scoring candidate(s) after the top candidate validated"
+        in result.evidence
+    )
+    with pytest.raises(ValueError, match="validation_concurrency"):
+        Resolver(validation_concurrency=0)
+
+
+def test_concurrent_validation_short_circuit_never_submits_skipped_probes(monkeypatch):
+    checked = []
+
+    class RecordingClient(FakeHttpClient):
+        def url_exists(self, url, *, ttl_seconds=900):
+            checked.append(url)
+            return super().url_exists(url, ttl_seconds=ttl_seconds)
+
+    monkeypatch.setattr(
+        "purl2repo.resolution.engine.HttpClient",
+        lambda settings, cache: RecordingClient(
+            {"https://pypi.org/pypi/demo/json": MULTI_CANDIDATE_METADATA}
+        ),
+    )
+    with Resolver(validation_concurrency=2, validation_short_circuit=True) as resolver:
+        executor = resolver._engine._probe_executor
+        result = resolver.resolve_repository("pkg:pypi/demo")
+        resolver.resolve_repository("pkg:pypi/demo")
+        assert resolver._engine._probe_executor is executor
+
+    # The second candidate may be cancelled before it starts; the third is never submitted.
+    assert checked.count("https://bitbucket.org/org/demo") == 2
+    assert "https://gitlab.com/org/demo-missing" not in checked
+    assert result.repository_url == "https://bitbucket.org/org/demo"
+
+
+def test_concurrent_release_probing_keeps_preference_and_cancels_pending(monkeypatch):
+    delays = {
+        "https://github.com/org/demo/releases/tag/1.0": (0.02, False),
+        "https://github.com/org/demo/releases/tag/v1.0": (0.04, True),
+    }
+    checked = []
+
+    class ProbeClient(FakeHttpClient):
+        def url_exists(self, url, *, ttl_seconds=900):
+            checked.append(url)
+            delay, exists = delays.get(
+                url, (0.3 if "/tags/" in url or "/tree/" in url else 0, True)
+            )
+            time.sleep(delay)
+            return exists
+
+    monkeypatch.setattr(
+        "purl2repo.resolution.engine.HttpClient", lambda settings, cache: ProbeClient()
+    )
+    started = time.perf_counter()
+    with Resolver(verify_release_links=True, release_probe_concurrency=2) as resolver:
+        result = resolver.resolve_release("pkg:github/org/demo@1.0")
+    elapsed = time.perf_counter() - started
+
+    assert result.release_link is not None
+    assert result.release_link.url == "https://github.com/org/demo/releases/tag/v1.0"
+    assert elapsed < 0.3
+    assert not any("/tree/" in url for url in checked)
+    with pytest.raises(ValueError, match="release_probe_concurrency"):
+        Resolver(release_probe_concurrency=0)
@@ -34,6 +34,54 @@ def test_top_level_kwargs_validation():
         resolve_repository("pkg:pypi/requests", use_scraper_fallback="yes")
     with pytest.raises(TypeError, match="user_agent"):
         resolve_repository("pkg:pypi/requests", user_agent=1)
+    with pytest.raises(TypeError, match="max_connections"):
+        resolve_repository("pkg:pypi/requests", max_connections="many")
+    with pytest.raises(TypeError, match="max_keepalive_connections"):
+        resolve_repository("pkg:pypi/requests", max_keepalive_connections=None)
+    with pytest.raises(TypeError, match="cache_backend"):
+        resolve_repository("pkg:pypi/requests", cache_backend=None)
+    with pytest.raises(TypeError, match="cache_max_bytes"):
+        resolve_repository("pkg:pypi/requests", cache_max_bytes="1mb")
+    with pytest.raises(TypeError, match="cache_max_age_seconds"):
+        resolve_repository("pkg:pypi/requests", cache_max_age_seconds=1.5)
+    with pytest.raises(TypeError, match="memory_cache_max_entries"):
+        resolve_repository("pkg:pypi/requests", memory_cache_max_entries="10")
+    with pytest.raises(TypeError, match="memory_cache_max_bytes"):
+        resolve_repository("pkg:pypi/requests", memory_cache_max_bytes=1.0)
+    with pytest.raises(TypeError, match="cache_distilled_metadata"):
+        resolve_repository("pkg:pypi/requests", cache_distilled_metadata="yes")
+    with pytest.raises(TypeError, match="result_cache_ttl_seconds"):
+        resolve_repository("pkg:pypi/requests", result_cache_ttl_seconds="1h")
+    with pytest.raises(TypeError, match="validation_concurrency"):
+        resolve_repository("pkg:pypi/requests", validation_concurrency=None)
+    with pytest.raises(TypeError, match="validation_short_circuit"):
+        resolve_repository("pkg:pypi/requests", validation_short_circuit=1)
+    with pytest.raises(TypeError, match="release_probe_concurrency"):
+        resolve_repository("pkg:pypi/requests", release_probe_concurrency="all")
+    with pytest.raises(TypeError, match="negative_cache_ttl_seconds"):
+        resolve_repository("pkg:pypi/requests", negative_cache_ttl_seconds="10m")
+    with pytest.raises(TypeError, match="retry_policy"):
+        resolve_repository("pkg:pypi/requests", retry_policy={"max_attempts": 1})
+    with pytest.raises(TypeError, match="retry_budget"):
+        resolve_repository("pkg:pypi/requests", retry_budget=1.5)
+    with pytest.raises(TypeError, match="rate_limiting"):
+        resolve_repository("pkg:pypi/requests", rate_limiting="on")
+    with pytest.raises(TypeError, match="host_limits"):
+        resolve_repository("pkg:pypi/requests", host_limits={"pypi.org": 10})
+    with pytest.raises(TypeError, match="stale_while_revalidate_seconds"):
+        resolve_repository("pkg:pypi/requests", stale_while_revalidate_seconds="1h")
+    with pytest.raises(TypeError, match="stale_if_error_seconds"):
+        resolve_repository("pkg:pypi/requests", stale_if_error_seconds=1.5)
+    with pytest.raises(TypeError, match="ttl_rules"):
+        resolve_repository("pkg:pypi/requests", ttl_rules=[("pypi", r".*", 60)])
+    with pytest.raises(TypeError, match="stream_json"):
+        resolve_repository("pkg:pypi/requests", stream_json="yes")
+    with pytest.raises(TypeError, match="go_import_timeout_seconds"):
+        resolve_repository("pkg:pypi/requests", go_import_timeout_seconds="2s")
+    with pytest.raises(TypeError, match="go_proxy_roots"):
+        resolve_repository("pkg:pypi/requests", go_proxy_roots="/srv/goproxy")
+    with pytest.raises(TypeError, match="go_import_rules"):
+        resolve_repository("pkg:pypi/requests", go_import_rules={"go.example.com": 1})
 
 
 def test_resolver_parse_and_context_close(fake_http_factory):
@@ -0,0 +1,554 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+from tests.conftest import FakeAsyncHttpClient, FakeHttpClient, load_json, load_text
+
+from purl2repo import AsyncResolver, Resolver
+from purl2repo.ecosystems.golang import GoResolver
+from purl2repo.ecosystems.maven import MavenResolver
+from purl2repo.errors import MetadataFetchError, NoReleaseFoundError
+from purl2repo.http.async_client import AsyncHttpClient
+from purl2repo.models import ResolverSettings
+from purl2repo.purl.parse import parse_purl
+from purl2repo.resolution.cache import JsonFileStore, ResponseCache
+from purl2repo.resolution.deps_dev import fetch_deps_dev_candidates_async
+from purl2repo.resolution.scraper import AsyncFallbackScraper
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+def test_async_resolver_matches_sync_resolver(fake_http_factory, fake_async_http_factory):
+    payloads = {"https://pypi.org/pypi/requests/2.31.0/json": load_json("pypi/requests.json")}
+    fake_http_factory(payloads)
+    fake_async_http_factory(payloads)
+
+    async def run():
+        async with AsyncResolver(verify_release_links=True) as resolver:
+            return await resolver.resolve("pkg:pypi/requests@2.31.0")
+
+    async_result = asyncio.run(run())
+    with Resolver(verify_release_links=True) as resolver:
+        sync_result = resolver.resolve("pkg:pypi/requests@2.31.0")
+
+    assert async_result.to_dict() == sync_result.to_dict()
+    assert async_result.release_link is not None
+    assert "Verified version-specific release link exists" in async_result.evidence
+
+
+def test_async_resolver_repository_and_release_modes(fake_async_http_factory):
+    fake_async_http_factory(
+        {"https://pypi.org/pypi/requests/2.31.0/json": load_json("pypi/requests.json")}
+    )
+
+    async def run():
+        async with AsyncResolver() as resolver:
+            repo = await resolver.resolve_repository("pkg:pypi/requests@2.31.0")
+            release = await resolver.resolve_release("pkg:pypi/requests@2.31.0")
+            parsed = resolver.parse_purl("pkg:pypi/requests@2.31.0")
+            return repo, release, parsed
+
+    repo, release, parsed = asyncio.run(run())
+
+    assert repo.release_link is None
+    assert release.release_link is not None
+    assert parsed.name == "requests"
+
+
+def test_async_resolver_strict_release_failure(fake_async_http_factory):
+    fake = fake_async_http_factory()
+    fake.url_exists = lambda url, ttl_seconds=900: "/tree/" not in url
+
+    async def run():
+        async with AsyncResolver(strict=True) as resolver:
+            await resolver.resolve_release("pkg:huggingface/org/model@abc123")
+
+    with pytest.raises(NoReleaseFoundError):
+        asyncio.run(run())
+
+
+def test_async_resolve_many_bounds_concurrency_and_preserves_order(monkeypatch):
+    active = 0
+    peak = 0
+
+    class SlowClient(FakeAsyncHttpClient):
+        async def url_exists(self, url, *, ttl_seconds=900):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return True
+
+    monkeypatch.setattr(
+        "purl2repo.resolution.async_engine.AsyncHttpClient",
+        lambda settings, cache: SlowClient(FakeHttpClient()),
+    )
+    purls = [f"pkg:github/org/repo{index}" for index in range(8)]
+
+    async def source():
+        for purl in purls:
+            yield purl
+
+    async def run():
+        async with AsyncResolver() as resolver:
+            return await _collect(resolver.resolve_many(source(), max_concurrency=3))
+
+    results = asyncio.run(run())
+
+    assert [result.purl.raw for result in results] == purls
+    assert peak == 3
+    assert all(result.repository_validation_status == "validated" for result in results)
+
+
+def test_async_resolve_many_unordered_streams_bounded_window(monkeypatch):
+    pulled = []
+
+    class SlowFirstClient(FakeAsyncHttpClient):
+        async def url_exists(self, url, *, ttl_seconds=900):
+            await asyncio.sleep(0.05 if url.endswith("/repo0") else 0)
+            return True
+
+    monkeypatch.setattr(
+        "purl2repo.resolution.async_engine.AsyncHttpClient",
+        lambda settings, cache: SlowFirstClient(FakeHttpClient()),
+    )
+
+    async def source():
+        for index in range(6):
+            pulled.append(index)
+            yield f"pkg:github/org/repo{index}"
+
+    async def run():
+        async with AsyncResolver() as resolver:
+            results = resolver.resolve_many(source(), max_concurrency=2, ordered=False)
+            first = await anext(results)
+            pulled_at_first = len(pulled)
+            rest = await _collect(results)
+            return first, pulled_at_first, rest
+
+    first, pulled_at_first, rest = asyncio.run(run())
+    pairs = [first, *rest]
+
+    assert first[0] != 0
+    assert pulled_at_first == 4
+    assert sorted((index, result.purl.raw) for index, result in pairs) == [
+        (index, f"pkg:github/org/repo{index}") for index in range(6)
+    ]
+
+
+def test_async_resolve_many_awaits_cancelled_work_when_closed_early(monkeypatch):
+    cancelled = []
+
+    class StallingClient(FakeAsyncHttpClient):
+        async def url_exists(self, url, *, ttl_seconds=900):
+            if not url.endswith("/repo0"):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(url)
+                    raise
+            return True
+
+    monkeypatch.setattr(
+        "purl2repo.resolution.async_engine.AsyncHttpClient",
+        lambda settings, cache: StallingClient(FakeHttpClient()),
+    )
+
+    async def run():
+        async with AsyncResolver() as resolver:
+            results = resolver.resolve_many(
+                [f"pkg:github/org/repo{index}" for index in range(3)], max_concurrency=3
+            )
+            first = await anext(results)
+            await results.aclose()
+            pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            return first, pending
+
+    first, pending = asyncio.run(run())
+
+    assert first.purl.raw == "pkg:github/org/repo0"
+    assert sorted(cancelled) == ["https://github.com/org/repo1", "https://github.com/org/repo2"]
+    assert pending == []
+
+
+def test_async_resolve_many_sequential_and_invalid_concurrency():
+    async def run():
+        async with AsyncResolver(no_network=True) as resolver:
+            results = await _collect(resolver.resolve_many(["pkg:github/psf/requests"]))
+            with pytest.raises(ValueError):
+                await _collect(
+                    resolver.resolve_many(["pkg:github/psf/requests"], max_concurrency=0)
+                )
+            return results
+
+    results = asyncio.run(run())
+
+    assert results[0].repository_url == "https://github.com/psf/requests"
+
+
+def test_async_engine_uses_deps_dev_and_scraper_fallbacks(fake_async_http_factory):
+    fake_async_http_factory(
+        json_payloads={
+            "https://pypi.org/pypi/demo/1.0.0/json": {"info": {}},
+            "https://api.deps.dev/v3/systems/PYPI/packages/demo/versions/1.0.0": {
+                "relatedProjects": [
+                    {
+                        "projectKey": {"id": "github.com/org/demo"},
+                        "relationType": "SOURCE_REPO",
+                    }
+                ]
+            },
+            "https://pypi.org/pypi/other/json": {"info": {}},
+        },
+        text_payloads={
+            "https://pypi.org/project/other/": '<a href="https://github.com/org/other">Source</a>'
+        },
+    )
+
+    async def run():
+        async with AsyncResolver() as resolver:
+            return (
+                await resolver.resolve("pkg:pypi/demo@1.0.0"),
+                await resolver.resolve("pkg:pypi/other"),
+            )
+
+    deps_dev, scraped = asyncio.run(run())
+
+    assert deps_dev.repository_url == "https://github.com/org/demo"
+    assert "deps-dev" in deps_dev.metadata_sources
+    assert scraped.repository_url == "https://github.com/org/other"
+    assert scraped.repository_candidates[0].source == "scrape"
+
+
+def test_async_adapters_follow_maven_parents_and_go_imports():
+    fake = FakeHttpClient(
+        text_payloads={
+            "https://repo1.maven.org/maven2/org/example/demo/maven-metadata.xml": (
+                "<metadata><versioning><release>1.0.0</release></versioning></metadata>"
+            ),
+            "https://repo1.maven.org/maven2/org/example/demo/1.0.0/demo-1.0.0.pom": (
+                "<project><parent><groupId>org.example</groupId>"
+                "<artifactId>parent</artifactId><version>1</version></parent></project>"
+            ),
+            "https://repo1.maven.org/maven2/org/example/parent/1/parent-1.pom": load_text(
+                "maven/log4j-core.pom"
+            ),
+            "https://go.example.com/mod?go-get=1": (
+                '<meta name="go-import" content="go.example.com/mod git '
+                'https://github.com/example/mod">'
+            ),
+        },
+        json_payloads={"https://proxy.golang.org/go.example.com/mod/@latest": {"Version": "v1"}},
+    )
+    client = FakeAsyncHttpClient(fake)
+
+    async def run():
+        maven = await MavenResolver().fetch_metadata_async(
+            parse_purl("pkg:maven/org.example/demo"), client
+        )
+        go = await GoResolver().fetch_metadata_async(
+            parse_purl("pkg:golang/go.example.com/mod"), client
+        )
+        return maven, go
+
+    maven, go = asyncio.run(run())
+
+    assert maven["effective_version"] == "1.0.0"
+    assert maven["parent_poms"][0]["scm"]["url"] == "https://github.com/apache/logging-log4j2"
+    assert go["go_import_repo"] == "https://github.com/example/mod"
+
+
+def test_async_go_get_lookup_overlaps_proxy_and_finishes_after_the_deadline():
+    events = []
+
+    class SlowVanityClient(FakeAsyncHttpClient):
+        async def get_json(self, url, *, ttl_seconds=3600):
+            await asyncio.sleep(0)
+            events.append("proxy")
+            return {"Version": "v1"}
+
+        async def get_text(self, url, *, ttl_seconds=3600):
+            events.append("go-get")
+            await asyncio.sleep(0.1)
+            return '<meta name="go-import" content="slow.example.org/mod git https://github.com/x/mod">'
+
+    adapter = GoResolver(go_import_timeout_seconds=0.05)
+    fake = FakeHttpClient()
+    client = SlowVanityClient(fake)
+
+    async def run():
+        first = await adapter.fetch_metadata_async(
+            parse_purl("pkg:golang/slow.example.org/mod"), client
+        )
+        marked_at = adapter._slow_hosts["slow.example.org"]
+        pending = set(adapter._pending)
+        second = await adapter.fetch_metadata_async(
+            parse_purl("pkg:golang/slow.example.org/mod/v2"), client
+        )
+        await asyncio.gather(*adapter._pending)
+        return first, second, pending, marked_at
+
+    first, second, pending, marked_at = asyncio.run(run())
+
+    assert events == ["go-get", "proxy", "proxy"]
+    assert "go_import_repo" not in first
+    assert "go_import_repo" not in second
+    assert "did not finish" in first["_purl2repo_metadata_warning"]
+    assert "recently missed" in second["_purl2repo_metadata_warning"]
+    assert len(pending) == 1
+    assert adapter._slow_hosts["slow.example.org"] == marked_at
+    assert fake.summaries["go-import:slow.example.org/mod"] == {
+        "repository": "https://github.com/x/mod"
+    }
+
+
+def test_async_engine_close_cancels_pending_go_get_lookups():
+    class HangingVanityClient(FakeAsyncHttpClient):
+        async def get_json(self, url, *, ttl_seconds=3600):
+            return {"Version": "v1"}
+
+        async def get_text(self, url, *, ttl_seconds=3600):
+            await asyncio.sleep(10)
+            return ""
+
+    adapter = GoResolver(go_import_timeout_seconds=0.01)
+
+    async def run():
+        await adapter.fetch_metadata_async(
+            parse_purl("pkg:golang/hang.example.org/mod"), HangingVanityClient(FakeHttpClient())
+        )
+        pending = set(adapter._pending)
+        await adapter.aclose()
+        return pending
+
+    pending = asyncio.run(run())
+
+    assert len(pending) == 1
+    assert all(task.cancelled() for task in pending)
+    assert not adapter._pending
+
+
+def test_async_deps_dev_and_scraper_helpers():
+    client = FakeAsyncHttpClient(
+        FakeHttpClient(
+            text_payloads={
+                "https://pypi.org/project/demo/": '<a href="https://github.com/o/d">x</a>'
+            }
+        )
+    )
+
+    async def run():
+        deps = await fetch_deps_dev_candidates_async(parse_purl("pkg:pypi/demo"), client)
+        scraped = await AsyncFallbackScraper(client).scrape(
+            parse_purl("pkg:pypi/demo"), ["https://pypi.org/project/demo/"]
+        )
+        skipped = await AsyncFallbackScraper(client).scrape(parse_purl("pkg:github/o/d"), [])
+        return deps, scraped, skipped
+
+    deps, scraped, skipped = asyncio.run(run())
+
+    assert deps[0] == []
+    assert any("deps.dev package lookup failed" in warning for warning in deps[2])
+    assert [candidate.normalized_url for candidate in scraped] == ["https://github.com/o/d"]
+    assert skipped == []
+
+
+def test_async_http_client_cache_retries_and_errors(monkeypatch):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, str(request.url)))
+        if request.url.path == "/flaky" and len(requests) == 1:
+            return httpx.Response(503)
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        if request.url.path == "/text":
+            return httpx.Response(200, text="body")
+        return httpx.Response(200, json={"ok": True})
+
+    sleeps = []
+
+    async def no_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("purl2repo.http.async_client.asyncio.sleep", no_sleep)
+    client = AsyncHttpClient(
+        ResolverSettings(negative_cache_ttl_seconds=600),
+        ResponseCache(),
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def run():
+        assert await client.get_json("https://example.com/flaky") == {"ok": True}
+        assert await client.get_json("https://example.com/flaky") == {"ok": True}
+        assert await client.get_text("https://example.com/text") == "body"
+        assert await client.url_exists("https://example.com/exists")
+        assert not await client.url_exists("https://example.com/missing")
+        with pytest.raises(MetadataFetchError, match="non-web"):
+            await client.get_json("ftp://example.com/data")
+        with pytest.raises(MetadataFetchError, match="Failed to fetch metadata"):
+            await client.get_text("https://example.com/missing")
+        fetched = len(requests)
+        with pytest.raises(MetadataFetchError, match="Failed to fetch metadata"):
+            await client.get_json("https://example.com/missing")
+        assert len(requests) == fetched
+        await client.aclose()
+
+    asyncio.run(run())
+
+    assert requests.count(("GET", "https://example.com/flaky")) == 2
+    assert requests.count(("GET", "https://example.com/missing")) == 2
+    assert len(sleeps) == 1
+
+
+def test_async_http_client_keeps_disk_cache_io_off_the_event_loop(monkeypatch, tmp_path):
+    threads = []
+    for name in ("load", "save"):
+        original = getattr(JsonFileStore, name)
+
+        def record(*args, _original=original):
+            threads.append(threading.current_thread())
+            return _original(*args)
+
+        monkeypatch.setattr(JsonFileStore, name, record)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"ok": True}, headers={"ETag": '"v1"'})
+
+    client = AsyncHttpClient(
+        ResolverSettings(negative_cache_ttl_seconds=600),
+        ResponseCache(str(tmp_path)),
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def run():
+        assert await client.get_json("https://example.com/doc") == {"ok": True}
+        assert await client.get_json("https://example.com/doc", ttl_seconds=-1) == {"ok": True}
+        with pytest.raises(MetadataFetchError):
+            await client.get_json("https://example.com/missing")
+        assert await client.url_exists("https://example.com/doc")
+        await client.aclose()
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(run())
+
+    assert threads
+    assert loop_thread not in threads
+
+
+def test_async_http_client_revalidates_expired_entries():
+    conditional = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        conditional.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == "abc":
+            return httpx.Response(304)
+        return httpx.Response(200, json={"ok": True}, headers={"ETag": "abc"})
+
+    client = AsyncHttpClient(
+        ResolverSettings(), ResponseCache(), transport=httpx.MockTransport(handler)
+    )
+
+    async def run():
+        assert await client.get_json("https://example.com/doc") == {"ok": True}
+        assert await client.get_json("https://example.com/doc", ttl_seconds=0) == {"ok": True}
+        await client.aclose()
+
+    asyncio.run(run())
+
+    assert conditional == [None, "abc"]
+
+
+def test_async_http_client_respects_no_network():
+    client = AsyncHttpClient(ResolverSettings(no_network=True), ResponseCache())
+
+    async def run():
+        with pytest.raises(MetadataFetchError, match="Network disabled"):
+            await client.url_exists("https://example.com")
+        await client.aclose()
+
+    asyncio.run(run())
+
+
+def test_async_candidate_validation_is_concurrent_and_short_circuits(
+    monkeypatch, fake_http_factory
+):
+    checked = []
+    metadata = {
+        "info": {
+            "project_urls": {
+                "Source": "https://github.com/org/demo",
+                "Repository": "https://gitlab.com/org/demo-missing",
+                "Code": "https://bitbucket.org/org/demo",
+            }
+        }
+    }
+
+    class SlowClient(FakeAsyncHttpClient):
+        async def url_exists(self, url, *, ttl_seconds=900):
+            checked.append(url)
+            await asyncio.sleep(0.01)
+            return await super().url_exists(url, ttl_seconds=ttl_seconds)
+
+    monkeypatch.setattr(
+        "purl2repo.resolution.async_engine.AsyncHttpClient",
+        lambda settings, cache: SlowClient(
+            FakeHttpClient({"https://pypi.org/pypi/demo/json": metadata})
+        ),
+    )
+
+    async def run(**kwargs):
+        async with AsyncResolver(**kwargs) as resolver:
+            return await resolver.resolve_repository("pkg:pypi/demo")
+
+    concurrent = asyncio.run(run(validation_concurrency=3))
+    with Resolver(validation_concurrency=1) as resolver:
+        monkeypatch.setattr(
+            resolver._engine,
+            "client",
+            FakeHttpClient({"https://pypi.org/pypi/demo/json": metadata}),
+        )
+        sequential = resolver.resolve_repository("pkg:pypi/demo")
+    checked.clear()
+    short = asyncio.run(run(validation_concurrency=1, validation_short_circuit=True))
+    short_checked = list(checked)
+    checked.clear()
+    asyncio.run(run(validation_concurrency=2, validation_short_circuit=True))
+
+    assert concurrent.to_dict() == sequential.to_dict()
+    assert short_checked == ["https://bitbucket.org/org/demo"]
+    assert len(short.repository_candidates) == 3
+    assert "https://gitlab.com/org/demo-missing" not in checked
+
+
+def test_async_release_probing_returns_highest_preference_existing_link(monkeypatch):
+    class ProbeClient(FakeAsyncHttpClient):
+        async def url_exists(self, url, *, ttl_seconds=900):
+            if url.endswith("/releases/tag/1.0"):
+                await asyncio.sleep(0.02)
+                return False
+            if url.endswith("/releases/tag/v1.0"):
+                await asyncio.sleep(0.01)
+                return True
+            return True
+
+    monkeypatch.setattr(
+        "purl2repo.resolution.async_engine.AsyncHttpClient",
+        lambda settings, cache: ProbeClient(FakeHttpClient()),
+    )
+
+    async def run():
+        async with AsyncResolver(
+            verify_release_links=True, release_probe_concurrency=6
+        ) as resolver:
+            return await resolver.resolve_release("pkg:github/org/demo@1.0")
+
+    result = asyncio.run(run())
+
+    assert result.release_link.url == "https://github.com/org/demo/releases/tag/v1.0"
@@ -58,3 +58,46 @@ def test_cli_repo_release_supports_and_version(fake_http_factory):
     assert "pypi" in json.loads(supports.stdout)["ecosystems"]
     assert version.exit_code == 0
     assert version.stdout.strip()
+
+
+def test_cli_sqlite_cache_backend(fake_http_factory, tmp_path):
+    fake_http_factory({"https://pypi.org/pypi/requests/json": load_json("pypi/requests.json")})
+    args = ["repo", "pkg:pypi/requests", "--cache-dir", str(tmp_path)]
+
+    result = runner.invoke(app, [*args, "--cache-backend", "sqlite"])
+    invalid = runner.invoke(app, [*args, "--cache-backend", "redis"])
+
+    assert result.exit_code == 0
+    assert (tmp_path / "purl2repo-cache.sqlite3").exists()
+    assert invalid.exit_code == 2
+
+
+def test_cli_batch_streams_jsonl_with_error_records(fake_http_factory, tmp_path):
+    fake_http_factory({"https://pypi.org/pypi/requests/json": load_json("pypi/requests.json")})
+    purls = [f"pkg:github/org/repo{index}" for index in range(10)]
+    lines = [purls[0], "", "# comment", "pkg:pypi/re%ZZquests", "pkg:unknown/demo", *purls[1:]]
+    input_file = tmp_path / "purls.txt"
+    input_file.write_text("\n".join([*lines, "pkg:pypi/requests"]) + "\n")
+
+    from_file = runner.invoke(app, ["batch", str(input_file), "--max-workers", "1"])
+    from_stdin = runner.invoke(
+        app, ["batch", "-", "--max-workers", "3", "--ordered"], input=input_file.read_text()
+    )
+    unordered = runner.invoke(
+        app, ["batch", "-", "--max-workers", "3"], input=input_file.read_text()
+    )
+
+    assert from_file.exit_code == 0
+    assert from_stdin.stdout == from_file.stdout
+    assert sorted(unordered.stdout.splitlines()) == sorted(from_file.stdout.splitlines())
+    records = [json.loads(line) for line in from_file.stdout.splitlines()]
+    assert len(records) == 13
+    assert records[1] == {
+        "purl": "pkg:pypi/re%ZZquests",
+        "error": records[1]["error"],
+        "error_type": "InvalidPurlError",
+    }
+    assert records[2]["error_type"] == "UnsupportedEcosystemError"
+    resolved = [records[0], *records[3:12]]
+    assert [record["purl"]["raw"] for record in resolved] == purls
+    assert records[12]["repository_url"] == "https://github.com/psf/requests"
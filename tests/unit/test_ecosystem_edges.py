@@ -1,15 +1,22 @@
+import json
 import xml.etree.ElementTree as ET
 
+import httpx
 import pytest
-from tests.conftest import FakeHttpClient, load_text
+from tests.conftest import FakeHttpClient, load_json, load_text
 
+from purl2repo.ecosystems import maven
 from purl2repo.ecosystems.base import EcosystemResolver
 from purl2repo.ecosystems.cargo import CargoResolver
 from purl2repo.ecosystems.maven import MavenResolver
 from purl2repo.ecosystems.npm import NpmResolver, npm_package_name
+from purl2repo.ecosystems.nuget import NuGetResolver
 from purl2repo.ecosystems.pypi import PyPiResolver
-from purl2repo.models import ParsedPurl, RepositoryCandidate
+from purl2repo.errors import MetadataFetchError
+from purl2repo.http.client import HttpClient, response_cache_writes_disabled
+from purl2repo.models import ParsedPurl, RepositoryCandidate, ResolverSettings
 from purl2repo.purl.parse import parse_purl
+from purl2repo.resolution.cache import ResponseCache
 
 
 def test_pypi_ignores_malformed_metadata_and_accepts_repo_like_project_url():
@@ -87,6 +94,33 @@ def test_npm_ignores_missing_version_metadata():
     assert NpmResolver().extract_candidates(parsed, {"versions": []}) == []
 
 
+def test_npm_fetches_version_documents_and_falls_back_to_packument():
+    manifest = load_json("npm/react-18.2.0.json")
+    packument = load_json("npm/react.json")
+    client = FakeHttpClient(
+        {
+            "https://registry.npmjs.org/react/18.2.0": manifest,
+            "https://registry.npmjs.org/@scope/name/1.0.0": {"name": "@scope/name"},
+            "https://registry.npmjs.org/react": packument,
+        }
+    )
+
+    metadata = NpmResolver().fetch_metadata(parse_purl("pkg:npm/react@18.2.0"), client)
+    assert metadata["versions"] == {"18.2.0": manifest}
+    assert metadata["repository"] == manifest["repository"]
+    scoped = NpmResolver().fetch_metadata(parse_purl("pkg:npm/%40scope/name@1.0.0"), client)
+    assert scoped["name"] == "@scope/name"
+    assert NpmResolver().fetch_metadata(parse_purl("pkg:npm/react"), client) == packument
+
+    def version_missing(url, **kwargs):
+        if url.endswith("/react"):
+            return packument
+        raise MetadataFetchError(f"Failed to fetch metadata from {url}: 404")
+
+    client.get_json = version_missing
+    assert NpmResolver().fetch_metadata(parse_purl("pkg:npm/react@19.0.0"), client) == packument
+
+
 def test_cargo_handles_missing_crate_and_versionless_fetch():
     resolver = CargoResolver()
     assert resolver.extract_candidates(parse_purl("pkg:cargo/example"), {"crate": []}) == []
@@ -148,6 +182,53 @@ def test_maven_fetches_parent_pom_when_child_has_no_scm():
     assert candidates[0].source == "pom_parent_scm"
 
 
+def test_maven_parent_pom_summaries_are_parsed_once_per_cache(monkeypatch, tmp_path):
+    child = (
+        "<project><parent><groupId>org.apache</groupId><artifactId>apache</artifactId>"
+        "<version>33</version></parent></project>"
+    )
+    parent = (
+        "<project><scm><url>https://github.com/apache/maven-apache-parent</url></scm></project>"
+    )
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(200, text=parent if "/apache/33/" in request.url.path else child)
+
+    parses = []
+    parse_pom = maven._parse_pom
+
+    def counting_parse(xml_text: str) -> dict[str, object]:
+        parses.append(xml_text)
+        return parse_pom(xml_text)
+
+    monkeypatch.setattr("purl2repo.ecosystems.maven._parse_pom", counting_parse)
+    transport = httpx.MockTransport(handler)
+    client = HttpClient(ResolverSettings(), ResponseCache(str(tmp_path)), transport=transport)
+    for artifact in ("one", "two", "three"):
+        metadata = MavenResolver().fetch_metadata(
+            parse_purl(f"pkg:maven/org.example/{artifact}@1.0"), client
+        )
+        assert metadata["parent_poms"][0]["scm"]["url"].endswith("maven-apache-parent")
+    reloaded = HttpClient(ResolverSettings(), ResponseCache(str(tmp_path)), transport=transport)
+    MavenResolver().fetch_metadata(parse_purl("pkg:maven/org.example/four@1.0"), reloaded)
+
+    parent_path = "/maven2/org/apache/apache/33/apache-33.pom"
+    assert parses.count(parent) == 1
+    assert requests.count(parent_path) == 1
+    assert reloaded.cache.get(f"https://repo1.maven.org{parent_path}", 3600) is None
+
+    # Distilled-metadata resolutions disable response writes; summaries are still kept.
+    distilled = HttpClient(ResolverSettings(), ResponseCache(), transport=transport)
+    with response_cache_writes_disabled():
+        for artifact in ("one", "two", "three"):
+            MavenResolver().fetch_metadata(
+                parse_purl(f"pkg:maven/org.example/{artifact}@1.0"), distilled
+            )
+    assert requests.count(parent_path) == 2
+
+
 def test_maven_empty_namespace_and_missing_xml_children():
     assert MavenResolver().fetch_metadata(parse_purl("pkg:maven/demo"), FakeHttpClient()) == {}
     candidates = MavenResolver().extract_candidates(
@@ -196,6 +277,43 @@ def test_maven_branch_edges():
     assert dict_parent_candidates[0].source == "pom_parent_scm"
 
 
+def test_maven_pom_extraction_skips_unread_sections_and_stops_early():
+    dependencies = "<dependency><artifactId>dep</artifactId></dependency>" * 5000
+    bom = (
+        '<project xmlns="http://maven.apache.org/POM/4.0.0">'
+        "<parent><groupId>org.example</groupId><artifactId>bom-parent</artifactId>"
+        "<version>2</version></parent>"
+        f"<dependencyManagement><dependencies>{dependencies}</dependencies>"
+        "</dependencyManagement><url> https://example.com </url></project>"
+    )
+    partial = (
+        "<project><url>https://example.com</url><parent><groupId>g</groupId>"
+        "<artifactId>a</artifactId><version>1</version></parent><scm>"
+        "<connection>c</connection></scm>" + " " * maven.XML_CHUNK_SIZE + "<broken"
+    )
+    complete = (
+        "<project><url>https://example.com</url><parent><groupId>g</groupId>"
+        "<artifactId>a</artifactId><version>1</version></parent><scm><url>u</url>"
+        "<connection>c</connection><developerConnection>d</developerConnection></scm>"
+        + " " * maven.XML_CHUNK_SIZE
+        + "<broken"
+    )
+
+    assert maven._parse_pom(bom)["parent"]["artifactId"] == "bom-parent"
+    assert maven._parse_pom(bom)["url"] == "https://example.com"
+    assert maven._parse_pom(bom)["scm"] == {
+        "url": None,
+        "connection": None,
+        "developerConnection": None,
+    }
+    assert maven._parse_pom(complete)["scm"]["developerConnection"] == "d"
+    assert maven._parse_pom(partial)["scm"] == {
+        "url": None,
+        "connection": "c",
+        "developerConnection": None,
+    }
+
+
 def test_maven_invalid_xml_raises():
     with pytest.raises(ET.ParseError):
         MavenResolver().fetch_metadata(
@@ -216,6 +334,10 @@ class DummyResolver(EcosystemResolver):
         _ = parsed, client
         return {}
 
+    async def fetch_metadata_async(self, parsed: ParsedPurl, client: FakeHttpClient) -> dict:
+        _ = parsed, client
+        return {}
+
     def extract_candidates(self, parsed: ParsedPurl, metadata: dict) -> list[RepositoryCandidate]:
         _ = parsed, metadata
         return []
@@ -227,3 +349,83 @@ def test_base_adapter_defaults():
 
     assert adapter.fallback_scrape_pages(parsed, {}) == []
     assert adapter.resolve_release_link(parsed, None, {}, None) is None
+
+
+@pytest.mark.parametrize(
+    ("purl", "adapter", "metadata"),
+    [
+        ("pkg:pypi/requests@2.31.0", PyPiResolver(), load_json("pypi/requests.json")),
+        ("pkg:npm/react@18.2.0", NpmResolver(), load_json("npm/react.json")),
+        ("pkg:cargo/rand@0.8.5", CargoResolver(), load_json("cargo/rand.json")),
+        (
+            "pkg:nuget/Newtonsoft.Json@13.0.3",
+            NuGetResolver(),
+            {
+                "package_id": "Newtonsoft.Json",
+                "items": [
+                    {
+                        "items": [
+                            {
+                                "catalogEntry": {
+                                    "description": "x" * 1000,
+                                    "projectUrl": "https://www.newtonsoft.com/json",
+                                    "repository": {
+                                        "url": "https://github.com/JamesNK/Newtonsoft.Json"
+                                    },
+                                }
+                            }
+                            for _ in range(3)
+                        ]
+                    }
+                ],
+            },
+        ),
+    ],
+)
+def test_distilled_metadata_preserves_candidates_and_scrape_pages(purl, adapter, metadata):
+    parsed = parse_purl(purl)
+    distilled = adapter.distill_metadata(parsed, metadata)
+
+    assert adapter.extract_candidates(parsed, distilled) == adapter.extract_candidates(
+        parsed, metadata
+    )
+    assert dict.fromkeys(adapter.fallback_scrape_pages(parsed, distilled)) == dict.fromkeys(
+        adapter.fallback_scrape_pages(parsed, metadata)
+    )
+    assert len(json.dumps(distilled)) < len(json.dumps(metadata))
+
+
+def test_distilled_pypi_metadata_keeps_version_fallback_marker():
+    parsed = parse_purl("pkg:pypi/demo@1.0")
+    distilled = PyPiResolver().distill_metadata(
+        parsed,
+        {"info": {"description": "long"}, "_purl2repo_version_metadata_missing": "1.0"},
+    )
+
+    assert distilled == {"info": {}, "_purl2repo_version_metadata_missing": "1.0"}
+
+
+def test_adapters_do_not_mutate_shared_client_responses():
+    project = {"info": {"home_page": "https://github.com/org/demo"}}
+    registration = {"items": []}
+    client = FakeHttpClient(
+        json_payloads={
+            "https://pypi.org/pypi/demo/json": project,
+            "https://api.nuget.org/v3/registration5-semver1/demo/index.json": registration,
+        }
+    )
+    client.get_json = lambda url, ttl_seconds=3600: (
+        _raise_missing(url) if "/9.9/" in url else client.json_payloads[url]
+    )
+
+    pypi = PyPiResolver().fetch_metadata(parse_purl("pkg:pypi/demo@9.9"), client)
+    nuget = NuGetResolver().fetch_metadata(parse_purl("pkg:nuget/Demo"), client)
+
+    assert pypi["_purl2repo_version_metadata_missing"] == "9.9"
+    assert nuget["package_id"] == "Demo"
+    assert project == {"info": {"home_page": "https://github.com/org/demo"}}
+    assert registration == {"items": []}
+
+
+def _raise_missing(url):
+    raise MetadataFetchError(f"missing {url}")
@@ -1,13 +1,29 @@
+import asyncio
 import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 
 import httpx
 import pytest
 
+from purl2repo import Resolver
 from purl2repo.errors import MetadataFetchError
-from purl2repo.http.client import HttpClient
-from purl2repo.http.retry import backoff_seconds
-from purl2repo.models import ResolverSettings
-from purl2repo.resolution.cache import ResponseCache
+from purl2repo.http.async_client import AsyncHttpClient
+from purl2repo.http.client import (
+    HttpClient,
+    response_cache_writes_disabled,
+    served_stale_responses,
+)
+from purl2repo.http.jsonstream import ARRAY_ITEM, JsonFieldExtractor
+from purl2repo.http.ratelimit import HostLimit, HostRateLimiter, HostThrottle
+from purl2repo.http.retry import RetryPolicy, backoff_seconds, retry_after_seconds
+from purl2repo.http.singleflight import AsyncSingleFlight, SingleFlight
+from purl2repo.http.ttl import IMMUTABLE_TTL_SECONDS, TtlPolicy, TtlRule
+from purl2repo.models import CacheStats, ResolverSettings
+from purl2repo.resolution.cache import ResponseCache, SqliteStore
 
 
 class FakeResponse:
@@ -86,6 +102,36 @@ def test_http_client_get_json_text_cache_and_close(monkeypatch):
     client.close()
 
 
+def test_http_client_configures_connection_pool(monkeypatch):
+    captured = {}
+
+    def build_client(**kwargs):
+        captured.update(kwargs)
+        return FakeTransport([])
+
+    monkeypatch.setattr("purl2repo.http.client.httpx.Client", build_client)
+
+    HttpClient(ResolverSettings(max_connections=32, max_keepalive_connections=8))
+
+    assert captured["limits"].max_connections == 32
+    assert captured["limits"].max_keepalive_connections == 8
+
+
+def test_response_cache_is_shared_safely_between_threads(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+
+    def write(index):
+        cache.set("shared", {"writer": index})
+        return cache.get("shared", 3600)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(write, range(64)))
+
+    assert all(isinstance(result, dict) for result in results)
+    assert [path.name for path in tmp_path.iterdir() if path.name.startswith(".tmp-")] == []
+    assert ResponseCache(str(tmp_path)).get("shared", 3600) in results
+
+
 def test_http_client_errors(monkeypatch):
     monkeypatch.setattr(
         "purl2repo.http.client.httpx.Client",
@@ -170,8 +216,689 @@ def test_backoff_seconds_has_jitter(monkeypatch):
     assert backoff_seconds(2, base=0.5, jitter=0.1) == 2.05
 
 
+def test_retry_policy_skips_permanent_errors_and_honors_retry_after(monkeypatch):
+    requests = []
+    sleeps = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path == "/limited" and requests.count("/limited") == 1:
+            return httpx.Response(429, headers={"Retry-After": "2"})
+        if request.url.path == "/overloaded":
+            return httpx.Response(503, headers={"Retry-After": "120"})
+        if request.url.path == "/gone":
+            return httpx.Response(410)
+        return httpx.Response(200, json={"ok": True})
+
+    monkeypatch.setattr("purl2repo.http.client.time.sleep", sleeps.append)
+    client = HttpClient(
+        ResolverSettings(negative_cache_ttl_seconds=None),
+        ResponseCache(),
+        transport=httpx.MockTransport(handler),
+    )
+
+    with pytest.raises(MetadataFetchError, match="410"):
+        client.get_json("https://example.com/gone")
+    assert client.get_json("https://example.com/limited") == {"ok": True}
+    with pytest.raises(MetadataFetchError, match="503"):
+        client.get_json("https://example.com/overloaded")
+
+    assert requests == ["/gone", "/limited", "/limited", "/overloaded"]
+    assert sleeps == [2.0]
+    assert retry_after_seconds("not a date") is None
+    now = datetime(2024, 1, 1, tzinfo=UTC)
+    assert retry_after_seconds("Mon, 01 Jan 2024 00:00:05 GMT", now=now) == 5.0
+    with pytest.raises(ValueError, match="max_attempts"):
+        RetryPolicy(max_attempts=0)
+
+
+def test_retry_budget_is_shared_across_requests(monkeypatch):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(502)
+
+    monkeypatch.setattr("purl2repo.http.client.time.sleep", lambda seconds: None)
+    settings = ResolverSettings(retry_budget=1, retry_policy=RetryPolicy(max_attempts=5))
+    client = HttpClient(settings, ResponseCache(), transport=httpx.MockTransport(handler))
+
+    for path in ("/one", "/two"):
+        with pytest.raises(MetadataFetchError, match="502"):
+            client.get_json(f"https://example.com{path}")
+
+    assert requests == ["/one", "/one", "/two"]
+    assert client.retry_budget.remaining == 0
+
+
+def test_host_throttle_token_bucket_and_aimd_window():
+    now = [0.0]
+    throttle = HostThrottle(HostLimit(rate=2.0, burst=1, max_concurrency=4), clock=lambda: now[0])
+
+    def acquire_later():
+        now[0] += 1.0
+        return throttle._try_acquire()
+
+    assert [throttle._try_acquire(), throttle._try_acquire()] == [0.0, 0.5]
+    assert acquire_later() == 0.0
+    throttle.release(503, 0.1)
+    throttle.release(None, 0.1)
+    assert throttle.concurrency == 2
+    assert [acquire_later(), acquire_later(), acquire_later()] == [0.0, 0.0, None]
+    for _ in range(2):
+        throttle.release(200, 0.1)
+    assert throttle.concurrency == 2
+    for _ in range(2):
+        assert acquire_later() == 0.0
+        throttle.release(200, 0.1)
+    assert throttle.concurrency == 3
+    assert acquire_later() == 0.0
+    throttle.release(200, 5.0)
+    assert throttle.concurrency == 1
+
+    limiter = HostRateLimiter({"api.example": HostLimit(rate=1.0, burst=1, max_concurrency=1)})
+    assert limiter.throttle("https://API.example/a") is limiter.throttle("https://api.example/b")
+    assert limiter.throttle("https://other.example/") is None
+    fallback = HostRateLimiter({"*": HostLimit(rate=1.0, burst=1, max_concurrency=1)})
+    assert fallback.throttle("https://other.example/") is not None
+    with pytest.raises(ValueError, match="concurrency"):
+        HostLimit(rate=1.0, burst=1, max_concurrency=1, min_concurrency=2)
+
+
+def test_async_throttle_waiters_wake_on_release():
+    throttle = HostThrottle(HostLimit(rate=1000.0, burst=10, max_concurrency=1))
+
+    async def run():
+        await throttle.acquire_async()
+        waiting = asyncio.create_task(throttle.acquire_async())
+        await asyncio.sleep(0.05)
+        parked = not waiting.done() and len(throttle._async_waiters) == 1
+        throttle.release(200, 0.01)
+        await asyncio.wait_for(waiting, 0.5)
+        return parked
+
+    assert asyncio.run(run())
+    assert throttle._async_waiters == []
+
+
+def test_http_clients_limit_concurrency_per_host():
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.01)
+        with lock:
+            active["now"] -= 1
+        return httpx.Response(200, json={"ok": True})
+
+    limits = {"example.com": HostLimit(rate=1000.0, burst=1000, max_concurrency=2)}
+    settings = ResolverSettings(use_cache=False, rate_limiting=True, host_limits=limits)
+    assert HttpClient(ResolverSettings(host_limits=limits)).rate_limiter is None
+    client = HttpClient(settings, transport=httpx.MockTransport(handler))
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        urls = [f"https://example.com/{index}" for index in range(12)]
+        assert all(executor.map(client.get_json, urls))
+    assert active["peak"] == 2
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return httpx.Response(200, json={"ok": True})
+
+    active["peak"] = 0
+    async_client = AsyncHttpClient(settings, transport=httpx.MockTransport(async_handler))
+
+    async def run():
+        await asyncio.gather(
+            *(async_client.get_json(f"https://example.com/{index}") for index in range(8))
+        )
+        await async_client.aclose()
+
+    asyncio.run(run())
+    assert active["peak"] == 2
+
+
+def test_http_client_revalidates_expired_entries_with_validators(tmp_path):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(
+            (
+                request.url.path,
+                request.headers.get("If-None-Match"),
+                request.headers.get("If-Modified-Since"),
+            )
+        )
+        if request.url.path == "/doc":
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, json={"version": 1}, headers={"ETag": '"v1"'})
+        if request.headers.get("If-Modified-Since"):
+            return httpx.Response(
+                200, text="new", headers={"Last-Modified": "Tue, 02 Jan 2024 00:00:00 GMT"}
+            )
+        return httpx.Response(
+            200, text="old", headers={"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        )
+
+    transport = httpx.MockTransport(handler)
+    cache = ResponseCache(str(tmp_path))
+    client = HttpClient(ResolverSettings(), cache, transport=transport)
+
+    assert client.get_json("https://example.com/doc") == {"version": 1}
+    stored_at = cache.get_entry("https://example.com/doc")[0]
+    time.sleep(0.01)
+    assert client.get_json("https://example.com/doc", ttl_seconds=0) == {"version": 1}
+    assert cache.get_entry("https://example.com/doc")[0] > stored_at
+    reloaded = HttpClient(ResolverSettings(), ResponseCache(str(tmp_path)), transport=transport)
+    assert reloaded.get_json("https://example.com/doc", ttl_seconds=0) == {"version": 1}
+    assert client.get_text("https://example.com/page") == "old"
+    assert client.get_text("https://example.com/page", ttl_seconds=0) == "new"
+    assert client.get_text("https://example.com/page") == "new"
+
+    assert seen == [
+        ("/doc", None, None),
+        ("/doc", '"v1"', None),
+        ("/doc", '"v1"', None),
+        ("/page", None, None),
+        ("/page", None, "Mon, 01 Jan 2024 00:00:00 GMT"),
+    ]
+
+
+def test_http_client_serves_stale_entries_within_bounds(monkeypatch):
+    version = [1]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if version[0] is None:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"version": version[0]})
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr("purl2repo.http.client.time.sleep", lambda seconds: None)
+    revalidating = HttpClient(
+        ResolverSettings(stale_while_revalidate_seconds=60), ResponseCache(), transport=transport
+    )
+    assert revalidating.get_json("https://example.com/doc") == {"version": 1}
+    version[0] = 2
+    with served_stale_responses() as stale:
+        assert revalidating.get_json("https://example.com/doc", ttl_seconds=0) == {"version": 1}
+    revalidating.close()
+    assert stale == ["https://example.com/doc"]
+    assert revalidating.cache.get("https://example.com/doc", 3600) == {"version": 2}
+
+    fallback = HttpClient(
+        ResolverSettings(stale_if_error_seconds=60), ResponseCache(), transport=transport
+    )
+    assert fallback.get_json("https://example.com/doc") == {"version": 2}
+    version[0] = None
+    assert fallback.get_json("https://example.com/doc", ttl_seconds=0) == {"version": 2}
+    later = time.time() + 120
+    monkeypatch.setattr("purl2repo.http.client.time.time", lambda: later)
+    with pytest.raises(MetadataFetchError, match="503"):
+        fallback.get_json("https://example.com/doc", ttl_seconds=0)
+    fallback.close()
+
+
+@pytest.mark.parametrize(
+    ("url", "kind"),
+    [
+        ("https://pypi.org/pypi/requests/2.31.0/json", "pypi-version"),
+        ("https://pypi.org/pypi/requests/json", None),
+        ("https://registry.npmjs.org/@types/node/20.1.0", "npm-version"),
+        ("https://registry.npmjs.org/react/18.2.0", "npm-version"),
+        ("https://registry.npmjs.org/@types/node", None),
+        ("https://registry.npmjs.org/react/latest", None),
+        ("https://registry.npmjs.org/react", None),
+        (
+            "https://repo1.maven.org/maven2/org/slf4j/slf4j-api/2.0.9/slf4j-api-2.0.9.pom",
+            "maven-release-pom",
+        ),
+        ("https://repo1.maven.org/maven2/org/x/y/1.0-SNAPSHOT/y-1.0-SNAPSHOT.pom", None),
+        ("https://repo1.maven.org/maven2/org/slf4j/slf4j-api/maven-metadata.xml", "maven-metadata"),
+        ("https://proxy.golang.org/github.com/pkg/errors/@v/v0.9.1.info", "go-proxy-version"),
+        ("https://proxy.golang.org/github.com/pkg/errors/@latest", "go-proxy-latest"),
+        ("https://proxy.golang.org/github.com/pkg/errors/@v/list", None),
+        (
+            "https://api.deps.dev/v3/systems/npm/packages/react/versions/18.2.0",
+            "deps-dev-version",
+        ),
+        ("https://api.deps.dev/v3/systems/npm/packages/react", None),
+    ],
+)
+def test_default_ttl_rules_classify_registry_endpoints(url, kind):
+    rule = TtlPolicy().rule_for(url)
+    assert (rule.kind if rule else None) == kind
+
+
+def test_http_client_applies_ttl_policy_per_url(monkeypatch):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(200, json={"ok": True})
+
+    rules = (TtlRule("pinned-docs", r"https://example\.com/docs/.*", IMMUTABLE_TTL_SECONDS),)
+    client = HttpClient(
+        ResolverSettings(ttl_rules=rules),
+        ResponseCache(),
+        transport=httpx.MockTransport(handler),
+    )
+    urls = [
+        "https://pypi.org/pypi/requests/2.31.0/json",
+        "https://pypi.org/pypi/requests/json",
+        "https://example.com/docs/a",
+    ]
+    for url in urls:
+        client.get_json(url)
+    later = time.time() + 2 * 3600
+    monkeypatch.setattr("purl2repo.resolution.cache.time.time", lambda: later)
+    for url in urls:
+        client.get_json(url)
+    client.get_json("https://example.com/docs/a", ttl_seconds=60)
+
+    assert requests == [
+        "/pypi/requests/2.31.0/json",
+        "/pypi/requests/json",
+        "/docs/a",
+        "/pypi/requests/json",
+        "/docs/a",
+    ]
+
+
 def test_disk_cache_payload_is_json(tmp_path):
     cache = ResponseCache(str(tmp_path))
     cache.set("key", {"nested": ["value"]})
     payload = json.loads(next(tmp_path.iterdir()).read_text(encoding="utf-8"))
     assert payload["value"] == {"nested": ["value"]}
+
+
+def test_sqlite_cache_persists_in_one_file(tmp_path):
+    cache = ResponseCache(str(tmp_path), backend="sqlite")
+    cache.set("key", {"nested": ["value"]})
+    cache.set("exists:https://example.com", True)
+    cache.close()
+
+    reopened = ResponseCache(str(tmp_path), backend="sqlite")
+    assert reopened.get("key", 3600) == {"nested": ["value"]}
+    assert reopened.get("exists:https://example.com", 3600) is True
+    assert reopened.get("key", -1) is None
+    assert reopened.get("missing", 3600) is None
+    assert [path.name for path in tmp_path.iterdir() if path.suffix == ".json"] == []
+    reopened.close()
+
+
+def test_sqlite_cache_purges_by_age_and_enforces_size_limit(tmp_path, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr("purl2repo.resolution.cache.time.time", lambda: now)
+    cache = ResponseCache(str(tmp_path), backend="sqlite")
+    cache.set("old", "x" * 100)
+    now += 7200
+    cache.set("new", "y" * 100)
+
+    assert cache.purge(3600) == 1
+    assert cache.get("old", 10**9) is None
+    assert cache.get("new", 10**9) == "y" * 100
+    cache.close()
+
+    capped = ResponseCache(str(tmp_path), backend="sqlite", max_bytes=150)
+    now += 1
+    capped.set("newest", "z" * 100)
+    store = capped._store
+    assert isinstance(store, SqliteStore)
+    assert store.enforce_size_limit() == 0
+    fresh = ResponseCache(str(tmp_path), backend="sqlite", max_age_seconds=10**6)
+    assert fresh.get("new", 10**9) is None
+    assert fresh.get("newest", 10**9) == "z" * 100
+    capped.close()
+    fresh.close()
+
+
+def test_sqlite_cache_purges_expired_rows_while_running(tmp_path, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr("purl2repo.resolution.cache.time.time", lambda: now)
+    monkeypatch.setattr("purl2repo.resolution.cache.SQLITE_PRUNE_INTERVAL", 2)
+    cache = ResponseCache(str(tmp_path), backend="sqlite", max_age_seconds=3600)
+    cache.set("old", "x")
+    now += 7200
+    cache.set("new", "y")
+    cache.set("newer", "z")
+    store = cache._store
+    assert isinstance(store, SqliteStore)
+
+    assert store.load("old") is None
+    assert store.load("newer") == (now, "z")
+    cache.close()
+
+
+def test_sqlite_cache_degrades_on_a_corrupt_database(tmp_path):
+    (tmp_path / "purl2repo-cache.sqlite3").write_bytes(b"not a database" * 100)
+
+    cache = ResponseCache(str(tmp_path), backend="sqlite", max_age_seconds=60, max_bytes=10)
+    cache.set("key", "value")
+    store = cache._store
+    assert isinstance(store, SqliteStore)
+
+    assert store.load("key") is None
+    assert store.purge(60) == 0
+    assert store.enforce_size_limit() == 0
+    cache.close()
+
+
+def test_sqlite_cache_is_shared_between_threads(tmp_path):
+    cache = ResponseCache(str(tmp_path), backend="sqlite")
+
+    def write_then_read(index: int) -> object:
+        cache.set(f"key-{index}", {"writer": index})
+        cache._memory.clear()
+        return cache.get(f"key-{index}", 3600)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(write_then_read, range(32)))
+
+    assert results == [{"writer": index} for index in range(32)]
+    cache.close()
+
+
+def test_sqlite_cache_closes_connections_of_finished_threads(tmp_path):
+    cache = ResponseCache(str(tmp_path), backend="sqlite")
+    cache.set("key", {"value": 1})
+
+    for _ in range(10):
+        worker = threading.Thread(target=cache._store.load, args=("key",))
+        worker.start()
+        worker.join()
+
+    # The constructing thread plus the most recent worker, whose exit is noticed lazily.
+    assert len(cache._store._connections) == 2
+    cache.close()
+
+
+def test_cache_backend_options_are_validated(tmp_path):
+    with pytest.raises(ValueError, match="Unknown cache backend"):
+        ResponseCache(str(tmp_path), backend="redis")
+    with pytest.raises(ValueError, match="sqlite"):
+        ResponseCache(str(tmp_path), max_bytes=1024)
+
+    cache = ResponseCache.from_settings(
+        ResolverSettings(cache_dir=str(tmp_path), cache_backend="sqlite")
+    )
+    cache.set("key", 1)
+    assert (tmp_path / "purl2repo-cache.sqlite3").exists()
+    cache.close()
+
+
+def test_json_cache_purges_old_files(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.set("key", {"value": 1})
+    path = next(tmp_path.iterdir())
+    os.utime(path, (0, 0))
+
+    assert cache.purge(3600) == 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_memory_cache_evicts_least_recently_used_entries():
+    cache = ResponseCache(memory_max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a", 3600) == "1"
+    cache.set("c", "3")
+
+    assert cache.get("b", 3600) is None
+    assert cache.get("a", 3600) == "1"
+    assert cache.get("c", 3600) == "3"
+    assert cache.stats() == CacheStats(
+        hits=3, misses=1, evictions=1, entries=2, approximate_bytes=None
+    )
+
+
+def test_memory_cache_byte_limit_and_disk_promotion(tmp_path):
+    cache = ResponseCache(str(tmp_path), memory_max_bytes=10)
+    cache.set("small", "12345")
+    cache.set("large", "x" * 20)
+    cache.set("other", "abcdef")
+
+    stats = cache.stats()
+    assert list(cache._memory) == ["other"]
+    assert stats.approximate_bytes == 6
+    assert stats.evictions == 1
+    assert cache.get("large", 3600) == "x" * 20
+    assert "large" not in cache._memory
+
+    cache.set("dict", {"k": 1})
+    reopened = ResponseCache(str(tmp_path))
+    assert reopened.get("dict", 3600) == {"k": 1}
+    assert "dict" in reopened._memory
+
+
+def test_memory_cache_only_encodes_structured_values_under_a_byte_cap(monkeypatch):
+    encoded = []
+    real_dumps = json.dumps
+    monkeypatch.setattr(
+        "purl2repo.resolution.cache.json.dumps",
+        lambda value: encoded.append(value) or real_dumps(value),
+    )
+
+    ResponseCache().set("uncapped", {"k": 1})
+    assert encoded == []
+
+    capped = ResponseCache(memory_max_bytes=100)
+    capped.set("capped", {"k": 1})
+    assert encoded == [{"k": 1}]
+    assert capped.stats().approximate_bytes == len('{"k": 1}')
+    assert ResponseCache().stats().approximate_bytes is None
+
+
+def test_memory_cache_drops_entries_on_expired_reads(tmp_path):
+    memory = ResponseCache()
+    memory.set("summary", {"k": 1})
+    memory.set("response", {"k": 2})
+    assert memory.get("summary", -1) is None
+    assert memory.get("response", -1, keep_expired=True) is None
+    assert list(memory._memory) == ["response"]
+
+    tiered = ResponseCache(str(tmp_path))
+    tiered.set("response", {"k": 2})
+    assert tiered.get("response", -1, keep_expired=True) is None
+    assert not tiered._memory
+    assert tiered.get_entry("response")[1] == {"k": 2}
+
+
+def test_resolver_exposes_cache_stats(fake_http_factory):
+    fake_http_factory({"https://pypi.org/pypi/requests/json": {"info": {}}})
+    with Resolver(validate_repositories=False, use_deps_dev_fallback=False) as resolver:
+        resolver._engine.cache.set("key", "value")
+        resolver._engine.cache.get("key", 3600)
+        stats = resolver.cache_stats()
+    with Resolver(use_cache=False) as uncached:
+        assert uncached.cache_stats() is None
+
+    assert stats is not None
+    assert stats.hits == 1
+    assert stats.to_dict()["entries"] == 1
+
+
+def test_http_client_coalesces_concurrent_identical_requests():
+    requests = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        started.set()
+        release.wait(5)
+        if request.url.path == "/broken":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"ok": True})
+
+    client = HttpClient(ResolverSettings(use_cache=False), transport=httpx.MockTransport(handler))
+
+    def fetch(path: str) -> object:
+        try:
+            return client.get_json(f"https://example.com{path}")
+        except MetadataFetchError as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        ok = [executor.submit(fetch, "/doc") for _ in range(4)]
+        started.wait(5)
+        time.sleep(0.05)
+        release.set()
+        results = [future.result() for future in ok]
+        started.clear()
+        broken = list(executor.map(fetch, ["/broken", "/broken"]))
+
+    assert results == [{"ok": True}] * 4
+    assert requests.count(("GET", "/doc")) == 1
+    assert all(isinstance(error, MetadataFetchError) for error in broken)
+    client.close()
+
+
+def test_single_flight_releases_key_after_failure():
+    flights = SingleFlight()
+
+    def fail() -> int:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        flights.do("key", fail)
+    assert flights.do("key", lambda: 2) == 2
+
+
+def test_async_single_flight_shares_one_call_and_survives_waiter_cancellation():
+    calls = 0
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def run() -> list[str]:
+        flights = AsyncSingleFlight()
+        cancelled = asyncio.create_task(flights.do("key", fetch))
+        waiters = [asyncio.create_task(flights.do("key", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        results = await asyncio.gather(*waiters)
+        assert await flights.do("key", fetch) == "value"
+        return results
+
+    assert asyncio.run(run()) == ["value"] * 3
+    assert calls == 2
+
+
+def test_http_client_caches_permanent_failures(monkeypatch, tmp_path):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(404 if request.url.path == "/missing" else 503)
+
+    monkeypatch.setattr("purl2repo.http.client.time.sleep", lambda seconds: None)
+    transport = httpx.MockTransport(handler)
+    settings = ResolverSettings(negative_cache_ttl_seconds=600)
+    client = HttpClient(settings, ResponseCache(str(tmp_path)), transport=transport)
+
+    with pytest.raises(MetadataFetchError, match="404") as first:
+        client.get_json("https://example.com/missing")
+    fetched = len(requests)
+    with response_cache_writes_disabled(), pytest.raises(MetadataFetchError) as second:
+        client.get_text("https://example.com/missing")
+    with pytest.raises(MetadataFetchError, match="503"):
+        client.get_json("https://example.com/flaky")
+    flaky_attempts = len(requests) - fetched
+    with pytest.raises(MetadataFetchError, match="503"):
+        client.get_json("https://example.com/flaky")
+    reloaded = HttpClient(settings, ResponseCache(str(tmp_path)), transport=transport)
+    with pytest.raises(MetadataFetchError):
+        reloaded.get_json("https://example.com/missing")
+    disabled = HttpClient(ResolverSettings(), ResponseCache(), transport=transport)
+    for _ in range(2):
+        with pytest.raises(MetadataFetchError):
+            disabled.get_json("https://example.com/missing")
+
+    assert str(second.value) == str(first.value)
+    assert requests.count("/flaky") == 2 * flaky_attempts
+    assert requests.count("/missing") == 3 * fetched
+
+
+def test_json_field_extractor_keeps_only_requested_paths():
+    pytest.importorskip("ijson")
+    document = {
+        "name": "pkg",
+        "readme": "x" * 1000,
+        "versions": {
+            "1.0.0": {"repository": {"url": "git+https://github.com/o/r.git"}, "dist": {}},
+            "2.0.0": {"repository": "o/r"},
+        },
+        "items": [{"catalogEntry": {"projectUrl": "https://p", "tags": ["a"]}}, {"other": 1}],
+    }
+    extractor = JsonFieldExtractor(
+        [
+            ("name",),
+            ("versions", "1.0.0", "repository"),
+            ("items", ARRAY_ITEM, "catalogEntry", "projectUrl"),
+        ]
+    )
+    raw = json.dumps(document).encode()
+    for start in range(0, len(raw), 7):
+        extractor.feed(raw[start : start + 7])
+
+    assert extractor.close() == {
+        "name": "pkg",
+        "versions": {"1.0.0": {"repository": {"url": "git+https://github.com/o/r.git"}}},
+        "items": [{"catalogEntry": {"projectUrl": "https://p"}}, {}],
+    }
+
+
+def test_get_json_fields_streams_and_caches_selected_fields():
+    pytest.importorskip("ijson")
+    requests = []
+    body = json.dumps({"name": "pkg", "homepage": "https://h", "readme": "x" * 10_000})
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path == "/broken":
+            return httpx.Response(200, content=b'{"name": ')
+        return httpx.Response(200, content=body.encode())
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        return handler(request)
+
+    settings = ResolverSettings(stream_json=True)
+    paths = (("name",), ("homepage",))
+    client = HttpClient(settings, ResponseCache(), transport=httpx.MockTransport(handler))
+    async_client = AsyncHttpClient(settings, transport=httpx.MockTransport(async_handler))
+
+    async def fetch_async() -> dict[str, object]:
+        try:
+            return await async_client.get_json_fields("https://example.com/doc", paths)
+        finally:
+            await async_client.aclose()
+
+    expected = {"name": "pkg", "homepage": "https://h"}
+    assert client.get_json_fields("https://example.com/doc", paths) == expected
+    assert client.get_json_fields("https://example.com/doc", paths) == expected
+    with pytest.raises(MetadataFetchError, match="Invalid JSON"):
+        client.get_json_fields("https://example.com/broken", paths)
+    assert asyncio.run(fetch_async()) == expected
+    assert requests == ["/doc", "/broken", "/doc"]
+
+
+def test_get_json_fields_falls_back_to_full_document(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"name": "pkg", "readme": "text"})
+
+    monkeypatch.setattr("purl2repo.http.client.streaming_available", lambda: False)
+    client = HttpClient(ResolverSettings(stream_json=True), transport=httpx.MockTransport(handler))
+
+    assert client.get_json_fields("https://example.com/doc", (("name",),)) == {
+        "name": "pkg",
+        "readme": "text",
+    }
@@ -1,6 +1,7 @@
 from dataclasses import asdict
 
-from purl2repo.models import ResolverSettings
+from purl2repo import resolve
+from purl2repo.models import ResolutionResult, ResolverSettings
 from purl2repo.resolution.canonicalize import classify_host, normalize_repo_url, url_host
 from purl2repo.resolution.evidence import no_release_warning, weak_candidate_warning
 from purl2repo.settings import ResolverSettings as ReexportedSettings
@@ -45,3 +46,9 @@ def test_misc_url_branches_and_evidence():
     assert is_repo_like_url("https://example.com/org/repo.git")
     assert no_release_warning().startswith("Repository resolved")
     assert weak_candidate_warning().startswith("Only weak")
+
+
+def test_resolution_result_round_trips_through_dict():
+    result = resolve("pkg:github/psf/requests@v2.31.0", no_network=True)
+
+    assert ResolutionResult.from_dict(result.to_dict()) == result
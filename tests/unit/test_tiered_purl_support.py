@@ -1,13 +1,23 @@
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+import httpx
+import pytest
+from tests.conftest import FakeHttpClient
 from typer.testing import CliRunner
 
 from purl2repo import Resolver, resolve
 from purl2repo.cli import app
+from purl2repo.ecosystems.go_imports import build_go_import_rules
 from purl2repo.ecosystems.golang import GoResolver
 from purl2repo.ecosystems.nuget import NuGetResolver
 from purl2repo.errors import MetadataFetchError, NoRepositoryFoundError
+from purl2repo.http.client import HttpClient
+from purl2repo.models import ResolverSettings
 from purl2repo.purl.parse import parse_purl
+from purl2repo.resolution.cache import ResponseCache
 
 runner = CliRunner()
 
@@ -434,6 +444,262 @@ def test_golang_vanity_import_metadata_prefers_source_repo(fake_http_factory):
     assert result.repository_candidates[0].source == "go_import_meta"
 
 
+def test_golang_import_rules_skip_go_get_lookups(fake_http_factory):
+    rules = {"go.internal.example/libs": "https://git.example.com/libs/{0}"}
+    fake = fake_http_factory(
+        {
+            "https://proxy.golang.org/k8s.io/client-go/@latest": {"Version": "v0.28.3"},
+            "https://proxy.golang.org/go.internal.example/libs/auth/@latest": {"Version": "v1"},
+            "https://proxy.golang.org/vanity.example.com/tool/@latest": {"Version": "v1"},
+            "https://proxy.golang.org/vanity.example.com/tool/v2/@latest": {"Version": "v2"},
+        },
+        {
+            "https://vanity.example.com/tool?go-get=1": (
+                '<meta name="go-import" content="vanity.example.com/tool git '
+                'https://github.com/example/tool">'
+            )
+        },
+    )
+
+    kubernetes = resolve("pkg:golang/k8s.io/client-go")
+    internal = GoResolver(go_import_rules=rules).fetch_metadata(
+        parse_purl("pkg:golang/go.internal.example/libs/auth"), fake
+    )
+    with Resolver(go_import_rules=rules) as resolver:
+        internal_result = resolver.resolve_repository("pkg:golang/go.internal.example/libs/auth")
+    # Rules belong to the resolver they were passed to; other resolvers need a go-get lookup.
+    with pytest.raises(AssertionError, match="go-get"):
+        GoResolver().fetch_metadata(parse_purl("pkg:golang/go.internal.example/libs/auth"), fake)
+    first = resolve("pkg:golang/vanity.example.com/tool")
+    learned = resolve("pkg:golang/vanity.example.com/tool/v2")
+
+    assert kubernetes.repository_url == "https://github.com/kubernetes/client-go"
+    assert internal["go_import_repo"] == "https://git.example.com/libs/auth"
+    assert internal_result.repository_url == "https://git.example.com/libs/auth"
+    assert first.repository_url == learned.repository_url == "https://github.com/example/tool"
+    builtins = build_go_import_rules()
+    assert builtins.lookup("gopkg.in/yaml.v3") == (
+        "gopkg.in",
+        "https://github.com/go-yaml/yaml",
+    )
+    assert builtins.lookup("gopkg.in/DATA-DOG/go-sqlmock.v1") == (
+        "gopkg.in",
+        "https://github.com/DATA-DOG/go-sqlmock",
+    )
+    assert builtins.lookup("golang.org/x") is None
+
+
+def test_golang_learned_import_prefixes_live_in_the_response_cache():
+    lookups = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "proxy.golang.org":
+            return httpx.Response(200, json={"Version": "v1.0.0"})
+        lookups.append(request.url.path)
+        return httpx.Response(
+            200,
+            text='<meta name="go-import" content="learn.example/kit git https://github.com/x/kit">',
+        )
+
+    def resolve_pair(client):
+        return [
+            GoResolver().fetch_metadata(parse_purl(f"pkg:golang/{path}@v1.0.0"), client)
+            for path in ("learn.example/kit/log", "learn.example/kit/http")
+        ]
+
+    transport = httpx.MockTransport(handler)
+    cached = HttpClient(ResolverSettings(), ResponseCache(), transport=transport)
+    uncached = HttpClient(ResolverSettings(use_cache=False), transport=transport)
+
+    assert {item["go_import_repo"] for item in resolve_pair(cached)} == {"https://github.com/x/kit"}
+    assert lookups == ["/kit/log"]
+    assert cached.cache.get("go-import:learn.example/kit", 3600) == {
+        "repository": "https://github.com/x/kit"
+    }
+    resolve_pair(uncached)
+    assert lookups == ["/kit/log", "/kit/log", "/kit/http"]
+
+
+def test_golang_go_get_runs_alongside_proxy_with_deadline():
+    go_get_started = threading.Event()
+    release = threading.Event()
+    lookups = []
+
+    class SlowVanityClient(FakeHttpClient):
+        def get_json(self, url, *, ttl_seconds=3600):
+            assert go_get_started.wait(1)
+            return {"Version": "v1"}
+
+        def get_text(self, url, *, ttl_seconds=3600):
+            lookups.append(url)
+            go_get_started.set()
+            release.wait(5)
+            return '<meta name="go-import" content="slow.example.net/a git https://github.com/x/a">'
+
+    adapter = GoResolver.from_settings(ResolverSettings(go_import_timeout_seconds=0.05))
+    client = SlowVanityClient()
+    started = time.monotonic()
+    first = adapter.fetch_metadata(parse_purl("pkg:golang/slow.example.net/a"), client)
+    second = adapter.fetch_metadata(parse_purl("pkg:golang/slow.example.net/b"), client)
+    elapsed = time.monotonic() - started
+    release.set()
+    adapter.close()
+
+    assert first["proxy_info"] == second["proxy_info"] == {"Version": "v1"}
+    assert "go_import_repo" not in first
+    assert "go_import_repo" not in second
+    assert "did not finish within 0.05s" in first["_purl2repo_metadata_warning"]
+    assert "slow.example.net recently missed" in second["_purl2repo_metadata_warning"]
+    assert elapsed < 1
+    assert lookups == ["https://slow.example.net/a?go-get=1"]
+    assert list(adapter._slow_hosts) == ["slow.example.net"]
+    assert not GoResolver()._slow_hosts
+
+
+def test_golang_late_go_get_answers_still_learn_and_slow_hosts_get_no_new_lookups():
+    release = threading.Event()
+    lookups = []
+
+    class SlowVanityClient(FakeHttpClient):
+        def get_json(self, url, *, ttl_seconds=3600):
+            return {"Version": "v1"}
+
+        def get_text(self, url, *, ttl_seconds=3600):
+            lookups.append(url)
+            release.wait(5)
+            return '<meta name="go-import" content="late.example.net/a git https://github.com/x/a">'
+
+    adapter = GoResolver(go_import_timeout_seconds=0.01)
+    client = SlowVanityClient()
+    adapter.fetch_metadata(parse_purl("pkg:golang/late.example.net/a/v2"), client)
+    marked_at = adapter._slow_hosts["late.example.net"]
+    adapter.fetch_metadata(parse_purl("pkg:golang/late.example.net/a/v3"), client)
+    release.set()
+    deadline = time.monotonic() + 5
+    while "go-import:late.example.net/a" not in client.summaries and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert len(lookups) == 1
+    assert adapter._slow_hosts["late.example.net"] == marked_at
+    assert client.summaries["go-import:late.example.net/a"] == {
+        "repository": "https://github.com/x/a"
+    }
+    metadata = adapter.fetch_metadata(parse_purl("pkg:golang/late.example.net/a/v4"), client)
+    assert metadata["go_import_repo"] == "https://github.com/x/a"
+    assert "_purl2repo_metadata_warning" not in metadata
+    adapter.close()
+
+
+def test_golang_go_get_deadline_starts_when_the_request_is_sent():
+    class VanityClient(FakeHttpClient):
+        def get_json(self, url, *, ttl_seconds=3600):
+            return {"Version": "v1"}
+
+        def get_text(self, url, *, ttl_seconds=3600):
+            return (
+                '<meta name="go-import" content="queued.example.net/a git https://github.com/x/a">'
+            )
+
+    adapter = GoResolver(go_import_timeout_seconds=0.2)
+    adapter._executor = ThreadPoolExecutor(max_workers=1)
+    adapter._executor.submit(time.sleep, 0.1)
+    metadata = adapter.fetch_metadata(parse_purl("pkg:golang/queued.example.net/a"), VanityClient())
+    adapter.close()
+
+    assert metadata["go_import_repo"] == "https://github.com/x/a"
+    assert not adapter._slow_hosts
+
+
+def test_golang_go_get_queue_wait_is_bounded_by_the_deadline():
+    class VanityClient(FakeHttpClient):
+        def get_json(self, url, *, ttl_seconds=3600):
+            return {"Version": "v1"}
+
+    adapter = GoResolver(go_import_timeout_seconds=0.05)
+    adapter._executor = ThreadPoolExecutor(max_workers=1)
+    adapter._executor.submit(time.sleep, 0.5)
+    started = time.monotonic()
+    metadata = adapter.fetch_metadata(parse_purl("pkg:golang/queued.example.net/a"), VanityClient())
+    elapsed = time.monotonic() - started
+    adapter.close()
+
+    assert elapsed < 0.3
+    assert "did not start within 0.05s" in metadata["_purl2repo_metadata_warning"]
+    assert "go_import_repo" not in metadata
+    assert not adapter._slow_hosts
+
+
+def test_golang_go_get_timeouts_are_neither_memoized_nor_distilled(monkeypatch):
+    release = threading.Event()
+
+    class SlowVanityClient(FakeHttpClient):
+        def get_text(self, url, *, ttl_seconds=3600):
+            release.wait(5)
+            return '<meta name="go-import" content="slow.example.net/a git https://github.com/x/a">'
+
+    fake = SlowVanityClient(
+        {"https://proxy.golang.org/slow.example.net/a/@latest": {"Version": "v1.0.0"}}
+    )
+    monkeypatch.setattr("purl2repo.resolution.engine.HttpClient", lambda settings, cache: fake)
+    resolver = Resolver(
+        go_import_timeout_seconds=0.01,
+        result_cache_ttl_seconds=3600,
+        cache_distilled_metadata=True,
+    )
+    resolver.resolve_repository("pkg:golang/slow.example.net/a")
+    adapter = resolver._engine._adapters["golang"]
+    assert adapter._slow_hosts
+    assert resolver.cache_stats().entries == 0
+    release.set()
+    resolver.close()
+
+    assert adapter._executor is None
+
+
+def test_golang_reads_local_module_cache_and_file_proxy(tmp_path):
+    modcache = tmp_path / "gomodcache"
+    toml_dir = modcache / "cache" / "download" / "github.com" / "!burnt!sushi" / "toml" / "@v"
+    toml_dir.mkdir(parents=True)
+    (toml_dir / "v1.3.2.info").write_text('{"Version": "v1.3.2"}')
+    (toml_dir / "v1.4.0-rc.1.info").write_text('{"Version": "v1.4.0-rc.1"}')
+    (toml_dir / "list").write_text("v1.3.2\nv1.4.0-rc.1\n")
+    mirror = tmp_path / "mirror"
+    (mirror / "github.com" / "pkg" / "errors").mkdir(parents=True)
+    (mirror / "github.com" / "pkg" / "errors" / "@latest").write_text('{"Version": "v0.9.1"}')
+    adapter = GoResolver.from_settings(
+        ResolverSettings(go_proxy_roots=(str(modcache), mirror.as_uri()))
+    )
+    client = FakeHttpClient()
+
+    pinned = adapter.fetch_metadata(
+        parse_purl("pkg:golang/github.com/BurntSushi/toml@v1.3.2"), client
+    )
+    latest = adapter.fetch_metadata(parse_purl("pkg:golang/github.com/BurntSushi/toml"), client)
+    mirrored = adapter.fetch_metadata(parse_purl("pkg:golang/github.com/pkg/errors"), client)
+
+    assert pinned["proxy_info"] == latest["proxy_info"] == {"Version": "v1.3.2"}
+    assert mirrored["proxy_info"] == {"Version": "v0.9.1"}
+    with pytest.raises(AssertionError, match=r"proxy\.golang\.org"):
+        adapter.fetch_metadata(parse_purl("pkg:golang/github.com/pkg/errors@v0.8.0"), client)
+
+
+def test_golang_local_proxy_falls_back_to_info_files_and_resolves_roots_once(tmp_path):
+    module_dir = tmp_path / "cache" / "download" / "github.com" / "acme" / "pseudo" / "@v"
+    module_dir.mkdir(parents=True)
+    (module_dir / "list").write_text("")
+    pseudo = "v0.0.0-20240101000000-abcdefabcdef"
+    (module_dir / f"{pseudo}.info").write_text(json.dumps({"Version": pseudo}))
+    settings = ResolverSettings(go_proxy_roots=(str(tmp_path),))
+    adapter = GoResolver.from_settings(settings)
+
+    metadata = adapter.fetch_metadata(
+        parse_purl("pkg:golang/github.com/acme/pseudo"), FakeHttpClient()
+    )
+
+    assert metadata["proxy_info"] == {"Version": pseudo}
+    assert GoResolver.from_settings(settings).go_proxy_roots is adapter.go_proxy_roots
+
+
 def test_golang_latest_and_module_path_helpers(fake_http_factory):
     fake_http_factory(
         {